@@ -4,72 +4,40 @@ app.py
 """
 import streamlit as st
 import pandas as pd
+import time
 from datetime import datetime
 import sys
 import os
-from pathlib import Path
 
 # ==========================================
-# 핵심 수정: 폴더 경로 강제 연결
+# 모듈 경로: 프로젝트 루트 기준 src / utils 패키지
 # ==========================================
-# 현재 app.py가 있는 위치를 알아내서 src와 utils 폴더를 파이썬에게 알려줍니다.
+# 화면을 먼저 띄우기 위해 여기서는 데이터 로더만 불러오고,
+# ortools(스케줄러)·plotly(시각화)는 해당 메뉴에서 처음 사용할 때 불러옵니다.
 current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.append(os.path.join(current_dir, 'src'))
-sys.path.append(os.path.join(current_dir, 'utils'))
-
-# 이제 파이썬이 폴더 안을 볼 수 있으므로, 파일명만 불러도 됩니다.
-try:
-    # 1. 폴더 안의 파일들을 직접 찾는 시도
-    from data_loader import DataLoader
-    from scheduler import NurseScheduler
-    from validator import ScheduleValidator
-    from visualizer import ScheduleVisualizer
-except ImportError:
-    try:
-        # 2. 혹시 몰라 '폴더명.파일명'으로 찾는 시도 (이중 안전장치)
-        from utils.data_loader import DataLoader
-        from src.scheduler import NurseScheduler
-        from src.validator import ScheduleValidator
-        from src.visualizer import ScheduleVisualizer
-    except ImportError as e:
-        st.error(f"❌ 모듈 로딩 실패: {e}")
-        st.error("폴더 구조를 확인해주세요. src 폴더 안에 scheduler.py가, utils 폴더 안에 data_loader.py가 있어야 합니다.")
-        st.stop()
-
-# ==========================================
-# 아래부터는 기존 코드 그대로...
-# ==========================================
-
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+sys.path.insert(0, current_dir)
 
 try:
     from utils.data_loader import DataLoader
-    from src.scheduler import NurseScheduler
-    from src.validator import ScheduleValidator
-    from src.visualizer import ScheduleVisualizer
-except ImportError:
-    try:
-        from src.utils.data_loader import DataLoader
-        from src.scheduler import NurseScheduler
-        from src.validator import ScheduleValidator
-        from src.visualizer import ScheduleVisualizer
-    except ImportError:
-        st.error("모듈 로딩 실패: src 폴더를 확인하세요.")
-        st.stop()
+except ImportError as e:
+    st.error(f"❌ 모듈 로딩 실패: {e}")
+    st.error("폴더 구조를 확인해주세요. src 폴더 안에 scheduler.py가, utils 폴더 안에 data_loader.py가 있어야 합니다.")
+    st.stop()
 
 st.set_page_config(page_title="AI Nurse Scheduler", layout="wide", page_icon="🏥")
 
 with st.sidebar:
     st.image("https://upload.wikimedia.org/wikipedia/en/thumb/f/f7/Yonsei_University_logo.svg/1200px-Yonsei_University_logo.svg.png", width=120)
     st.title("🏥 AI 스케줄러")
-    menu = st.radio("메뉴", ["1. 데이터 업로드", "2. 스케줄 생성", "3. 결과 대시보드"])
+    menu = st.radio("메뉴", ["1. 데이터 업로드", "2. 스케줄 생성", "3. 결과 대시보드", "4. 작업 기록"])
 
 if menu == "1. 데이터 업로드":
     st.title("📤 데이터 업로드")
     file = st.file_uploader("엑셀 파일 업로드", type=['xlsx'])
     if file:
-        sheets = DataLoader.load_excel(file)
+        # 스케줄러가 쓰는 시트·컬럼만 읽고, 같은 파일은 파싱 결과 캐시에서 바로 불러옴
+        sheets = DataLoader.load_excel(file, selective=True,
+                                       cache_dir=os.path.join(current_dir, '.schedule_cache', 'sheets'))
         if 'Nurse' in sheets or 'nurses' in sheets:
             st.session_state.sheets = sheets
             st.success("데이터 로드 완료")
@@ -78,6 +46,14 @@ if menu == "1. 데이터 업로드":
             st.error("Nurse 시트가 없습니다.")
 
 elif menu == "2. 스케줄 생성":
+    from src.scheduler import NurseScheduler
+    from src.cache import SolveCache
+    from src.monitor import BackgroundSolve
+    from src.result import CompactResult
+    from src.client import RemoteSolve, ServiceClient
+    from src.store import JobStore
+    from src.precheck import CapacityPrecheck
+
     st.title("⚙️ 스케줄 생성")
     if not st.session_state.get('sheets'):
         st.warning("데이터를 먼저 업로드하세요.")
@@ -89,53 +65,201 @@ elif menu == "2. 스케줄 생성":
         s_date = st.date_input("시작일", datetime.strptime(s_str, "%Y-%m-%d"))
     with c2:
         e_date = st.date_input("종료일", datetime.strptime(e_str, "%Y-%m-%d"))
-        
+
+    # 사전 점검: 신청·인원만으로 일별 가용 인원과 나이트·근무일수 한도를 바로 계산 (솔버 실행 전)
+    check = CapacityPrecheck(NurseScheduler(
+        st.session_state.sheets, s_date.strftime("%Y-%m-%d"), e_date.strftime("%Y-%m-%d"))).run()
+    if check['blocking']:
+        st.error("🚨 사전 점검: 이 입력으로는 기준 인원 부족이 반드시 발생합니다.")
+    elif check['issues']:
+        st.warning("⚠️ 사전 점검: 나이트 상한 초과 또는 근무일수 편차가 불가피합니다.")
+    if check['issues']:
+        with st.expander(f"사전 점검 상세 ({len(check['issues'])}건)"):
+            st.dataframe(pd.DataFrame(check['issues'])[['level', 'check', 'message']], hide_index=True)
+    strict = st.checkbox("⛔ 인력 부족이 확실하면 최적화를 시작하지 않음", value=False)
+
     max_time = st.slider("최적화 시간 (초)", 60, 600, 250)
+    fairness = st.selectbox(
+        "⚖️ 공정성 계산 방식", NurseScheduler.FAIRNESS_MODES,
+        help="quadratic: 기존 편차 제곱 / abs: 절댓값 / minmax: 최대-최소 격차 / pwl: 구간선형 제곱 근사 (대형 병동은 선형 모드가 빠름)"
+    )
+    objective = st.selectbox(
+        "🎯 목적식 방식", NurseScheduler.OBJECTIVE_MODES,
+        help="weighted: 인력 부족·공정성 가중합을 한 번에 / lexicographic: 인력 부족을 먼저 최소화(시간의 40%)한 뒤 그 수준을 유지하며 공정성 최적화"
+    )
+
+    symmetry = st.checkbox(
+        "🔀 대칭 제거", value=False,
+        help="같은 직급이고 신청이 없는 간호사끼리 근무를 맞바꾼 동일한 해를 탐색에서 제외 (대형 병동에서 빠를 수 있음)"
+    )
+
+    with st.expander("⏱ 조기 종료 조건"):
+        stop_rules = {}
+        g = st.number_input("목표 갭 (%)", 0.0, 100.0, 0.0, help="0이면 사용 안 함")
+        if g > 0:
+            stop_rules['gap'] = g / 100
+        p = st.number_input("개선 정체 시 종료 (초)", 0, 600, 0, help="이 시간 동안 더 좋은 해가 없으면 종료, 0이면 사용 안 함")
+        if p > 0:
+            stop_rules['plateau_seconds'] = p
+        if st.checkbox("인력 부족 0 + 공정성 기준 충족 시 종료"):
+            stop_rules['fairness_within'] = st.number_input("허용 편차 (근무일수·나이트 최대-최소)", 0, 31, 3)
+
+    # 웜스타트: 직전 결과 또는 지난달 근무표(Date/Name/Shift CSV)를 힌트로 사용
+    hint = None
+    ws_opts = ["사용 안 함", "근무표 업로드"]
+    if st.session_state.get('result'):
+        ws_opts.insert(1, "직전 결과")
+    ws_mode = st.radio("🔁 웜스타트", ws_opts, horizontal=True)
+    if ws_mode == "직전 결과":
+        hint = st.session_state.result
+    elif ws_mode == "근무표 업로드":
+        hint_file = st.file_uploader("이전 근무표 (CSV/엑셀)", type=['csv', 'xlsx'])
+        if hint_file:
+            hint = pd.read_csv(hint_file) if hint_file.name.endswith('.csv') else pd.read_excel(hint_file)
     
-    if st.button("🚀 AI 스케줄링 시작", type="primary"):
-        with st.spinner("규정 준수 여부 및 인력 배치를 계산 중입니다..."):
-            scheduler = NurseScheduler(
-                st.session_state.sheets, 
-                s_date.strftime("%Y-%m-%d"), 
-                e_date.strftime("%Y-%m-%d")
-            )
-            result = scheduler.optimize(max_time_seconds=max_time)
-            st.session_state.result = result
-            st.success("✅ 스케줄 생성 완료!")
+    # 최적화·긴급 재조정은 스케줄링 서비스(src/service.py, 기본 http://127.0.0.1:8765) 대기열에서 실행
+    # 이 화면에서 직접 계산(CP-SAT를 웹 프로세스에서 실행)은 NURSE_SCHEDULER_LOCAL=1 또는 아래 선택 시에만
+    client, service_down = None, False
+    if os.environ.get('NURSE_SCHEDULER_LOCAL') != '1':
+        client = ServiceClient(os.environ.get('NURSE_SCHEDULER_URL', 'http://127.0.0.1:8765'))
+        if not client.health():
+            st.warning(f"스케줄링 서비스({client.base_url})에 연결할 수 없습니다. "
+                       "`python -m src.service`로 서비스를 실행하세요.")
+            client = None
+            service_down = not st.checkbox("서비스 없이 이 화면에서 직접 계산")
+
+    # 화면은 해가 갱신될 때마다 진행 상황만 표시 (서비스 작업 또는 백그라운드 스레드)
+    job = st.session_state.get('solve_job')
+    if st.button("🚀 AI 스케줄링 시작", type="primary", disabled=bool(job and job.running) or service_down):
+        period = (s_date.strftime("%Y-%m-%d"), e_date.strftime("%Y-%m-%d"))
+        if client:
+            job = RemoteSolve(client, st.session_state.sheets, *period, max_time_seconds=max_time,
+                              hint=hint, fairness=fairness, objective=objective, stop_rules=stop_rules or None,
+                              symmetry_breaking=symmetry, precheck='strict' if strict else 'warn').start()
+        else:
+            scheduler = NurseScheduler(st.session_state.sheets, *period)
+            cache = SolveCache(os.path.join(current_dir, '.schedule_cache'))
+            # 작업 기록: 새로고침·서버 재시작 후에도 결과를 다시 열 수 있고, 중단된 작업은 이어서 풀이
+            store = JobStore(os.path.join(current_dir, '.schedule_cache', 'jobs.sqlite3'))
+            # benchmarks/tune_params.py로 만든 솔버 프로파일이 있으면 규모별 설정 적용
+            profile_path = os.path.join(current_dir, 'solver_profile.json')
+            job = BackgroundSolve(store.optimize, scheduler, cache=cache, max_time_seconds=max_time,
+                                  hint=hint, fairness=fairness, objective=objective, stop_rules=stop_rules or None,
+                                  symmetry_breaking=symmetry, precheck='strict' if strict else 'warn',
+                                  param_profile=profile_path if os.path.exists(profile_path) else None,
+                                  log_progress=False).start()
+        st.session_state.solve_job = job
+
+    if job is not None:
+        if job.running and st.button("⏹ 중단하고 현재 최선안 사용"):
+            job.cancel()
+
+        budget = job.kwargs['max_time_seconds']
+        panel = st.empty()
+        while True:
+            snap = job.snapshot()
+            with panel.container():
+                if snap['state'] == 'queued':
+                    st.info(f"⏳ 스케줄링 서비스 대기열 {snap.get('position', 0)}번째입니다.")
+                st.progress(min(1.0, snap['elapsed'] / budget),
+                            text=f"규정 준수 여부 및 인력 배치를 계산 중입니다... ({snap['elapsed']:.0f}초 / {budget}초)")
+                best = snap['best']
+                m1, m2, m3 = st.columns(3)
+                m1.metric("현재 최선 목적값", f"{best['objective']:,.0f}" if best else "-")
+                m2.metric("인력 부족 합계", f"{best['shortage']}명분" if best else "-")
+                m3.metric("찾은 해", f"{len(snap['incumbents'])}개")
+                if len(snap['incumbents']) > 1:
+                    st.line_chart(pd.DataFrame(snap['incumbents']).set_index('elapsed')[['objective']])
+            if snap['state'] not in ('queued', 'running', 'cancelling'):
+                break
+            time.sleep(1)
+
+        del st.session_state['solve_job']
+        if snap['error']:
+            st.error(f"❌ {snap['error']}")
+        elif snap['result'] is None:
+            st.warning("대기 중인 작업을 취소했습니다.")
+        else:
+            result = snap['result']
+            # 세션에는 압축 형식으로 보관 (dict 형식은 필요한 화면에서만 생성)
+            st.session_state.result = CompactResult.from_dict(result)
+            stop_msg = {'gap': "목표 갭 도달", 'plateau': "개선 정체", 'coverage_fairness': "인력·공정성 기준 충족"}
+            cache_info = result.get('cache', {})
+            if result['solve_stats'].get('cancelled'):
+                st.success("✅ 중단 시점까지의 최선 근무표를 저장했습니다.")
+            elif cache_info.get('hit') and not cache_info.get('resumed'):
+                st.success("✅ 스케줄 생성 완료! (동일 입력의 저장된 결과를 불러왔습니다)")
+            elif cache_info.get('resumed') or result.get('job', {}).get('resumed_from'):
+                st.success("✅ 스케줄 생성 완료! (저장된 해에서 이어서 최적화했습니다)")
+            elif result.get('stop_reason') in stop_msg:
+                st.success(f"✅ 스케줄 생성 완료! (조기 종료: {stop_msg[result['stop_reason']]})")
+            else:
+                st.success("✅ 스케줄 생성 완료!")
+
+    # 긴급 변경: 게시된 근무표에서 변경일 주변만 재최적화
+    if st.session_state.get('result'):
+        with st.expander("🩹 긴급 변경 반영 (병가·당일 변경)"):
+            pub = st.session_state.result.to_dict()
+            names = [n['name'] for n in pub['nurses']]
+            r_name = st.selectbox("간호사", names)
+            r_dates = st.multiselect("근무 불가 날짜", [d['date'] for d in pub['dates']])
+            r_window = st.slider("재조정 범위 (±일)", 1, 7, 3)
+            if st.button("근무표 국소 재조정", disabled=service_down) and r_dates:
+                changes = [{'nurse': r_name, 'dates': r_dates}]
+                try:
+                    if client:
+                        with st.spinner("스케줄링 서비스에서 재조정 중입니다..."):
+                            snap = RemoteSolve(client, st.session_state.sheets, pub['start_date'], pub['end_date'],
+                                               max_time_seconds=10, repair={'published': pub, 'changes': changes,
+                                                                            'window': r_window}).start().wait()
+                        if snap['error']:
+                            error = Exception(snap['error'])
+                            error.conflicts = snap.get('conflicts')
+                            raise error
+                        repaired = snap['result']
+                    else:
+                        scheduler = NurseScheduler(st.session_state.sheets, pub['start_date'], pub['end_date'])
+                        repaired = scheduler.repair(pub, changes, window=r_window)
+                    st.session_state.result = CompactResult.from_dict(repaired)
+                    st.success(f"✅ {repaired['repair']['window'][0]} ~ {repaired['repair']['window'][1]} 재조정 완료 "
+                               f"(변경 {len(repaired['repair']['diff'])}칸)")
+                    if repaired['repair']['diff']:
+                        st.dataframe(pd.DataFrame(repaired['repair']['diff']))
+                except Exception as e:
+                    st.error(str(e))
+                    if getattr(e, 'conflicts', None):
+                        # 하드 제약 충돌: 최소 충돌 묶음을 표로 표시
+                        st.dataframe(pd.DataFrame(e.conflicts)[['rule', 'name', 'date', 'description']],
+                                     hide_index=True)
 
 elif menu == "3. 결과 대시보드":
+    from src.analytics import base_requirement
+    from src.validator import ScheduleValidator
+    from src.visualizer import ScheduleVisualizer
+    from utils.exporter import RosterExporter
+
     st.title("📊 결과 대시보드")
     if not st.session_state.get('result'):
         st.info("스케줄을 먼저 생성해주세요.")
         st.stop()
         
+    # 모든 지표·차트는 결과에 보관된 집계(ScheduleAnalytics) 한 번을 공유
     res = st.session_state.result
+    analytics = res.analytics
     validator = ScheduleValidator(res)
     val = validator.validate_all()
     viols = val['violations']
     
-    # 목표치 설정
-    total_nurses = res['total_nurses']
-    if total_nurses < 10: target = {'D': 2, 'E': 2, 'N': 1}
-    elif total_nurses < 15: target = {'D': 2, 'E': 2, 'N': 2}
-    else: target = {'D': 3, 'E': 3, 'N': 2}
-    
-    # 부족 인원 계산
-    shortage_list = []
-    total_short = 0
-    for d_idx, date_info in enumerate(res['dates']):
-        cov = date_info['coverage']
-        for shift in ['D', 'E', 'N']:
-            if cov[shift] < target[shift]:
-                missing = target[shift] - cov[shift]
-                shortage_list.append({
-                    "날짜": date_info['date'],
-                    "근무조": shift,
-                    "목표": target[shift],
-                    "실제": cov[shift],
-                    "부족": f"-{missing}명"
-                })
-                total_short += missing
+    # 부족 인원 계산 (목표치는 스케줄러와 같은 기준)
+    target = base_requirement(res['total_nurses'])
+    shortage_list = [{
+        "날짜": r['date'],
+        "근무조": r['shift'],
+        "목표": r['required'],
+        "실제": r['actual'],
+        "부족": f"-{r['missing']}명"
+    } for r in analytics.shortage_records(target)]
+    total_short = int(analytics.shortage(target).sum())
 
     st.subheader("✅ 핵심 지표")
     c1, c2, c3, c4 = st.columns(4)
@@ -159,12 +283,51 @@ elif menu == "3. 결과 대시보드":
     else:
         st.success("✅ 모든 근무조에 인원이 충분히 배치되었습니다.")
 
+    # 솔버 진단: 모델 구성 단계별 시간·변수·제약 수와 CP-SAT 탐색 통계 (느린 원인 분석용)
+    diag = res.get('diagnostics')
+    if diag and 'build' in diag:
+        from src.diagnostics import export_diagnostics
+        with st.expander("🔬 솔버 진단"):
+            search, response, timings = diag.get('search', {}), diag.get('response', {}), diag.get('timings', {})
+            d1, d2, d3, d4 = st.columns(4)
+            d1.metric("모델 구성", f"{timings.get('build', 0):.2f}초")
+            d2.metric("Presolve", f"{search['presolve_seconds']:.2f}초" if 'presolve_seconds' in search else "-")
+            d3.metric("첫 해", f"{search['first_incumbent']:.2f}초" if 'first_incumbent' in search else "-")
+            d4.metric("탐색 (벽시계)", f"{response.get('wall_time', 0):.1f}초")
+            phases = pd.DataFrame(diag['build']['phases']).rename(columns={
+                'phase': "단계", 'seconds': "시간(초)", 'variables': "변수", 'constraints': "제약"})
+            st.bar_chart(phases.set_index("단계")[["시간(초)"]])
+            st.dataframe(phases, hide_index=True)
+            st.dataframe(pd.DataFrame([{"항목": k, "값": str(v)} for k, v in response.items()]), hide_index=True)
+            if res.get('lexicographic'):
+                st.caption("계층 최적화 단계별 결과 (1단계 인력 부족·나이트 초과 → 2단계 공정성)")
+                st.dataframe(pd.DataFrame([
+                    {"단계": p['phase'], "상태": p['status'], "목적값": p.get('objective'),
+                     "하한": p.get('best_bound'), "시간(초)": p['seconds'], "조기 종료": p.get('stop_reason')}
+                    for p in res['lexicographic']['phases']]), hide_index=True)
+            st.download_button("진단 JSON 다운로드", export_diagnostics(res), "solve_diagnostics.json",
+                               "application/json")
+
     st.markdown("---")
 
     t1, t2, t3 = st.tabs(["📅 근무표", "⚖️ 공정성/부하", "💾 다운로드"])
     
     with t1:
-        st.plotly_chart(ScheduleVisualizer.create_calendar_view(res), use_container_width=True)
+        # 대형 근무표는 Level·기간 필터와 간호사 페이지 단위로 표시
+        level_opts = sorted(set(res.levels))
+        f1, f2, f3 = st.columns([2, 3, 1])
+        sel_levels = f1.multiselect("Level", level_opts, default=level_opts)
+        if len(res.dates) > 1:
+            date_range = f2.select_slider("기간", options=res.dates, value=(res.dates[0], res.dates[-1]))
+        else:
+            date_range = None
+        page_size = 50
+        shown = sum(lv in sel_levels for lv in res.levels)
+        pages = max(1, -(-shown // page_size))
+        page = f3.number_input("페이지", 1, pages, 1) - 1 if pages > 1 else 0
+        st.plotly_chart(ScheduleVisualizer.create_calendar_view(res, levels=sel_levels, date_range=date_range,
+                                                                page=page, page_size=page_size),
+                        use_container_width=True)
         st.plotly_chart(ScheduleVisualizer.create_coverage_chart(res), use_container_width=True)
         
     with t2:
@@ -173,10 +336,73 @@ elif menu == "3. 결과 대시보드":
         c2.plotly_chart(ScheduleVisualizer.create_fairness_chart(val), use_container_width=True)
         
     with t3:
-        rows = []
-        for n in res['nurses']:
-            for d, s in enumerate(n['schedule']):
-                rows.append({'Date': res['dates'][d]['date'], 'Name': n['name'], 'Shift': s})
-        csv = pd.DataFrame(rows).to_csv(index=False).encode('utf-8-sig')
+        # 압축 결과에서 바로 조각 단위로 기록 (간호사·일별 dict 목록을 만들지 않음)
+        fmt = st.radio("형식", ["CSV", "Parquet", "XLSX (가로형 근무표)"], horizontal=True)
+        if fmt == "CSV":
+            st.download_button("CSV 다운로드", RosterExporter.to_csv(res), "schedule.csv", "text/csv")
+        elif fmt == "Parquet":
+            try:
+                st.download_button("Parquet 다운로드", RosterExporter.to_parquet(res), "schedule.parquet",
+                                   "application/octet-stream")
+            except Exception as e:
+                st.error(str(e))
+        else:
+            st.download_button("XLSX 다운로드", RosterExporter.to_xlsx(res), "schedule.xlsx",
+                               "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+
+elif menu == "4. 작업 기록":
+    from src.store import JobStore
+
+    st.title("🗂 작업 기록")
+    store = JobStore(os.path.join(current_dir, '.schedule_cache', 'jobs.sqlite3'))
+    jobs = store.list()
+    if not jobs:
+        st.info("저장된 작업이 없습니다.")
+        st.stop()
 
-        st.download_button("CSV 다운로드", csv, "schedule.csv", "text/csv")
+    status_label = {'running': "실행 중", 'done': "완료", 'cancelled': "중단(최선안 저장)", 'error': "오류",
+                    'interrupted': "중단됨", 'resumed': "이어서 풀이함"}
+    st.dataframe(pd.DataFrame([{
+        "작업": j['id'], "생성": datetime.fromtimestamp(j['created_at']).strftime("%m-%d %H:%M"),
+        "기간": f"{j['start_date']} ~ {j['end_date']}", "상태": status_label.get(j['status'], j['status']),
+        "목적값": j['objective'], "인력 부족": j['shortage'], "찾은 해": j['solutions'],
+        "공정성": j['params'].get('fairness'), "목적식": j['params'].get('objective', 'weighted'),
+        "시간(초)": j['params'].get('max_time_seconds')
+    } for j in jobs]), hide_index=True)
+    if any(j['status'] == 'interrupted' for j in jobs):
+        st.info("중단된 작업은 같은 데이터·설정으로 '2. 스케줄 생성'을 다시 실행하면 마지막 해에서 이어서 풀이합니다.")
+
+    finished = {j['id']: j for j in jobs if j['has_result']}
+    if not finished:
+        st.stop()
+    label = lambda job_id: (f"{job_id} · {finished[job_id]['start_date']} ~ {finished[job_id]['end_date']}"
+                            f" · {status_label.get(finished[job_id]['status'])}")
+
+    st.subheader("📂 다시 열기")
+    pick = st.selectbox("작업", list(finished), format_func=label)
+    if st.button("결과 대시보드로 불러오기"):
+        st.session_state.result = store.load(pick)
+        st.success("불러왔습니다. '3. 결과 대시보드'에서 확인하세요.")
+
+    st.subheader("⚖️ 작업 비교")
+    picks = st.multiselect("비교할 작업", list(finished), default=list(finished)[:2], format_func=label)
+    if picks:
+        loaded = {job_id: store.load(job_id) for job_id in picks}
+        rows = []
+        for job_id, res in loaded.items():
+            fair = res.analytics.fairness()
+            rows.append({
+                "작업": job_id, "상태": res.get('status'), "목적값": finished[job_id]['objective'],
+                "인력 부족 합계": int(res.analytics.shortage().sum()),
+                "근무일수 편차": fair['work_days']['deviation'], "나이트 편차": fair['night_shifts']['deviation'],
+                "찾은 해": finished[job_id]['solutions']
+            })
+        st.dataframe(pd.DataFrame(rows), hide_index=True)
+        if len(picks) == 2:
+            a, b = loaded.values()
+            if a.dates == b.dates and a.matrix.shape == b.matrix.shape:
+                st.metric("근무가 다른 칸", f"{int((a.matrix != b.matrix).sum())}칸")
+        curves = [pd.DataFrame(store.incumbents(job_id)).assign(작업=job_id) for job_id in picks]
+        curves = [c for c in curves if 'elapsed' in c]
+        if curves:
+            st.line_chart(pd.concat(curves), x='elapsed', y='objective', color='작업')
@@ -0,0 +1,60 @@
+"""
+benchmarks/bench_build.py
+모델 구성 시간 벤치마크 (간호사 수 × 일수 규모별)
+
+사용법: python benchmarks/bench_build.py --nurses 25 50 100 150 --days 28 90 --repeat 3
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from src.scheduler import NurseScheduler
+from utils.ward_generator import WardGenerator
+
+
+def make_sheets(num_nurses, num_days, seed=0):
+    sheets = WardGenerator.generate(num_nurses, num_days, request_density=2 / num_days, seed=seed)
+    dates = sheets['Daily_Coverage']['Coverage_Date']
+    return sheets, dates.iloc[0], dates.iloc[-1]
+
+
+def bench(num_nurses, num_days, fairness, repeat):
+    sheets, start, end = make_sheets(num_nurses, num_days)
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        scheduler = NurseScheduler(sheets, start, end)
+        model, shifts, penalties = scheduler._build_model(fairness)
+        times.append(time.perf_counter() - t0)
+    proto = model.Proto()
+    return {
+        'nurses': num_nurses, 'days': num_days, 'cells': num_nurses * num_days,
+        'build_sec': round(min(times), 4),
+        'us_per_cell': round(min(times) / (num_nurses * num_days) * 1e6, 1),
+        'variables': len(proto.variables), 'constraints': len(proto.constraints),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델 구성 시간 벤치마크")
+    parser.add_argument('--nurses', nargs='+', type=int, default=[25, 50, 100, 150])
+    parser.add_argument('--days', nargs='+', type=int, default=[28, 90])
+    parser.add_argument('--fairness', default='quadratic', choices=NurseScheduler.FAIRNESS_MODES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--csv')
+    args = parser.parse_args()
+
+    rows = [bench(n, d, args.fairness, args.repeat) for d in args.days for n in args.nurses]
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    if args.csv:
+        df.to_csv(args.csv, index=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+benchmarks/bench_fairness.py
+공정성 페널티 형태별 시간 대비 품질(time-to-quality) 비교
+
+모든 모드의 해를 기존 quadratic 목적식 기준으로 재평가하여 비교
+사용법: python benchmarks/bench_fairness.py [엑셀경로] --time 60 --workers 8 --json out.json
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ortools.sat.python import cp_model
+
+from utils.data_loader import DataLoader
+from src.scheduler import NurseScheduler
+
+
+class QualityTracker(cp_model.CpSolverSolutionCallback):
+    """해가 갱신될 때마다 기존 quadratic 기준 품질을 기록"""
+
+    def __init__(self, scheduler, shifts):
+        super().__init__()
+        self.sch = scheduler
+        self.shifts = shifts
+        self.t0 = time.time()
+        self.trace = []  # (경과 초, 품질)
+
+    def on_solution_callback(self):
+        self.trace.append((time.time() - self.t0, evaluate(self.sch, self._matrix())))
+
+    def _matrix(self):
+        return [[next(s for s in range(4) if self.Value(self.shifts[(n, d, s)]))
+                 for d in range(self.sch.NUM_DAYS)] for n in range(self.sch.NUM_NURSES)]
+
+
+def evaluate(sch, matrix):
+    """기존 목적식: 부족×1000 + 나이트 초과×5000 + 나이트 편차²×20 + 근무일 편차²×10"""
+    D, N = sch.NUM_DAYS, sch.NUM_NURSES
+    base_req = NurseScheduler.base_requirement(N)
+    short = 0
+    for d in range(D):
+        for s_idx, s_char in enumerate(['D', 'E', 'N']):
+            short += max(0, base_req[s_char] - sum(matrix[n][d] == s_idx for n in range(N)))
+    target_n, target_work = int(D / 5), int(D * 5 / 7)
+    nights = [row.count(2) for row in matrix]
+    works = [sum(v < 3 for v in row) for row in matrix]
+    return {
+        'objective': short * 1000 + sum(max(0, x - 6) for x in nights) * 5000
+        + sum((x - target_n) ** 2 for x in nights) * 20 + sum((x - target_work) ** 2 for x in works) * 10,
+        'shortage': short,
+        'night_dev': max(nights) - min(nights),
+        'work_dev': max(works) - min(works),
+    }
+
+
+def run_mode(sheets, start, end, mode, max_time, workers):
+    sch = NurseScheduler(sheets, start, end)
+    t0 = time.time()
+    model, shifts, penalties = sch._build_model(mode)
+    model.Minimize(sum(penalties))
+    build = time.time() - t0
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = float(max_time)
+    solver.parameters.num_search_workers = workers
+    tracker = QualityTracker(sch, shifts)
+    status = solver.Solve(model, tracker)
+    return {
+        'mode': mode, 'status': solver.StatusName(status), 'build_time': round(build, 3),
+        'solve_time': round(solver.WallTime(), 2), 'trace': tracker.trace
+    }
+
+
+def summarize(runs):
+    best = min(r['trace'][-1][1]['objective'] for r in runs if r['trace'])
+    rows = []
+    for r in runs:
+        row = {'mode': r['mode'], 'status': r['status'], 'build_time': r['build_time'],
+               'solve_time': r['solve_time']}
+        if r['trace']:
+            row['first_feasible'] = round(r['trace'][0][0], 2)
+            for pct in (5, 1, 0):
+                limit = best * (1 + pct / 100)
+                hit = next((t for t, q in r['trace'] if q['objective'] <= limit), None)
+                row[f'within_{pct}pct'] = None if hit is None else round(hit, 2)
+            row.update(r['trace'][-1][1])
+        rows.append(row)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공정성 모드별 time-to-quality 벤치마크")
+    parser.add_argument('workbook', nargs='?', default=None)
+    parser.add_argument('--start')
+    parser.add_argument('--end')
+    parser.add_argument('--time', type=float, default=60)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--modes', nargs='+', default=NurseScheduler.FAIRNESS_MODES)
+    parser.add_argument('--json')
+    args = parser.parse_args()
+
+    path = args.workbook or glob.glob(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '*.xlsx'))[0]
+    sheets = DataLoader.load_excel(path, selective=True)
+    start, end = DataLoader.get_date_range(sheets)
+    start, end = args.start or start, args.end or end
+
+    runs = [run_mode(sheets, start, end, m, args.time, args.workers) for m in args.modes]
+    rows = summarize(runs)
+
+    cols = ['mode', 'status', 'build_time', 'first_feasible', 'within_5pct', 'within_1pct', 'within_0pct',
+            'objective', 'shortage', 'night_dev', 'work_dev']
+    print(' | '.join(f'{c:>13}' for c in cols))
+    for row in rows:
+        print(' | '.join(f'{str(row.get(c, "-")):>13}' for c in cols))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'summary': rows, 'runs': runs}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+benchmarks/check_hint_matching.py
+웜스타트 힌트의 간호사 매칭 점검 (시트의 간호사 순서가 바뀌어도 각자 자기 근무표를 힌트로 받는지)
+
+솔버 실행 없이 NurseScheduler._hint_assignments만 확인
+사용법: python benchmarks/check_hint_matching.py --nurses 12 --days 14 --seed 0
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from src.scheduler import NurseScheduler
+from utils.ward_generator import WardGenerator
+
+SHIFTS = ['D', 'E', 'N', 'OFF']
+
+
+def make_hint(df_nurse, dates, rng):
+    """간호사마다 서로 다른 임의 근무표를 가진 결과 dict (nurse_id는 결과 형식대로 행 순서 N{idx})"""
+    nurses = []
+    for n_idx, name in enumerate(df_nurse['Name']):
+        schedule = [SHIFTS[s] for s in rng.integers(0, 4, len(dates))]
+        nurses.append({'nurse_id': f'N{n_idx}', 'name': name, 'schedule': schedule})
+    return {'dates': [{'date': d} for d in dates], 'nurses': nurses}
+
+
+def hinted_rows(scheduler, hint):
+    """이름 → 힌트로 들어간 근무 코드 목록"""
+    hinted, _ = scheduler._hint_assignments(hint)
+    names = scheduler.df_nurse['Name'].tolist() if 'Name' in scheduler.df_nurse.columns else None
+    rows = {}
+    for (n, d), s_idx in sorted(hinted.items()):
+        rows.setdefault(names[n] if names else f'N{n}', []).append(SHIFTS[s_idx])
+    return rows
+
+
+def check(num_nurses, num_days, seed):
+    rng = np.random.default_rng(seed)
+    sheets = WardGenerator.generate(num_nurses, num_days, request_density=0, seed=seed)
+    sheets['Nurse'] = sheets['Nurse'].rename(columns={'Nurse_Name': 'Name'})
+    dates = sheets['Daily_Coverage']['Coverage_Date'].unique().tolist()
+    start, end = dates[0], dates[-1]
+    hint = make_hint(sheets['Nurse'], dates, rng)
+    expected = {n['name']: n['schedule'] for n in hint['nurses']}
+    failures = []
+
+    # 1) 시트 순서를 뒤집고 앞의 두 간호사를 맞바꿈 → 이름 기준으로 각자 자기 근무표
+    order = list(range(num_nurses))[::-1]
+    order[0], order[1] = order[1], order[0]
+    reordered = dict(sheets, Nurse=sheets['Nurse'].iloc[order].reset_index(drop=True))
+    rows = hinted_rows(NurseScheduler(reordered, start, end), hint)
+    for name, schedule in expected.items():
+        if rows.get(name) != schedule:
+            failures.append(f"순서 변경: {name}의 힌트가 자기 근무표와 다름")
+
+    # 2) 이름이 바뀐 간호사만 N{idx}로 대체 — 이미 이름으로 맞춘 간호사의 자리는 쓰지 않음
+    renamed = sheets['Nurse'].iloc[order].reset_index(drop=True)
+    old_name = renamed.at[0, 'Name']
+    renamed.at[0, 'Name'] = old_name + '_변경'
+    rows = hinted_rows(NurseScheduler(dict(sheets, Nurse=renamed), start, end), hint)
+    for name, schedule in expected.items():
+        if name != old_name and rows.get(name) != schedule:
+            failures.append(f"이름 변경: {name}의 힌트가 자기 근무표와 다름")
+    if old_name + '_변경' in rows:
+        failures.append("이름 변경: 이름이 맞지 않는 간호사에게 다른 간호사의 근무표가 들어감")
+
+    # 3) 이름 컬럼이 없으면 기존처럼 N{idx}(행 순서) 기준
+    plain = dict(sheets, Nurse=sheets['Nurse'].drop(columns=['Name']))
+    rows = hinted_rows(NurseScheduler(plain, start, end), hint)
+    for n_idx, nurse in enumerate(hint['nurses']):
+        if rows.get(f'N{n_idx}') != nurse['schedule']:
+            failures.append(f"이름 없음: N{n_idx}의 힌트가 행 순서 근무표와 다름")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="웜스타트 힌트 간호사 매칭 점검")
+    parser.add_argument('--nurses', type=int, default=12)
+    parser.add_argument('--days', type=int, default=14)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    failures = check(args.nurses, args.days, args.seed)
+    for line in failures:
+        print(f"FAIL {line}")
+    print("OK" if not failures else f"{len(failures)}건 실패")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+"""
+benchmarks/check_symmetry.py
+대칭 제거(symmetry_breaking)가 가능한 근무표를 잃지 않는지 전수 점검 (소형 병동)
+
+- 하드 제약만으로 가능한 근무표 전체(F)와 대칭 제거 모델의 근무표 전체(S)를 열거해 비교
+  · S ⊆ F, F의 모든 근무표는 묶음 안 순서를 바꾸면 S에 있음, S를 묶음 안에서 순열하면 F 전체
+- 자리 대응표(slot_of): F의 각 근무표를 힌트로 자리에 배정하면 순서 제약을 만족하고,
+  결과 변환(_format_result)이 모델 자리를 원래 간호사로 되돌리는지 확인
+사용법: python benchmarks/check_symmetry.py --nurses 3 --days 3 [--request]
+"""
+import argparse
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from ortools.sat.python import cp_model
+
+from src.scheduler import NurseScheduler
+from utils.ward_generator import WardGenerator
+
+
+class RosterCollector(cp_model.CpSolverSolutionCallback):
+    """해마다 근무 코드 행렬(간호사 × 일)만 모음 (보조 변수 값이 다른 같은 근무표는 하나로)"""
+
+    def __init__(self, shifts):
+        super().__init__()
+        self.shifts = shifts
+        self.rosters = set()
+
+    def on_solution_callback(self):
+        N, D, _ = self.shifts.shape
+        self.rosters.add(tuple(tuple(next(s for s in range(4) if self.Value(self.shifts[n, d, s]))
+                                     for d in range(D)) for n in range(N)))
+
+
+class FixedSolver:
+    """_format_result에 넘길 고정 값 솔버 (모델 자리별 근무표 → 변수 값)"""
+
+    def __init__(self, shifts, slots):
+        self.values = {shifts[n, d, s].Index(): int(slots[n][d] == s)
+                       for n in range(len(slots)) for d in range(len(slots[n])) for s in range(4)}
+
+    def Value(self, var):
+        return self.values[var.Index()]
+
+    @staticmethod
+    def StatusName(status):
+        return 'OPTIMAL'
+
+
+def make_scheduler(num_nurses, num_days, request):
+    sheets = WardGenerator.generate(num_nurses, num_days, level_mix={'Regular': 1.0}, request_density=0)
+    if request:
+        # 첫 간호사의 첫날 OFF 신청 → 그 간호사는 묶음에서 빠짐
+        sheets['Requests'] = pd.DataFrame([{
+            'Req_ID': 'REQ00001', 'Nurse_ID': sheets['Nurse']['Nurse_ID'].iat[0],
+            'Request_Date': sheets['Daily_Coverage']['Coverage_Date'].iat[0], 'Request_Type': 'OFF',
+            'Priority_Score': 5, 'Reason': '개인 사유', 'Status': '대기'
+        }])
+    dates = sheets['Daily_Coverage']['Coverage_Date']
+    return NurseScheduler(sheets, dates.iat[0], dates.iat[-1])
+
+
+def enumerate_rosters(sch, groups):
+    """가능한 근무표 전체 (groups가 있으면 대칭 제거 제약 포함)"""
+    model, shifts, _ = sch._build_model()
+    # 부족 변수는 부족 인원과 같게 고정 (열거에서 같은 근무표가 부족 변수 값만 달리해 반복되지 않도록)
+    req = sch.base_requirement(sch.NUM_NURSES)
+    for i, short in enumerate(sch.short_vars):
+        d, s_idx = divmod(i, 3)
+        model.AddMaxEquality(short, [req['DEN'[s_idx]] - sum(shifts[:, d, s_idx].tolist()), 0])
+    sch._add_symmetry_breaking(model, shifts, groups)
+    solver = cp_model.CpSolver()
+    solver.parameters.enumerate_all_solutions = True
+    solver.parameters.num_search_workers = 1
+    collector = RosterCollector(shifts)
+    status = solver.Solve(model, collector)
+    if status != cp_model.OPTIMAL:
+        raise Exception(f"열거가 끝나지 않았습니다: {solver.StatusName(status)}")
+    return collector.rosters, shifts
+
+
+def canonical(roster, groups):
+    """묶음 안 근무 벡터를 사전식 내림차순으로 정렬한 근무표"""
+    rows = list(roster)
+    for group in groups:
+        for slot, row in zip(group, sorted((roster[n] for n in group), reverse=True)):
+            rows[slot] = row
+    return tuple(rows)
+
+
+def permutations(roster, groups):
+    """묶음 안 순서를 바꾼 모든 근무표"""
+    variants = {tuple(roster)}
+    for group in groups:
+        expanded = set()
+        for r in variants:
+            for perm in itertools.permutations(group):
+                rows = list(r)
+                for slot, n in zip(group, perm):
+                    rows[slot] = r[n]
+                expanded.add(tuple(rows))
+        variants = expanded
+    return variants
+
+
+def check(num_nurses, num_days, request):
+    sch = make_scheduler(num_nurses, num_days, request)
+    groups = sch._symmetry_groups()
+    full, _ = enumerate_rosters(sch, [])
+    broken, shifts = enumerate_rosters(sch, groups)
+    print(f"묶음 {groups}, 가능한 근무표 {len(full)}개, 대칭 제거 후 {len(broken)}개")
+
+    failures = []
+    if not broken <= full:
+        failures.append(f"대칭 제거 모델에만 있는 근무표 {len(broken - full)}개")
+    lost = [r for r in full if canonical(r, groups) not in broken]
+    if lost:
+        failures.append(f"정렬해도 대칭 제거 모델에 없는 근무표 {len(lost)}개 (예: {lost[0]})")
+    closure = set().union(*(permutations(r, groups) for r in broken)) if broken else set()
+    if closure != full:
+        failures.append(f"대칭 제거 해의 순열이 전체와 다름 ({len(closure)}개 ≠ {len(full)}개)")
+
+    # 자리 대응표: 힌트(실제 간호사 근무표) → 자리 배정 → 결과 변환 시 원래 간호사로 복원
+    for roster in full:
+        hinted = {(n, d): s for n, row in enumerate(roster) for d, s in enumerate(row)}
+        slot_of = sch._symmetry_slots(groups, hinted)
+        slots = [None] * sch.NUM_NURSES
+        for n, slot in enumerate(slot_of):
+            slots[slot] = roster[n]
+        if tuple(slots) not in broken:
+            failures.append(f"힌트를 자리에 배정한 근무표가 순서 제약 위반: {roster}")
+            break
+        result = sch._format_result(FixedSolver(shifts, slots), shifts, cp_model.OPTIMAL, 0, slot_of)
+        restored = tuple(tuple(sch.SHIFTS.index(c) for c in nurse['schedule']) for nurse in result['nurses'])
+        if restored != roster:
+            failures.append(f"결과 변환이 원래 간호사로 되돌리지 않음: {roster} → {restored}")
+            break
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대칭 제거 전수 점검 (소형 병동)")
+    parser.add_argument('--nurses', type=int, default=3)
+    parser.add_argument('--days', type=int, default=3)
+    parser.add_argument('--request', action='store_true', help="첫 간호사에게 OFF 신청 추가 (묶음에서 제외)")
+    args = parser.parse_args()
+
+    failures = check(args.nurses, args.days, args.request)
+    for line in failures:
+        print(f"FAIL {line}")
+    print("OK" if not failures else f"{len(failures)}건 실패")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
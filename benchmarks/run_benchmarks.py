@@ -0,0 +1,110 @@
+"""
+benchmarks/run_benchmarks.py
+규모별 종합 벤치마크 (가상 병동: 간호사 수 × 일수)
+
+케이스마다 별도 프로세스에서 실행해 최대 메모리(peak RSS)를 독립적으로 측정하고
+  모델 구성 시간 / 첫 해까지 시간 / 최종 목적값 / 검증 시간 / 차트 생성 시간·전송 크기 / 최대 메모리
+를 JSON·CSV 보고서로 저장
+
+사용법:
+  python benchmarks/run_benchmarks.py --nurses 50 150 300 --days 28 90 365 --time 30 \
+      --json bench.json --csv bench.csv
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+
+def run_case(num_nurses, num_days, max_time, workers, fairness, request_density, seed):
+    """워커 프로세스: 케이스 하나 (프로세스당 한 케이스만 실행)"""
+    from utils.ward_generator import WardGenerator
+    from src.scheduler import NurseScheduler
+    from src.validator import ScheduleValidator
+    from src.visualizer import ScheduleVisualizer
+
+    row = {'nurses': num_nurses, 'days': num_days, 'cells': num_nurses * num_days, 'fairness': fairness}
+    sheets = WardGenerator.generate(num_nurses, num_days, request_density=request_density, seed=seed)
+    dates = sheets['Daily_Coverage']['Coverage_Date']
+    sch = NurseScheduler(sheets, dates.iloc[0], dates.iloc[-1])
+
+    t0 = time.perf_counter()
+    sch._build_model(fairness)
+    row['build_sec'] = round(time.perf_counter() - t0, 3)
+
+    incumbents = []
+    t0 = time.perf_counter()
+    try:
+        result = sch.optimize(max_time_seconds=max_time, num_workers=workers, log_progress=False,
+                              fairness=fairness, on_solution=incumbents.append)
+        row['status'] = result['status']
+    except Exception:
+        result = None
+        row['status'] = 'NO_SOLUTION'
+    row['solve_sec'] = round(time.perf_counter() - t0, 3)
+    row['first_feasible_sec'] = incumbents[0]['elapsed'] if incumbents else None
+    row['objective'] = incumbents[-1]['objective'] if incumbents else None
+    row['shortage'] = incumbents[-1]['shortage'] if incumbents else None
+
+    if result is not None:
+        t0 = time.perf_counter()
+        ScheduleValidator(result).validate_all()
+        row['validate_sec'] = round(time.perf_counter() - t0, 4)
+
+        t0 = time.perf_counter()
+        figs = {
+            'calendar': ScheduleVisualizer.create_calendar_view(result),
+            'coverage': ScheduleVisualizer.create_coverage_chart(result),
+            'workload': ScheduleVisualizer.create_workload_chart(result),
+        }
+        row['chart_sec'] = round(time.perf_counter() - t0, 4)
+        # 브라우저로 보내는 차트 JSON 크기
+        for name, fig in figs.items():
+            row[f'{name}_kb'] = round(len(fig.to_json()) / 1024, 1)
+
+    # Linux: ru_maxrss 단위는 KB
+    row['peak_rss_mb'] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="규모별 종합 벤치마크")
+    parser.add_argument('--nurses', nargs='+', type=int, default=[50, 150, 300])
+    parser.add_argument('--days', nargs='+', type=int, default=[28, 90])
+    parser.add_argument('--time', type=float, default=30, help="케이스당 최적화 시간 (초)")
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--fairness', default='quadratic')
+    parser.add_argument('--request-density', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json')
+    parser.add_argument('--csv')
+    args = parser.parse_args()
+
+    rows = []
+    for d in args.days:
+        for n in args.nurses:
+            # 케이스마다 새 프로세스 → peak RSS가 이전 케이스의 영향을 받지 않음
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                row = pool.submit(run_case, n, d, args.time, args.workers, args.fairness,
+                                  args.request_density, args.seed).result()
+            rows.append(row)
+            print(json.dumps(row, ensure_ascii=False))
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'cases': rows}, f, ensure_ascii=False, indent=2)
+    if args.csv:
+        df.to_csv(args.csv, index=False)
+
+
+if __name__ == '__main__':
+    main()
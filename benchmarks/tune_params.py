@@ -0,0 +1,154 @@
+"""
+benchmarks/tune_params.py
+CP-SAT 솔버 파라미터 자동 튜닝 (격자/무작위 탐색, 다중 프로세스)
+
+저장된 병동 엑셀 파일들에 대해 파라미터 조합별로
+  - 첫 해까지 걸린 시간 (time-to-first-feasible)
+  - 고정 시간 예산(예: 10/30/60초) 시점의 목적값
+을 기록하고, 규모 구간(small/medium/large)별 권장 프로파일을 JSON으로 저장
+
+사용법:
+  python benchmarks/tune_params.py wards/*.xlsx --budgets 10 30 --processes 4 --workers 2 \
+      --out solver_profile.json --report tuning_runs.csv
+  → NurseScheduler(...).optimize(param_profile='solver_profile.json')
+"""
+import argparse
+import glob
+import itertools
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from ortools.sat.python import cp_model
+
+from utils.data_loader import DataLoader
+from src.scheduler import NurseScheduler
+from src.tuning import ParamProfile, apply_params, size_class
+
+# 탐색 공간: 프리솔브, 선형화 수준, 탐색 전략(포트폴리오)
+SEARCH_SPACE = {
+    'cp_model_presolve': [True, False],
+    'linearization_level': [0, 1, 2],
+    'cp_model_probing_level': [0, 2],
+    'search_branching': ['AUTOMATIC_SEARCH', 'PORTFOLIO_SEARCH', 'FIXED_SEARCH'],
+}
+
+
+class _Trace(cp_model.CpSolverSolutionCallback):
+    def __init__(self):
+        super().__init__()
+        self.t0 = time.time()
+        self.points = []
+
+    def on_solution_callback(self):
+        self.points.append((time.time() - self.t0, self.ObjectiveValue()))
+
+
+def candidates(mode, samples, seed):
+    keys = list(SEARCH_SPACE)
+    grid = [dict(zip(keys, values)) for values in itertools.product(*(SEARCH_SPACE[k] for k in keys))]
+    if mode == 'random':
+        random.Random(seed).shuffle(grid)
+        grid = grid[:samples]
+    return [{}] + grid  # {} = CP-SAT 기본값 (기준선)
+
+
+def run_one(path, params, budgets, workers, fairness):
+    """워커 프로세스: 인스턴스 하나 × 파라미터 조합 하나"""
+    sheets = DataLoader.load_excel(path, selective=True)
+    start, end = DataLoader.get_date_range(sheets)
+    sch = NurseScheduler(sheets, start, end)
+    model, shifts, penalties = sch._build_model(fairness)
+    model.Minimize(sum(penalties))
+
+    solver = cp_model.CpSolver()
+    apply_params(solver.parameters, params)
+    solver.parameters.max_time_in_seconds = float(max(budgets))
+    solver.parameters.num_search_workers = workers
+    trace = _Trace()
+    status = solver.Solve(model, trace)
+
+    row = {
+        'instance': os.path.basename(path), 'nurses': sch.NUM_NURSES, 'days': sch.NUM_DAYS,
+        'size_class': size_class(sch.NUM_NURSES, sch.NUM_DAYS), 'params': params,
+        'status': solver.StatusName(status),
+        'first_feasible': round(trace.points[0][0], 3) if trace.points else None,
+    }
+    for b in budgets:
+        best = [obj for t, obj in trace.points if t <= b]
+        row[f'obj@{b:g}s'] = min(best) if best else None
+    return row
+
+
+def recommend(df, budgets):
+    """
+    규모 구간별 추천: 인스턴스마다 예산 시점 목적값을 최선값 대비 비율로 정규화해 평균,
+    동률이면 첫 해 시간이 짧은 조합
+    """
+    key = f'obj@{max(budgets):g}s'
+    df = df.copy()
+    df['param_key'] = df['params'].apply(lambda p: repr(sorted(p.items())))
+    best = df.groupby('instance')[key].transform('min')
+    worst = df[key].max() if df[key].notna().any() else 0
+    df['norm'] = (df[key].fillna(worst * 2 + 1) + 1) / (best.fillna(worst) + 1)
+    df['ttff'] = df['first_feasible'].fillna(df['first_feasible'].max() or 0)
+
+    classes = {}
+    for size, grp in df.groupby('size_class'):
+        agg = grp.groupby('param_key').agg(norm=('norm', 'mean'), ttff=('ttff', 'mean'), params=('params', 'first'))
+        top = agg.sort_values(['norm', 'ttff']).iloc[0]
+        classes[size] = {'params': top['params'], 'score': round(float(top['norm']), 4),
+                         'time_to_first_feasible': round(float(top['ttff']), 3),
+                         'instances': int(grp['instance'].nunique())}
+    return classes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CP-SAT 파라미터 튜닝")
+    parser.add_argument('instances', nargs='+', help="병동 엑셀 파일 또는 폴더")
+    parser.add_argument('--budgets', nargs='+', type=float, default=[10, 30])
+    parser.add_argument('--mode', choices=['grid', 'random'], default='random')
+    parser.add_argument('--samples', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--processes', type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument('--workers', type=int, default=2, help="솔브 하나당 CP-SAT 워커 수")
+    parser.add_argument('--fairness', default='quadratic', choices=NurseScheduler.FAIRNESS_MODES)
+    parser.add_argument('--out', default='solver_profile.json')
+    parser.add_argument('--report')
+    args = parser.parse_args()
+
+    paths = []
+    for p in args.instances:
+        paths += sorted(glob.glob(os.path.join(p, '*.xlsx'))) if os.path.isdir(p) else [p]
+
+    combos = candidates(args.mode, args.samples, args.seed)
+    jobs = [(path, params) for path in paths for params in combos]
+    print(f"인스턴스 {len(paths)}개 × 조합 {len(combos)}개 = {len(jobs)}회 "
+          f"(동시 {args.processes}개, 최대 {max(args.budgets):g}초)")
+
+    with ProcessPoolExecutor(max_workers=args.processes) as pool:
+        futures = [pool.submit(run_one, path, params, args.budgets, args.workers, args.fairness)
+                   for path, params in jobs]
+        rows = [f.result() for f in futures]
+
+    df = pd.DataFrame(rows)
+    if args.report:
+        df.to_csv(args.report, index=False)
+    classes = recommend(df, args.budgets)
+    ParamProfile(classes, {
+        'budgets': args.budgets, 'mode': args.mode, 'workers': args.workers,
+        'instances': [os.path.basename(p) for p in paths], 'created': time.strftime('%Y-%m-%d %H:%M:%S')
+    }).save(args.out)
+
+    for size, info in classes.items():
+        print(f"[{size}] {info['params'] or '기본값'} (정규화 목적값 {info['score']}, 첫 해 {info['time_to_first_feasible']}초)")
+    print(f"프로파일 저장: {args.out}")
+
+
+if __name__ == '__main__':
+    main()
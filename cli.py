@@ -0,0 +1,256 @@
+"""
+cli.py
+명령줄 실행 (cron·배치 작업용, Streamlit 없이)
+
+사용법:
+  python cli.py solve 병동.xlsx --time 120 --out result.json --csv schedule.csv
+  python cli.py solve 병동.xlsx --time 60 --diagnostics diag.json
+  python cli.py solve 병동.xlsx --start 2026-01-01 --end 2026-12-31 --window 28 --commit 14 --out year.json
+  python cli.py validate result.json
+  python cli.py export result.json --xlsx schedule.xlsx --parquet schedule.parquet
+
+종료 코드:
+  0 성공 / 1 규정 위반(또는 --strict에서 인력 부족) / 2 잘못된 인자
+  3 입력 파일 오류 / 4 해 없음 / 5 사전 점검 실패(--precheck strict) / 130 중단(Ctrl+C)
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+EXIT_OK = 0
+EXIT_VIOLATIONS = 1
+EXIT_USAGE = 2
+EXIT_INPUT = 3
+EXIT_NO_SOLUTION = 4
+EXIT_PRECHECK = 5
+EXIT_INTERRUPTED = 130
+
+HARD_CODES = ['HC1', 'HC2', 'HC3', 'HC4', 'HC6']
+
+
+def _log(msg):
+    print(msg, file=sys.stderr)
+
+
+def load_result(path):
+    """결과 JSON (dict 형식 또는 CompactResult.to_json 형식) → CompactResult"""
+    from src.result import CompactResult
+
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    data = json.loads(text)
+    if data.get('format') == 'compact-v1':
+        return CompactResult.from_json(text)
+    return CompactResult.from_dict(data)
+
+
+def write_outputs(compact, args):
+    """--out(JSON) / --csv / --parquet / --xlsx"""
+    if getattr(args, 'out', None):
+        with open(args.out, 'w', encoding='utf-8') as f:
+            if args.compact:
+                f.write(compact.to_json())
+            else:
+                json.dump(compact.to_dict(), f, ensure_ascii=False, default=str)
+        _log(f"결과 저장: {args.out}")
+    if args.csv or args.parquet or args.xlsx:
+        from utils.exporter import RosterExporter
+        if args.csv:
+            RosterExporter.to_csv(compact, args.csv)
+            _log(f"CSV 저장: {args.csv}")
+        if args.parquet:
+            RosterExporter.to_parquet(compact, args.parquet)
+            _log(f"Parquet 저장: {args.parquet}")
+        if args.xlsx:
+            RosterExporter.to_xlsx(compact, args.xlsx)
+            _log(f"XLSX 저장: {args.xlsx}")
+
+
+def summarize(compact):
+    """검증 결과 요약 출력, (위반 수, 인력 부족 합계) 반환"""
+    from src.validator import ScheduleValidator
+
+    val = ScheduleValidator(compact).validate_all(messages=False)
+    hard = sum(len(val['violations'][k]['day']) for k in HARD_CODES)
+    short = int(compact.analytics.shortage().sum())
+    fair = val['fairness']
+    print(json.dumps({
+        'status': compact.get('status'), 'nurses': len(compact.names), 'days': len(compact.dates),
+        'hard_violations': hard, 'staffing_warnings': len(val['violations']['STF']['day']),
+        'shortage': short,
+        'work_day_deviation': fair['work_days']['deviation'],
+        'night_deviation': fair['night_shifts']['deviation'],
+        'stop_reason': compact.get('stop_reason')
+    }, ensure_ascii=False))
+    return hard, short
+
+
+def cmd_solve(args):
+    from utils.data_loader import DataLoader
+
+    try:
+        sheets = DataLoader.load_excel(args.workbook, selective=True, cache_dir=args.sheet_cache)
+    except Exception as e:
+        _log(str(e))
+        return EXIT_INPUT
+    if not any(k in sheets for k in ('Nurse', 'nurses')):
+        _log("Nurse 시트가 없습니다.")
+        return EXIT_INPUT
+    start, end = DataLoader.get_date_range(sheets)
+    start, end = args.start or start, args.end or end
+
+    from src.result import CompactResult
+
+    # 사전 점검은 여기서 한 번만 (롤링이면 구간별 한도로, strict면 솔버를 띄우지 않고 종료)
+    # → optimize에는 precheck=None으로 넘겨 구간마다 다시 점검하지 않음
+    params = dict(max_time_seconds=args.time, num_workers=args.workers, log_progress=args.verbose,
+                  fairness=args.fairness, objective=args.objective, precheck=None,
+                  symmetry_breaking=args.symmetry_breaking)
+    if args.window:
+        from src.rolling import RollingHorizonScheduler
+        planner = RollingHorizonScheduler(sheets, start, end, args.window, args.commit or args.window // 2)
+    else:
+        from src.scheduler import NurseScheduler
+        planner = NurseScheduler(sheets, start, end)
+    report = None
+    if args.precheck != 'off':
+        if args.window:
+            report = planner.precheck()
+        else:
+            from src.precheck import CapacityPrecheck
+            report = CapacityPrecheck(planner).run()
+        for issue in report['issues']:
+            _log(f"[사전 점검 {issue['level']}] {issue['message']}")
+        if args.precheck == 'strict' and report['blocking']:
+            return EXIT_PRECHECK
+    try:
+        if args.window:
+            result = planner.optimize(on_window=lambda w: _log(
+                f"[{w['index'] + 1}] {w['start']} ~ {w['commit_end']} {w['status']} ({w['time']}초)"), **params)
+        else:
+            scheduler = planner
+            if args.hint:
+                params['hint'] = load_result(args.hint)
+            if args.profile:
+                params['param_profile'] = args.profile
+            if args.cache:
+                from src.cache import SolveCache
+                result = SolveCache(args.cache).optimize(scheduler, **params)
+            else:
+                result = scheduler.optimize(**params)
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+    except Exception as e:
+        _log(str(e))
+        return EXIT_NO_SOLUTION
+
+    if report is not None:
+        result['precheck'] = report
+    compact = CompactResult.from_dict(result)
+    write_outputs(compact, args)
+    if args.diagnostics:
+        from src.diagnostics import export_diagnostics
+        export_diagnostics(compact, args.diagnostics)
+        _log(f"진단 정보 저장: {args.diagnostics}")
+    hard, short = summarize(compact)
+    if hard or (args.strict and short):
+        return EXIT_VIOLATIONS
+    return EXIT_OK
+
+
+def cmd_validate(args):
+    try:
+        compact = load_result(args.result)
+    except (OSError, ValueError, KeyError) as e:
+        _log(f"결과 파일을 읽을 수 없습니다: {e}")
+        return EXIT_INPUT
+    hard, short = summarize(compact)
+    if args.details:
+        from src.validator import ScheduleValidator
+        for code, msgs in ScheduleValidator(compact).validate_all()['violations'].items():
+            for msg in msgs:
+                print(f"{code}\t{msg}")
+    if hard or (args.strict and short):
+        return EXIT_VIOLATIONS
+    return EXIT_OK
+
+
+def cmd_export(args):
+    if not (args.out or args.csv or args.parquet or args.xlsx):
+        _log("내보낼 형식을 하나 이상 지정하세요. (--out/--csv/--parquet/--xlsx)")
+        return EXIT_USAGE
+    try:
+        compact = load_result(args.result)
+    except (OSError, ValueError, KeyError) as e:
+        _log(f"결과 파일을 읽을 수 없습니다: {e}")
+        return EXIT_INPUT
+    try:
+        write_outputs(compact, args)
+    except Exception as e:
+        _log(str(e))
+        return EXIT_INPUT
+    return EXIT_OK
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="간호사 근무표 최적화 (명령줄)")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def add_outputs(p):
+        p.add_argument('--out', help="결과 JSON 경로")
+        p.add_argument('--compact', action='store_true', help="결과 JSON을 압축 형식으로 저장")
+        p.add_argument('--csv')
+        p.add_argument('--parquet')
+        p.add_argument('--xlsx')
+
+    p = sub.add_parser('solve', help="엑셀 → 근무표 최적화")
+    p.add_argument('workbook')
+    p.add_argument('--start', help="YYYY-MM-DD (기본: Daily_Coverage 시작일)")
+    p.add_argument('--end', help="YYYY-MM-DD (기본: Daily_Coverage 종료일)")
+    p.add_argument('--time', type=float, default=120, help="최적화 시간 (초, 롤링 모드는 구간당)")
+    p.add_argument('--workers', type=int, default=8)
+    p.add_argument('--fairness', default='quadratic', choices=['quadratic', 'abs', 'minmax', 'pwl'])
+    p.add_argument('--objective', default='weighted', choices=['weighted', 'lexicographic'],
+                   help="목적식 (lexicographic: 인력 부족을 먼저 최소화한 뒤 공정성 최적화)")
+    p.add_argument('--symmetry-breaking', action='store_true',
+                   help="서로 바꿔도 같은 간호사 묶음에 순서 제약 추가 (benchmarks/check_symmetry.py로 검증)")
+    p.add_argument('--hint', help="웜스타트용 이전 결과 JSON")
+    p.add_argument('--profile', help="솔버 파라미터 프로파일 JSON")
+    p.add_argument('--cache', help="결과 캐시 폴더")
+    p.add_argument('--sheet-cache', help="엑셀 파싱 캐시 폴더")
+    p.add_argument('--window', type=int, help="롤링 호라이즌 구간 길이 (일)")
+    p.add_argument('--commit', type=int, help="구간마다 확정할 일수 (기본: 구간 길이의 절반)")
+    p.add_argument('--strict', action='store_true', help="인력 부족이 있으면 종료 코드 1")
+    p.add_argument('--precheck', default='warn', choices=['off', 'warn', 'strict'],
+                   help="인력 용량 사전 점검 (strict: 인력 부족이 확실하면 최적화하지 않고 종료 코드 5)")
+    p.add_argument('--diagnostics', help="솔버 진단 정보 JSON 경로 (구성 단계별 시간·CP-SAT 통계)")
+    p.add_argument('-v', '--verbose', action='store_true', help="CP-SAT 탐색 로그 출력")
+    add_outputs(p)
+    p.set_defaults(func=cmd_solve)
+
+    p = sub.add_parser('validate', help="결과 JSON 검증")
+    p.add_argument('result')
+    p.add_argument('--details', action='store_true', help="위반 내역을 한 줄씩 출력")
+    p.add_argument('--strict', action='store_true', help="인력 부족이 있으면 종료 코드 1")
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser('export', help="결과 JSON → CSV/Parquet/XLSX")
+    p.add_argument('result')
+    add_outputs(p)
+    p.set_defaults(func=cmd_export)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+
+
+if __name__ == '__main__':
+    sys.exit(main())
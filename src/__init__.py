@@ -1,10 +1,39 @@
 """
 간호사 스케줄링 최적화 Agent 핵심 모듈
+
+무거운 의존성(ortools·plotly)은 해당 클래스를 처음 사용할 때 불러옴
+(검증·내보내기만 하는 CLI 명령이 솔버를 로드하지 않도록)
 """
+import importlib
+
+# 공개 이름 → 정의된 하위 모듈
+_EXPORTS = {
+    'NurseScheduler': 'scheduler',
+    'InfeasibleScheduleError': 'scheduler',
+    'ScheduleValidator': 'validator',
+    'ScheduleVisualizer': 'visualizer',
+    'BatchScheduler': 'batch',
+    'SolveCache': 'cache',
+    'BackgroundSolve': 'monitor',
+    'SolutionMonitor': 'monitor',
+    'ParamProfile': 'tuning',
+    'RollingHorizonScheduler': 'rolling',
+    'CompactResult': 'result',
+    'ScheduleAnalytics': 'analytics',
+    'CapacityPrecheck': 'precheck',
+    'PrecheckError': 'precheck',
+    'SolveService': 'service',
+    'ServiceClient': 'client',
+    'RemoteSolve': 'client',
+    'JobStore': 'store',
+}
 
-from .scheduler import NurseScheduler
-from .validator import ScheduleValidator
-from .visualizer import ScheduleVisualizer
+__all__ = list(_EXPORTS)
 
-__all__ = ['NurseScheduler', 'ScheduleValidator', 'ScheduleVisualizer']
 
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
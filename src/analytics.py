@@ -0,0 +1,89 @@
+"""
+src/analytics.py
+근무표 집계 엔진 (배정 행렬 한 번 순회로 간호사별·날짜별·근무조별 통계 계산)
+"""
+import numpy as np
+
+SHIFTS = ['D', 'E', 'N', 'OFF']
+
+
+def base_requirement(num_nurses):
+    """병동 규모별 근무조 최소 인원"""
+    if num_nurses < 10: return {'D': 2, 'E': 2, 'N': 1}
+    elif num_nurses < 15: return {'D': 2, 'E': 2, 'N': 2}
+    else: return {'D': 3, 'E': 3, 'N': 2}
+
+
+class ScheduleAnalytics:
+    """
+    간호사 × 일 근무 코드 행렬(D=0, E=1, N=2, OFF=3)에서 모든 집계를 한 번에 계산
+    (그 밖의 코드, 예: CompactResult.UNKNOWN 칸은 근무·휴무 어디에도 세지 않음)
+    - 간호사별: shift_counts(간호사 × 4), work_days, night_count, off_count
+    - 날짜별: coverage / new_nurses / charge_nurses (일 × D·E·N)
+    - 공정성·평균 투입 인원·기준 인원 대비 부족은 위 배열에서 바로 계산
+    결과 dict·검증·대시보드·차트는 모두 이 객체의 값을 읽음
+    """
+
+    def __init__(self, matrix, levels, dates=None):
+        self.matrix = np.asarray(matrix, dtype=np.int8)
+        self.levels = list(levels)
+        self.dates = list(dates) if dates is not None else None
+        self.num_nurses, self.num_days = self.matrix.shape
+
+        onehot = self.matrix[:, :, None] == np.arange(4, dtype=np.int8)  # 간호사 × 일 × 근무
+        is_new = np.array([lv == 'New' for lv in self.levels], dtype=bool)
+        is_charge = np.array([lv == 'Charge' for lv in self.levels], dtype=bool)
+
+        self.shift_counts = onehot.sum(axis=1)
+        self.night_count = self.shift_counts[:, 2]
+        self.off_count = self.shift_counts[:, 3]
+        self.work_days = self.shift_counts[:, :3].sum(axis=1)
+
+        work = onehot[:, :, :3]
+        self.coverage = work.sum(axis=0)
+        self.new_nurses = work[is_new].sum(axis=0)
+        self.charge_nurses = work[is_charge].sum(axis=0)
+
+    @classmethod
+    def from_result(cls, result):
+        """결과 dict 또는 CompactResult에서 생성"""
+        if not hasattr(result, 'matrix'):
+            from .result import CompactResult  # result.py가 이 모듈을 import
+            result = CompactResult.from_dict(result)
+        return cls(result.matrix, result.levels, result.dates)
+
+    @staticmethod
+    def _spread(values):
+        return {
+            'min': int(values.min()), 'max': int(values.max()), 'avg': int(values.sum()) / len(values),
+            'deviation': int(values.max() - values.min())
+        }
+
+    def fairness(self):
+        """근무일수·나이트 횟수의 최소/최대/평균/격차 (ScheduleValidator 형식)"""
+        if not self.num_nurses:
+            return {'work_days': {'deviation': 0}, 'night_shifts': {'deviation': 0}}
+        return {'work_days': self._spread(self.work_days), 'night_shifts': self._spread(self.night_count)}
+
+    def average_coverage(self):
+        """근무조별 일평균 투입 인원"""
+        if not self.num_days:
+            return {}
+        totals = self.coverage.sum(axis=0)
+        return {s: int(totals[i]) / self.num_days for i, s in enumerate('DEN')}
+
+    def shortage(self, requirement=None):
+        """기준 인원 대비 부족 인원 (일 × D·E·N), 기준은 기본값 base_requirement(간호사 수)"""
+        requirement = requirement or base_requirement(self.num_nurses)
+        req = np.array([requirement[s] for s in 'DEN'])
+        return np.maximum(req - self.coverage, 0)
+
+    def shortage_records(self, requirement=None):
+        """부족이 있는 날짜·근무조 목록 [{'date', 'shift', 'required', 'actual', 'missing'}] (날짜 → 근무조 순)"""
+        requirement = requirement or base_requirement(self.num_nurses)
+        short = self.shortage(requirement)
+        d_idx, s_idx = np.nonzero(short)
+        dates = self.dates or list(range(self.num_days))
+        return [{'date': dates[d], 'shift': 'DEN'[s], 'required': requirement['DEN'[s]],
+                 'actual': int(self.coverage[d, s]), 'missing': int(short[d, s])}
+                for d, s in zip(d_idx.tolist(), s_idx.tolist())]
@@ -0,0 +1,109 @@
+"""
+src/batch.py
+다중 병동 일괄 스케줄링 (Process Pool 기반 병렬 최적화)
+"""
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def _solve_ward(ward, source, start_date, end_date, max_time_seconds, num_workers):
+    """워커 프로세스에서 병동 하나를 최적화 (피클 가능한 모듈 함수)"""
+    from .scheduler import NurseScheduler
+
+    t0 = time.time()
+    try:
+        if isinstance(source, dict):
+            sheets = source
+        else:
+            # 엑셀 경로는 워커에서 직접 읽어 부모 프로세스 부하를 줄임
+            from utils.data_loader import DataLoader
+            sheets = DataLoader.load_excel(str(source), selective=True)
+
+        scheduler = NurseScheduler(sheets, start_date, end_date)
+        result = scheduler.optimize(
+            max_time_seconds=max_time_seconds, num_workers=num_workers, log_progress=False
+        )
+        result['ward'] = ward
+        return ward, result, None, time.time() - t0
+    except Exception as e:
+        return ward, None, str(e), time.time() - t0
+
+
+class BatchScheduler:
+    """
+    여러 병동을 동시에 최적화
+    - 전체 코어를 동시 실행 수로 나누어 솔브마다 num_search_workers 배정
+    - 병동별 결과는 NurseScheduler._format_result 형식 그대로 반환
+    """
+
+    def __init__(self, wards, start_date, end_date, total_cores=None, max_parallel=None):
+        # wards: {병동명: sheets dict 또는 엑셀 파일 경로}
+        self.wards = dict(wards)
+        self.start_date = start_date
+        self.end_date = end_date
+        self.total_cores = total_cores or os.cpu_count() or 1
+        self.max_parallel = max_parallel
+
+    @staticmethod
+    def split_workbook(sheets):
+        """
+        한 통합문서에 여러 병동이 있는 경우 (예: Nurse_71병동, Requests_71병동)
+        병동별 sheets dict로 분리. 접미사가 없는 시트는 모든 병동이 공유
+        """
+        nurse_keys = [k for k in sheets if re.match(r'^(nurse|nurses)([ _\-].+)$', k, re.IGNORECASE)]
+        if not nurse_keys:
+            return {'default': sheets}
+
+        wards = {}
+        for key in nurse_keys:
+            suffix = re.split(r'[ _\-]', key, maxsplit=1)[1]
+            shared = {k: v for k, v in sheets.items()
+                      if not re.match(r'^(nurse|nurses|requests?)([ _\-].+)$', k, re.IGNORECASE)}
+            ward_sheets = dict(shared)
+            ward_sheets.pop('nurses', None)  # NurseScheduler는 'nurses'를 우선 참조
+            ward_sheets['Nurse'] = sheets[key]
+            req_key = next((k for k in sheets
+                            if re.match(rf'^requests?[ _\-]{re.escape(suffix)}$', k, re.IGNORECASE)), None)
+            if req_key:
+                ward_sheets.pop('requests', None)
+                ward_sheets['Requests'] = sheets[req_key]
+            wards[suffix] = ward_sheets
+        return wards
+
+    def allocate(self):
+        """동시 실행 수와 솔브당 워커 수 결정 (코어 과다 할당 방지)"""
+        parallel = min(len(self.wards), self.max_parallel or self.total_cores, self.total_cores)
+        parallel = max(1, parallel)
+        return parallel, max(1, self.total_cores // parallel)
+
+    def run(self, max_time_seconds=250):
+        parallel, per_solve = self.allocate()
+        t0 = time.time()
+        results, errors, ward_times = {}, {}, {}
+
+        with ProcessPoolExecutor(max_workers=parallel) as pool:
+            futures = [
+                pool.submit(_solve_ward, ward, src, self.start_date, self.end_date,
+                            max_time_seconds, per_solve)
+                for ward, src in self.wards.items()
+            ]
+            for fut in as_completed(futures):
+                ward, result, err, elapsed = fut.result()
+                ward_times[ward] = round(elapsed, 2)
+                if err is None:
+                    results[ward] = result
+                else:
+                    errors[ward] = err
+
+        # 입력 순서대로 정렬
+        order = list(self.wards)
+        return {
+            'results': {w: results[w] for w in order if w in results},
+            'errors': {w: errors[w] for w in order if w in errors},
+            'ward_times': {w: ward_times[w] for w in order if w in ward_times},
+            'parallel': parallel,
+            'workers_per_solve': per_solve,
+            'wall_time': round(time.time() - t0, 2)
+        }
@@ -0,0 +1,146 @@
+"""
+src/cache.py
+입력 지문(fingerprint) 기반 최적화 결과 디스크 캐시
+"""
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+from .precheck import CapacityPrecheck, PrecheckError
+from .tuning import ParamProfile
+
+# 결과에 영향을 주지 않는 실행 옵션은 캐시 키에서 제외
+_VOLATILE_PARAMS = {'hint', 'num_workers', 'log_progress', 'on_solution', 'stop_event', 'capture_roster', 'precheck'}
+
+
+class SolveCache:
+    """
+    NurseScheduler.optimize 결과를 입력 지문별 JSON 파일로 저장
+    - 키: 간호사/신청 DataFrame 해시 + 기간 + 솔버 파라미터
+    - 보관기간은 생성 시각(파일 수정 시각 = entry['created']) 기준, 적중해도 연장되지 않음
+    - 개수·용량 초과 시 오래 사용하지 않은 항목(접근 시각 기준)부터 삭제
+    - FEASIBLE(시간 제한 종료) 항목은 캐시 해를 힌트로 이어서 풀 수 있음
+    """
+
+    def __init__(self, cache_dir='.schedule_cache', max_entries=200,
+                 max_bytes=200 * 1024 * 1024, max_age_days=30):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _hash_frame(h, df):
+        if df is None or df.empty:
+            h.update(b'<empty>')
+            return
+        h.update('|'.join(map(str, df.columns)).encode('utf-8'))
+        h.update(pd.util.hash_pandas_object(df.astype(str), index=False).values.tobytes())
+
+    @staticmethod
+    def fingerprint(scheduler, **params):
+        h = hashlib.sha256()
+        SolveCache._hash_frame(h, scheduler.df_nurse)
+        SolveCache._hash_frame(h, scheduler.df_requests)
+        h.update(f'{scheduler.start_date}~{scheduler.end_date}'.encode('utf-8'))
+        if getattr(scheduler, 'boundary', None):
+            h.update(json.dumps(scheduler.boundary, sort_keys=True, default=str).encode('utf-8'))
+        key_params = {k: v for k, v in params.items() if k not in _VOLATILE_PARAMS}
+        if isinstance(key_params.get('param_profile'), (str, os.PathLike)):
+            # 프로파일 파일은 경로가 아니라 내용으로 (같은 파일을 다시 튜닝하면 다른 키)
+            key_params['param_profile'] = ParamProfile.load(key_params['param_profile'])
+        # ParamProfile 등 객체는 내용(classes)으로 직렬화해 키가 실행마다 달라지지 않게 함
+        h.update(json.dumps(key_params, sort_keys=True,
+                            default=lambda o: getattr(o, 'classes', str(o))).encode('utf-8'))
+        return h.hexdigest()[:32]
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def get(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        created = os.path.getmtime(path)
+        if time.time() - created > self.max_age:
+            os.remove(path)
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get('created', created) > self.max_age:
+            os.remove(path)
+            return None
+        # 접근 시각만 갱신 (LRU), 수정 시각은 생성 시각으로 유지
+        os.utime(path, (time.time(), created))
+        return entry
+
+    def put(self, key, result, params=None):
+        entry = {
+            'key': key, 'created': time.time(), 'status': result.get('status'),
+            'params': {k: v for k, v in (params or {}).items() if k not in _VOLATILE_PARAMS},
+            'result': result
+        }
+        tmp = self._path(key) + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, default=str)
+        os.replace(tmp, self._path(key))
+        self.evict()
+
+    def evict(self):
+        files = []
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            st = os.stat(path)
+            if now - st.st_mtime > self.max_age:
+                os.remove(path)
+            else:
+                files.append((st.st_atime, st.st_size, path))
+
+        files.sort()  # 오래 사용하지 않은 순
+        total = sum(size for _, size, _ in files)
+        while files and (len(files) > self.max_entries or total > self.max_bytes):
+            _, size, path = files.pop(0)
+            os.remove(path)
+            total -= size
+
+    def optimize(self, scheduler, resume=True, **params):
+        """
+        캐시를 거쳐 scheduler.optimize(**params) 실행
+        - OPTIMAL 적중: 즉시 반환
+        - FEASIBLE 적중 + resume: 캐시 해를 힌트로 이어서 최적화 후 갱신
+        - precheck: 캐시 조회 전에 한 번 점검 (strict면 적중 여부와 관계없이 PrecheckError)
+        """
+        precheck = params.get('precheck', 'warn')
+        report = CapacityPrecheck(scheduler).run() if precheck else None
+        if precheck == 'strict' and report['blocking']:
+            raise PrecheckError(report)
+
+        key = self.fingerprint(scheduler, **params)
+        entry = self.get(key)
+        if entry and (entry['status'] == 'OPTIMAL' or not resume):
+            result = entry['result']
+            result.pop('precheck', None)
+            if report is not None:
+                result['precheck'] = report
+            result['cache'] = {'hit': True, 'key': key, 'resumed': False}
+            return result
+
+        run_params = dict(params, precheck=None)
+        if entry:
+            run_params['hint'] = entry['result']
+        result = scheduler.optimize(**run_params)
+        if report is not None:
+            result['precheck'] = report
+        self.put(key, result, params)
+        result['cache'] = {'hit': entry is not None, 'key': key, 'resumed': entry is not None}
+        return result
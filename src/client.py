@@ -0,0 +1,127 @@
+"""
+src/client.py
+로컬 스케줄링 서비스(src/service.py) 클라이언트
+"""
+import json
+import time
+import urllib.error
+import urllib.request
+
+
+class ServiceClient:
+    """HTTP JSON 클라이언트 (표준 라이브러리만 사용)"""
+
+    def __init__(self, base_url='http://127.0.0.1:8765', timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def _request(self, method, path, body=None):
+        data = json.dumps(body, ensure_ascii=False, default=str).encode('utf-8') if body is not None else None
+        req = urllib.request.Request(self.base_url + path, data=data, method=method,
+                                     headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                return json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read()).get('error')
+            except ValueError:
+                message = None
+            raise Exception(message or f"서비스 오류 ({e.code})")
+        except urllib.error.URLError as e:
+            raise Exception(f"스케줄링 서비스에 연결할 수 없습니다: {e.reason}")
+
+    def health(self):
+        try:
+            return bool(self._request('GET', '/health').get('ok'))
+        except Exception:
+            return False
+
+    @staticmethod
+    def encode_sheets(sheets):
+        """sheets dict → {이름: DataFrame split JSON} (날짜 셀은 문자열로 변환해 그대로 전달)"""
+        encoded = {}
+        for name, df in sheets.items():
+            df = df.copy()
+            for col in df.select_dtypes(include=['datetime', 'datetimetz']).columns:
+                df[col] = df[col].dt.strftime('%Y-%m-%d %H:%M:%S')
+            encoded[name] = df.to_json(orient='split', index=False, force_ascii=False)
+        return encoded
+
+    def submit(self, sheets, start_date, end_date, **params):
+        """작업 접수 → 상태 dict (job_id, state, position)"""
+        from .result import CompactResult
+
+        hint = params.pop('hint', None)
+        if isinstance(hint, CompactResult):
+            hint = hint.to_dict()
+        body = dict(params, sheets=self.encode_sheets(sheets), start_date=start_date, end_date=end_date)
+        if isinstance(hint, dict):
+            body['hint'] = hint
+        elif hint is not None:
+            # 업로드한 이전 근무표(DataFrame)
+            body['hint_table'] = self.encode_sheets({'hint': hint})['hint']
+        return self._request('POST', '/jobs', body)
+
+    def status(self, job_id):
+        return self._request('GET', f'/jobs/{job_id}')
+
+    def jobs(self):
+        return self._request('GET', '/jobs')
+
+    def result(self, job_id):
+        return self._request('GET', f'/jobs/{job_id}/result')
+
+    def cancel(self, job_id):
+        return self._request('POST', f'/jobs/{job_id}/cancel')
+
+
+class RemoteSolve:
+    """
+    서비스 작업을 BackgroundSolve와 같은 방식으로 다루는 어댑터
+    (start / cancel / running / snapshot, kwargs['max_time_seconds'])
+    """
+
+    def __init__(self, client, sheets, start_date, end_date, **kwargs):
+        self.client = client
+        self.sheets = sheets
+        self.start_date = start_date
+        self.end_date = end_date
+        self.kwargs = kwargs
+        self.job_id = None
+        self._last = None
+        self._result = None
+
+    def start(self):
+        self._last = self.client.submit(self.sheets, self.start_date, self.end_date, **self.kwargs)
+        self.job_id = self._last['job_id']
+        self.sheets = None  # 접수 후에는 세션에 원본을 중복 보관하지 않음
+        return self
+
+    def cancel(self):
+        self._last = self.client.cancel(self.job_id)
+
+    @property
+    def running(self):
+        return self._last is not None and self._last['state'] in ('queued', 'running', 'cancelling')
+
+    def snapshot(self):
+        try:
+            self._last = self.client.status(self.job_id)
+        except Exception as e:
+            self._last = {'state': 'error', 'elapsed': 0.0, 'incumbents': [], 'best': None, 'error': str(e)}
+        snap = dict(self._last)
+        snap['result'] = None
+        if snap.get('has_result'):
+            if self._result is None:
+                self._result = self.client.result(self.job_id)
+            snap['result'] = self._result
+        return snap
+
+    def wait(self, poll=1.0):
+        """작업이 끝날 때까지 기다린 뒤 마지막 상태 반환 (CLI·스크립트용)"""
+        while True:
+            snap = self.snapshot()
+            if snap['state'] not in ('queued', 'running', 'cancelling'):
+                return snap
+            time.sleep(poll)
@@ -0,0 +1,123 @@
+"""
+src/diagnostics.py
+최적화 진단 정보 (모델 구성 단계별 시간·변수·제약 수, presolve/탐색 시간, CP-SAT 응답 통계)
+"""
+import json
+import re
+import time
+from contextlib import contextmanager
+
+
+class BuildProfiler:
+    """
+    모델 구성 단계(phase)별 소요 시간과 그 단계에서 추가된 변수·제약 수 기록
+    - 단계 = 제약 계열(HC1~HC5, 경계, 커버리지, 나이트 상한, 공정성 등)
+    - 변수·제약 수는 모델 proto 크기의 증가분
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.phases = []
+
+    def _size(self):
+        proto = self.model.Proto()
+        return len(proto.variables), len(proto.constraints)
+
+    @contextmanager
+    def phase(self, name):
+        v0, c0 = self._size()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            v1, c1 = self._size()
+            self.record(name, time.perf_counter() - t0, v1 - v0, c1 - c0)
+
+    def record(self, name, seconds, variables=0, constraints=0):
+        self.phases.append({'phase': name, 'seconds': round(seconds, 4),
+                            'variables': variables, 'constraints': constraints})
+
+    def to_dict(self):
+        variables, constraints = self._size()
+        return {
+            'phases': list(self.phases),
+            'seconds': round(sum(p['seconds'] for p in self.phases), 4),
+            'variables': variables, 'constraints': constraints
+        }
+
+
+class SearchLog:
+    """
+    CP-SAT 로그 콜백: presolve 시작·탐색 시작·첫 해 시각과 presolve 후 모델 크기만 추출
+    (log_to_stdout=False로 두면 화면 출력 없이 진단 정보만 수집)
+    """
+
+    _PATTERNS = {
+        'presolve_start': re.compile(r'^Starting presolve at ([\d.]+)s'),
+        'search_start': re.compile(r'^Starting search at ([\d.]+)s'),
+        'first_solution': re.compile(r'^#1\s+([\d.]+)s'),
+        'presolved_model': re.compile(r"^#Model\s+[\d.]+s var:([\d']+)/\S+ constraints:([\d']+)/"),
+    }
+
+    def __init__(self):
+        self.values = {}
+
+    def __call__(self, line):
+        for key, pattern in self._PATTERNS.items():
+            if key not in self.values:
+                m = pattern.match(line)
+                if m:
+                    self.values[key] = m.groups()
+                    return
+
+    def to_dict(self):
+        v = self.values
+        info = {}
+        if 'presolve_start' in v and 'search_start' in v:
+            info['presolve_seconds'] = round(float(v['search_start'][0]) - float(v['presolve_start'][0]), 4)
+        if 'search_start' in v:
+            info['search_start'] = float(v['search_start'][0])
+        if 'first_solution' in v:
+            info['first_solution'] = float(v['first_solution'][0])
+        if 'presolved_model' in v:
+            info['presolved_variables'], info['presolved_constraints'] = (
+                int(x.replace("'", '')) for x in v['presolved_model'])
+        return info
+
+
+def response_stats(solver, status):
+    """CP-SAT 응답 통계 (충돌·분기·전파 수, 벽시계/CPU 시간, 목적값·하한·갭)"""
+    r = solver.ResponseProto()
+    stats = {
+        'status': solver.StatusName(status),
+        'conflicts': int(r.num_conflicts), 'branches': int(r.num_branches),
+        'propagations': int(r.num_binary_propagations + r.num_integer_propagations),
+        'restarts': int(r.num_restarts), 'lp_iterations': int(r.num_lp_iterations),
+        'booleans': int(r.num_booleans), 'integers': int(r.num_integers),
+        'wall_time': round(r.wall_time, 4), 'user_time': round(r.user_time, 4),
+        'deterministic_time': round(r.deterministic_time, 4),
+        'solution_info': r.solution_info
+    }
+    if stats['status'] in ('OPTIMAL', 'FEASIBLE'):
+        obj, bound = r.objective_value, r.best_objective_bound
+        stats.update(objective=obj, best_bound=bound, gap=round(abs(obj - bound) / max(1.0, abs(obj)), 6))
+    return stats
+
+
+def export_diagnostics(result, path=None):
+    """결과의 진단 정보(diagnostics + solve_stats)를 모니터링용 JSON으로 (path가 있으면 파일로 저장)"""
+    payload = {
+        'schedule_id': result.get('schedule_id'),
+        'start_date': result.get('start_date'), 'end_date': result.get('end_date'),
+        'total_nurses': result.get('total_nurses'), 'status': result.get('status'),
+        'stop_reason': result.get('stop_reason'),
+        'solve_stats': result.get('solve_stats', {}),
+        'diagnostics': result.get('diagnostics', {})
+    }
+    if 'lexicographic' in result:
+        payload['lexicographic'] = result['lexicographic']
+    text = json.dumps(payload, ensure_ascii=False, indent=2, default=str)
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    return text
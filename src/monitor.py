@@ -0,0 +1,148 @@
+"""
+src/monitor.py
+최적화 진행 모니터링 (해 갱신 콜백 + 백그라운드 실행/취소)
+"""
+import threading
+import time
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+
+class SolutionMonitor(cp_model.CpSolverSolutionCallback):
+    """
+    CP-SAT가 더 좋은 해(incumbent)를 찾을 때마다 진행 정보를 기록하고 on_solution으로 전달
+    info: 목적값, 하한(best bound), 인력 부족 합계, 경과 시간, 해 번호
+          (+ roster_vars가 있으면 'roster': 간호사별 근무 코드 문자열 'DENO...', 중단 후 이어 풀기용)
+
+    stop_rules (모두 선택):
+      - gap: 상대 갭 목표 (예: 0.01 → 목적값과 하한 차이가 1% 이내면 종료)
+      - plateau_seconds: 이 시간 동안 더 좋은 해가 없으면 종료 (감시 스레드에서 확인)
+      - fairness_within: 인력 부족 0 + 근무일수·나이트 편차가 모두 이 값 이하이면 종료
+    """
+
+    def __init__(self, short_vars, on_solution=None, stop_rules=None, count_exprs=None, roster_vars=None):
+        super().__init__()
+        self.short_vars = short_vars
+        self.roster_vars = roster_vars  # 간호사 × 일 × 근무 BoolVar 배열
+        self.on_solution = on_solution
+        self.stop_rules = stop_rules or {}
+        self.count_exprs = count_exprs or {}
+        self.t0 = time.time()
+        self.last_improvement = self.t0
+        self.incumbents = []
+        self.stop_reason = None
+        self.phase = None  # 계층(lexicographic) 최적화 단계 번호
+
+    def on_solution_callback(self):
+        now = time.time()
+        self.last_improvement = now
+        obj, bound = self.ObjectiveValue(), self.BestObjectiveBound()
+        info = {
+            'solution': len(self.incumbents) + 1,
+            'objective': obj,
+            'best_bound': bound,
+            'gap': abs(obj - bound) / max(1.0, abs(obj)),
+            'shortage': sum(self.Value(v) for v in self.short_vars),
+            'elapsed': round(now - self.t0, 2)
+        }
+        if self.phase is not None:
+            info['phase'] = self.phase
+        if self.count_exprs:
+            for key, exprs in self.count_exprs.items():
+                values = [self.Value(e) for e in exprs]
+                info[f'{key}_dev'] = max(values) - min(values) if values else 0
+        self.incumbents.append(dict(info))
+        if self.roster_vars is not None:
+            info['roster'] = self._roster()
+        if self.on_solution:
+            self.on_solution(info)
+
+        rules = self.stop_rules
+        if rules.get('gap') is not None and info['gap'] <= rules['gap']:
+            self._stop('gap')
+        elif rules.get('fairness_within') is not None and info['shortage'] == 0 and all(
+                info.get(f'{key}_dev', 0) <= rules['fairness_within'] for key in self.count_exprs):
+            self._stop('coverage_fairness')
+
+    def _roster(self):
+        n, d, k = self.roster_vars.shape
+        values = np.fromiter((self.Value(v) for v in self.roster_vars.ravel()), dtype=np.int8, count=n * d * k)
+        return [''.join('DENO'[s] for s in row) for row in values.reshape(n, d, k).argmax(axis=2).tolist()]
+
+    def plateau_exceeded(self):
+        """첫 해 이후 plateau_seconds 동안 개선이 없었는지 (감시 스레드에서 주기적으로 호출)"""
+        limit = self.stop_rules.get('plateau_seconds')
+        return bool(limit) and bool(self.incumbents) and time.time() - self.last_improvement >= limit
+
+    def _stop(self, reason):
+        if self.stop_reason is None:
+            self.stop_reason = reason
+        self.StopSearch()
+
+
+class BackgroundSolve:
+    """
+    최적화를 별도 스레드에서 실행 (CP-SAT는 풀이 중 GIL을 놓으므로 UI가 멈추지 않음)
+    - snapshot(): 현재 상태와 지금까지의 incumbent 목록
+    - cancel(): 탐색을 멈추고 그때까지의 최선 해로 결과 생성
+    target: optimize 형태의 함수 (on_solution, stop_event 인자를 받아야 함)
+    """
+
+    def __init__(self, target, *args, **kwargs):
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
+        self.stop_event = threading.Event()
+        self.incumbents = []
+        self.result = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _on_solution(self, info):
+        with self._lock:
+            self.incumbents.append(info)
+
+    def _run(self):
+        try:
+            self.result = self.target(*self.args, on_solution=self._on_solution,
+                                      stop_event=self.stop_event, **self.kwargs)
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self.finished_at = time.time()
+
+    def start(self):
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self.stop_event.set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def snapshot(self):
+        with self._lock:
+            incumbents = list(self.incumbents)
+        if self.running:
+            state = 'cancelling' if self.stop_event.is_set() else 'running'
+        elif self.error:
+            state = 'error'
+        else:
+            state = 'cancelled' if self.stop_event.is_set() else 'done'
+        end = self.finished_at or time.time()
+        return {
+            'state': state,
+            'elapsed': round(end - (self.started_at or end), 1),
+            'incumbents': incumbents,
+            'best': incumbents[-1] if incumbents else None,
+            'result': self.result,
+            'error': self.error
+        }
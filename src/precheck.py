@@ -0,0 +1,121 @@
+"""
+src/precheck.py
+최적화 전 인력 용량 사전 점검 (CP-SAT 실행 없이 수 ms 안에 계산)
+"""
+import time
+
+import numpy as np
+
+from .analytics import base_requirement
+
+
+class PrecheckError(Exception):
+    """strict 모드에서 인력 부족이 확실할 때 (report: CapacityPrecheck.run() 결과)"""
+
+    def __init__(self, report):
+        lines = '\n'.join(f"- {i['message']}" for i in report['issues'] if i['level'] == 'error')
+        super().__init__(f"사전 점검에서 인력 부족이 확인되어 최적화를 시작하지 않았습니다:\n{lines}")
+        self.report = report
+
+    def __reduce__(self):
+        # 솔버 프로세스(서비스·배치)에서 부모로 넘길 때 report로 다시 생성
+        return type(self), (self.report,)
+
+
+class CapacityPrecheck:
+    """
+    간호사·신청 데이터만으로 계산하는 필요 조건 점검 (모두 상한 추정 → 통과해도 해가 충분하다는 보장은 아님)
+    - 일별: 근무 가능 인원(OFF 신청·경계 N→OFF 제외) < 그날 필요 인원(D+E+N) → error
+    - 총량: 최소 OFF(신청·HC4 7일당 1회·N 다음 OFF)를 뺀 근무 가능 인일 < 필요 인일 → error
+    - 나이트: 간호사별 최대 나이트(N→OFF로 기간의 절반, 신청일 제외) 합 < 필요 나이트 → error
+              나이트 상한 여유 합 < 필요 나이트 → warning (상한 초과 페널티 불가피)
+    - 간호사별: 최대 근무일수 < 근무일수 목표 → warning (근무일수 편차 불가피)
+    error가 있으면 blocking (기준 인원 부족이 반드시 발생)
+    """
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+
+    def run(self):
+        t0 = time.perf_counter()
+        sch = self.scheduler
+        N, D = sch.NUM_NURSES, sch.NUM_DAYS
+        req = base_requirement(N)
+        req_total, req_night = sum(req.values()), req['N']
+        limits = sch.limits()
+        prior = sch.boundary or {}
+
+        # 간호사 × 일 근무 불가(OFF 확정) 표시
+        unavailable = np.zeros((N, D), dtype=bool)
+        offs = sch._request_offs()
+        if offs:
+            n_idx, d_idx = np.array(offs).T
+            unavailable[n_idx, d_idx] = True
+        requested = unavailable.copy()
+        if prior and D:
+            last = np.array([h[-1] if len(h) else -1 for h in prior['history']])
+            unavailable[last == 2, 0] = True  # 직전 기간 마지막 날 N → 첫날 OFF
+
+        issues = []
+        available = N - unavailable.sum(axis=0)
+        for d in np.nonzero(available < req_total)[0].tolist():
+            issues.append({
+                'level': 'error', 'check': 'daily', 'date': sch.date_list[d],
+                'required': req_total, 'available': int(available[d]),
+                'message': f"{sch.date_list[d]}: 근무 가능 {int(available[d])}명 < 필요 {req_total}명 "
+                           f"(D{req['D']}·E{req['E']}·N{req['N']})"
+            })
+
+        # 총량: OFF 하한 = max(간호사별 max(신청 OFF, HC4 7일당 1회)의 합, N 다음 OFF 수)
+        off_lower = np.maximum(requested.sum(axis=1), D // 7)
+        night_need = req_night * D
+        min_off = max(int(off_lower.sum()), req_night * max(D - 1, 0))
+        work_capacity, work_need = N * D - min_off, req_total * D
+        if work_need > work_capacity:
+            issues.append({
+                'level': 'error', 'check': 'total', 'required': work_need, 'available': work_capacity,
+                'message': f"기간 전체 근무 가능 {work_capacity}인일 < 필요 {work_need}인일 "
+                           f"(최소 OFF {min_off}인일 제외)"
+            })
+
+        # 나이트: N→OFF 때문에 간호사당 최대 ceil(D/2)회, 신청 OFF일에는 불가
+        night_max = np.minimum((D + 1) // 2, D - requested.sum(axis=1))
+        if night_need > int(night_max.sum()):
+            issues.append({
+                'level': 'error', 'check': 'night', 'required': night_need, 'available': int(night_max.sum()),
+                'message': f"나이트 가능 최대 {int(night_max.sum())}회 < 필요 {night_need}회 (N 다음 OFF 규정)"
+            })
+        prior_nights = np.asarray(prior.get('nights', [0] * N), dtype=int)
+        cap_room = np.clip(limits['night_cap'] - prior_nights, 0, None)
+        cap_room = np.minimum(cap_room, night_max)
+        if night_need > int(cap_room.sum()):
+            issues.append({
+                'level': 'warning', 'check': 'night_cap', 'required': night_need, 'available': int(cap_room.sum()),
+                'message': f"나이트 상한({limits['night_cap']}회) 안에서 가능한 {int(cap_room.sum())}회 < "
+                           f"필요 {night_need}회 → 상한 초과 불가피"
+            })
+
+        # 간호사별 근무일수 상한
+        prior_work = np.asarray(prior.get('work', [0] * N), dtype=int)
+        work_max = D - off_lower + prior_work
+        ids = sch.df_nurse.iloc[:, 0].astype(str).tolist()
+        for n in np.nonzero(work_max < limits['target_work'])[0].tolist():
+            issues.append({
+                'level': 'warning', 'check': 'nurse', 'nurse_id': ids[n],
+                'required': limits['target_work'], 'available': int(work_max[n]),
+                'message': f"{ids[n]}: 최대 근무 {int(work_max[n])}일 < 목표 {limits['target_work']}일 "
+                           f"(OFF 신청 {int(requested[n].sum())}일)"
+            })
+
+        blocking = any(i['level'] == 'error' for i in issues)
+        return {
+            'ok': not issues, 'blocking': blocking, 'issues': issues,
+            'summary': {
+                'nurses': N, 'days': D, 'requirement': req,
+                'min_available': int(available.min()) if D else N,
+                'work_capacity': work_capacity, 'work_need': work_need,
+                'night_capacity': int(night_max.sum()), 'night_cap_capacity': int(cap_room.sum()),
+                'night_need': night_need
+            },
+            'seconds': round(time.perf_counter() - t0, 5)
+        }
@@ -0,0 +1,159 @@
+"""
+src/result.py
+압축 결과 형식 (간호사 × 일 int8 배정 행렬 + 열 단위 배열)
+"""
+import json
+
+import numpy as np
+
+from .analytics import ScheduleAnalytics
+
+SHIFTS = ['D', 'E', 'N', 'OFF']
+# JSON 직렬화 시 근무 코드 한 글자 표기 (OFF → O)
+_LETTERS = 'DENO'
+# 알 수 없는 근무 코드·근무표가 기간보다 짧아 비어 있는 칸 (검증기가 HC1 위반으로 보고)
+UNKNOWN = -1
+_UNKNOWN_CODE = '?'
+
+
+class CompactResult:
+    """
+    NurseScheduler 결과의 압축 표현
+    - matrix: 간호사 × 일 int8 (D=0, E=1, N=2, OFF=3, 알 수 없음=UNKNOWN)
+    - 간호사 메타데이터(nurse_id/name/level)와 날짜별 인원(coverage/new/charge, 일 × D·E·N)은 열 배열
+    - 나머지 결과 키(status, solve_stats 등)는 meta dict
+    - to_dict(): 기존 dict 형식 호환 뷰 (필요할 때만 생성), result['nurses'] 형태 접근도 지원
+    """
+
+    def __init__(self, matrix, nurse_ids, names, levels, dates, day_of_week,
+                 coverage, new_nurses, charge_nurses, meta=None):
+        self.matrix = np.asarray(matrix, dtype=np.int8)
+        self.nurse_ids = list(nurse_ids)
+        self.names = list(names)
+        self.levels = list(levels)
+        self.dates = list(dates)
+        self.day_of_week = list(day_of_week)
+        self.coverage = np.asarray(coverage, dtype=np.int32).reshape(-1, 3)
+        self.new_nurses = np.asarray(new_nurses, dtype=np.int32).reshape(-1, 3)
+        self.charge_nurses = np.asarray(charge_nurses, dtype=np.int32).reshape(-1, 3)
+        self.meta = dict(meta or {})
+        self._analytics = None
+
+    @classmethod
+    def from_matrix(cls, matrix, nurse_ids, names, levels, dates, day_of_week, meta=None):
+        """배정 행렬에서 날짜별 인원 배열을 계산해 생성 (집계는 ScheduleAnalytics 한 번)"""
+        analytics = ScheduleAnalytics(matrix, levels, dates)
+        compact = cls(analytics.matrix, nurse_ids, names, levels, dates, day_of_week,
+                      analytics.coverage, analytics.new_nurses, analytics.charge_nurses, meta)
+        compact._analytics = analytics
+        return compact
+
+    @classmethod
+    def from_dict(cls, result):
+        if isinstance(result, cls):
+            return result
+        nurses, dates = result['nurses'], result['dates']
+        codes = {s: i for i, s in enumerate(SHIFTS)}
+        # 모르는 코드·빈 칸은 UNKNOWN, 기간보다 긴 근무표는 기간까지만
+        matrix = np.full((len(nurses), len(dates)), UNKNOWN, dtype=np.int8)
+        for n, nurse in enumerate(nurses):
+            row = [codes.get(s, UNKNOWN) for s in nurse['schedule'][:len(dates)]]
+            matrix[n, :len(row)] = row
+        per_date = lambda key: [[d[key][s] for s in 'DEN'] for d in dates]
+        meta = {k: v for k, v in result.items() if k not in ('nurses', 'dates')}
+        return cls(matrix, [n['nurse_id'] for n in nurses], [n['name'] for n in nurses],
+                   [n['level'] for n in nurses], [d['date'] for d in dates], [d['day_of_week'] for d in dates],
+                   per_date('coverage'), per_date('new_nurses'), per_date('charge_nurses'), meta)
+
+    @property
+    def analytics(self):
+        """간호사별·날짜별 집계 (처음 접근할 때 한 번 계산)"""
+        if self._analytics is None:
+            self._analytics = ScheduleAnalytics(self.matrix, self.levels, self.dates)
+        return self._analytics
+
+    # --- dict 호환 뷰 ---
+
+    def nurse_records(self):
+        work = self.analytics.work_days.tolist()
+        nights = self.analytics.night_count.tolist()
+        offs = self.analytics.off_count.tolist()
+        return [{
+            "nurse_id": nid, "name": name, "level": level,
+            "schedule": [SHIFTS[s] if s != UNKNOWN else _UNKNOWN_CODE for s in row], "work_days": w,
+            "night_count": nc, "off_count": off
+        } for nid, name, level, row, w, nc, off in zip(self.nurse_ids, self.names, self.levels,
+                                                       self.matrix.tolist(), work, nights, offs)]
+
+    def date_records(self):
+        as_dict = lambda row: dict(zip('DEN', row))
+        return [{
+            "date": d, "day_of_week": dow,
+            "coverage": as_dict(cov), "new_nurses": as_dict(new), "charge_nurses": as_dict(charge)
+        } for d, dow, cov, new, charge in zip(self.dates, self.day_of_week, self.coverage.tolist(),
+                                              self.new_nurses.tolist(), self.charge_nurses.tolist())]
+
+    def to_dict(self):
+        result = dict(self.meta)
+        result['nurses'] = self.nurse_records()
+        result['dates'] = self.date_records()
+        return result
+
+    def __getitem__(self, key):
+        if key == 'nurses':
+            return self.nurse_records()
+        if key == 'dates':
+            return self.date_records()
+        return self.meta[key]
+
+    def __contains__(self, key):
+        return key in ('nurses', 'dates') or key in self.meta
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    @property
+    def nbytes(self):
+        """배열 부분 메모리 (바이트)"""
+        return self.matrix.nbytes + self.coverage.nbytes + self.new_nurses.nbytes + self.charge_nurses.nbytes
+
+    # --- 직렬화 ---
+
+    def to_json(self):
+        """근무는 간호사별 한 글자 코드 문자열 (예: 'DDENOO...')"""
+        return json.dumps({
+            'format': 'compact-v1', 'meta': self.meta,
+            'nurse_ids': self.nurse_ids, 'names': self.names, 'levels': self.levels,
+            'dates': self.dates, 'day_of_week': self.day_of_week,
+            'roster': [''.join(_LETTERS[s] if s != UNKNOWN else _UNKNOWN_CODE for s in row)
+                       for row in self.matrix.tolist()],
+            'coverage': self.coverage.tolist(), 'new_nurses': self.new_nurses.tolist(),
+            'charge_nurses': self.charge_nurses.tolist()
+        }, ensure_ascii=False, default=str)
+
+    @classmethod
+    def from_json(cls, text):
+        data = json.loads(text)
+        matrix = np.array([[_LETTERS.find(c) for c in row] for row in data['roster']], dtype=np.int8)
+        matrix = matrix.reshape(len(data['roster']), len(data['dates']))
+        return cls(matrix, data['nurse_ids'], data['names'], data['levels'], data['dates'], data['day_of_week'],
+                   data['coverage'], data['new_nurses'], data['charge_nurses'], data['meta'])
+
+    def save_npz(self, path):
+        np.savez_compressed(
+            path, matrix=self.matrix, coverage=self.coverage, new_nurses=self.new_nurses,
+            charge_nurses=self.charge_nurses,
+            nurse_ids=np.array(self.nurse_ids, dtype=str), names=np.array(self.names, dtype=str),
+            levels=np.array(self.levels, dtype=str), dates=np.array(self.dates, dtype=str),
+            day_of_week=np.array(self.day_of_week, dtype=str),
+            meta=np.array(json.dumps(self.meta, ensure_ascii=False, default=str))
+        )
+        return path
+
+    @classmethod
+    def load_npz(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['matrix'], data['nurse_ids'].tolist(), data['names'].tolist(),
+                       data['levels'].tolist(), data['dates'].tolist(), data['day_of_week'].tolist(),
+                       data['coverage'], data['new_nurses'], data['charge_nurses'],
+                       json.loads(str(data['meta'])))
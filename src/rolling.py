@@ -0,0 +1,204 @@
+"""
+src/rolling.py
+롤링 호라이즌 스케줄링 (분기·연간 근무표를 겹치는 구간으로 나눠 순차 최적화)
+"""
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from .precheck import CapacityPrecheck
+from .scheduler import NurseScheduler
+
+
+class RollingHorizonScheduler:
+    """
+    긴 기간을 window_days 길이 구간으로 나눠 차례로 최적화
+    - 구간마다 앞쪽 commit_days 일만 확정하고 다음 구간은 확정일 다음 날부터 시작
+    - 확정된 근무의 경계 상태(마지막 근무, 연속 근무일수, 누적 나이트·근무일수)를
+      다음 구간 모델에 넘겨 월 경계의 N->OFF, N-OFF-D, 7일 창(HC4)을 그대로 지킴
+    - 확정되지 않은 겹침 구간은 다음 구간의 웜스타트 힌트로 사용
+    - 결과는 NurseScheduler._format_result 형식의 dict 하나로 합쳐 반환
+    """
+
+    def __init__(self, sheets, start_date, end_date, window_days=28, commit_days=14):
+        if not 0 < commit_days <= window_days:
+            raise Exception("확정 일수는 1 이상, 구간 길이 이하여야 합니다.")
+        self.sheets = sheets
+        self.start_date = start_date
+        self.end_date = end_date
+        self.window_days = window_days
+        self.commit_days = commit_days
+
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
+        self.date_list = [(start + timedelta(days=i)).strftime("%Y-%m-%d")
+                          for i in range((end - start).days + 1)]
+        self.NUM_DAYS = len(self.date_list)
+
+    def windows(self):
+        """[(구간 시작, 구간 끝, 확정 끝)] 날짜 인덱스 (끝 포함)"""
+        spans = []
+        pos = 0
+        while pos < self.NUM_DAYS:
+            end = min(pos + self.window_days, self.NUM_DAYS) - 1
+            commit = end if end == self.NUM_DAYS - 1 else pos + self.commit_days - 1
+            spans.append((pos, end, commit))
+            pos = commit + 1
+        return spans
+
+    @staticmethod
+    def boundary_state(matrix):
+        """
+        확정된 근무 코드 행렬(간호사 × 일, D=0 E=1 N=2 OFF=3) → 다음 구간의 경계 상태
+        """
+        num_nurses, days = matrix.shape
+        work = matrix < 3
+        # 끝에서부터 연속 근무일수: 마지막 OFF 이후 일수
+        last_off = np.where((~work).any(axis=1), days - 1 - np.argmax((~work)[:, ::-1], axis=1), -1)
+        return {
+            'history': matrix[:, -2:].tolist(),
+            'consecutive': (days - 1 - last_off).tolist(),
+            'nights': (matrix == 2).sum(axis=1).tolist(),
+            'work': work.sum(axis=1).tolist(),
+            'days': int(days)
+        }
+
+    def precheck(self):
+        """
+        구간별 인력 용량 사전 점검 (구간 모델과 같은 기간·한도 기준, 솔버 실행 없음)
+        - 경계 상태는 앞 구간을 풀어야 정해지므로 두 번째 구간부터는 누적 0인 경계 상태로 점검
+          → 나이트 상한이 구간 모델처럼 구간 길이에 비례 (28일당 6회)
+        - 겹치는 구간에서 같은 날짜의 일별 부족은 한 번만 기록
+        반환: CapacityPrecheck.run()과 같은 형식 + issues[*]['window'], windows(구간별 요약)
+        """
+        t0 = time.perf_counter()
+        reports = []
+        for idx, (lo, hi, _) in enumerate(self.windows()):
+            scheduler = NurseScheduler(self.sheets, self.date_list[lo], self.date_list[hi])
+            if idx > 0:
+                N = scheduler.NUM_NURSES
+                scheduler.boundary = {'history': [[] for _ in range(N)], 'consecutive': [0] * N,
+                                      'nights': [0] * N, 'work': [0] * N, 'days': 0}
+            reports.append(([self.date_list[lo], self.date_list[hi]], CapacityPrecheck(scheduler).run()))
+        return dict(self._merge_precheck(reports), seconds=round(time.perf_counter() - t0, 5))
+
+    @staticmethod
+    def _merge_precheck(reports):
+        """
+        구간별 점검 결과 [([구간 시작, 구간 끝], CapacityPrecheck 보고서)] → 보고서 하나
+        - 겹치는 구간에서 같은 날짜의 일별 부족은 한 번만, 그 밖의 항목은 메시지 앞에 구간 표시
+        """
+        issues, windows, seen = [], [], set()
+        for span, report in reports:
+            for issue in report['issues']:
+                key = ('daily', issue['date']) if issue['check'] == 'daily' else None
+                if key in seen:
+                    continue
+                issue = dict(issue, window=span)
+                if key:
+                    seen.add(key)
+                else:
+                    issue['message'] = f"[{span[0]} ~ {span[1]}] {issue['message']}"
+                issues.append(issue)
+            windows.append(dict(report['summary'], start=span[0], end=span[1], blocking=report['blocking']))
+        return {
+            'ok': not issues, 'blocking': any(i['level'] == 'error' for i in issues), 'issues': issues,
+            'windows': windows
+        }
+
+    def optimize(self, max_time_seconds=60, num_workers=8, log_progress=False, fairness='quadratic',
+                 on_window=None, stop_event=None, **kwargs):
+        """
+        max_time_seconds: 구간 하나당 최적화 시간
+        on_window: 구간을 확정할 때마다 호출 ({'index', 'start', 'end', 'commit_end', 'status', 'time'})
+        stop_event: 취소되면 그때까지 확정한 구간(풀던 구간에서 찾은 해가 있으면 그 구간 전체)까지의
+                    근무표를 status FEASIBLE, result['rolling']['partial'] = True로 반환
+                    (확정한 구간이 하나도 없으면 예외)
+        사전 점검(precheck)은 구간마다 실행해 result['precheck']에 rolling.precheck()와 같은 형식으로 병합
+        나머지 인자는 NurseScheduler.optimize에 그대로 전달
+        """
+        t_start = time.time()
+        committed = None  # 간호사 × 확정일 근무 코드
+        prev_result = None
+        window_log = []
+        window_diag = []
+        reports = []
+        first = None
+        cancelled = False
+
+        for idx, (lo, hi, commit) in enumerate(self.windows()):
+            if stop_event is not None and stop_event.is_set():
+                cancelled = True
+                break
+            boundary = self.boundary_state(committed) if committed is not None else None
+            scheduler = NurseScheduler(self.sheets, self.date_list[lo], self.date_list[hi], boundary)
+            t0 = time.time()
+            try:
+                result = scheduler.optimize(max_time_seconds=max_time_seconds, num_workers=num_workers,
+                                            log_progress=log_progress, hint=prev_result, fairness=fairness,
+                                            stop_event=stop_event, **kwargs)
+            except Exception as e:
+                if stop_event is not None and stop_event.is_set():
+                    # 이 구간에서 해를 찾기 전에 취소 → 앞 구간까지만
+                    cancelled = True
+                    break
+                raise Exception(f"{self.date_list[lo]} ~ {self.date_list[hi]} 구간: {e}")
+
+            # 구간 안에서 취소되면 다음 구간이 없으므로 찾은 해를 구간 끝까지 확정
+            cancelled = bool(result.get('solve_stats', {}).get('cancelled'))
+            if cancelled:
+                commit = hi
+            shift_idx = {s: i for i, s in enumerate(scheduler.SHIFTS)}
+            keep = commit - lo + 1
+            block = np.array([[shift_idx[s] for s in nurse['schedule'][:keep]] for nurse in result['nurses']],
+                             dtype=np.int8)
+            committed = block if committed is None else np.hstack([committed, block])
+            if first is None:
+                first = result
+                first['dates'] = result['dates'][:keep]
+            else:
+                first['dates'].extend(result['dates'][:keep])
+            prev_result = result
+            if result.get('precheck'):
+                reports.append(([self.date_list[lo], self.date_list[hi]], result['precheck']))
+            window_diag.append(dict(result.get('diagnostics', {}), start=self.date_list[lo], end=self.date_list[hi]))
+
+            info = {'index': idx, 'start': self.date_list[lo], 'end': self.date_list[hi],
+                    'commit_end': self.date_list[commit], 'status': result['status'],
+                    'stop_reason': result.get('stop_reason'), 'time': round(time.time() - t0, 3)}
+            window_log.append(info)
+            if on_window:
+                on_window(info)
+            if cancelled:
+                break
+
+        if committed is None:
+            raise Exception("최적화가 취소되었습니다. (확정된 구간 없음)")
+
+        # 확정된 구간들을 하나의 결과로 병합
+        shifts = scheduler.SHIFTS
+        num_days = committed.shape[1]
+        for n_idx, nurse in enumerate(first['nurses']):
+            row = committed[n_idx]
+            nurse['schedule'] = [shifts[s] for s in row]
+            nurse['work_days'] = int((row < 3).sum())
+            nurse['night_count'] = int((row == 2).sum())
+            nurse['off_count'] = num_days - nurse['work_days']
+        first['start_date'] = self.start_date
+        first['end_date'] = self.date_list[num_days - 1]
+        optimal = not cancelled and all(w['status'] == 'OPTIMAL' for w in window_log)
+        first['status'] = 'OPTIMAL' if optimal else 'FEASIBLE'
+        first['optimization_time'] = max_time_seconds * len(window_log)
+        first['stop_reason'] = 'cancelled' if cancelled else ('optimal' if optimal else 'time_limit')
+        first['solve_stats'] = {'fairness': fairness, 'wall_time': round(time.time() - t_start, 3)}
+        if cancelled:
+            first['solve_stats']['cancelled'] = True
+        if reports:
+            first['precheck'] = self._merge_precheck(reports)
+        # 구간별 진단 정보 (구성 단계·CP-SAT 통계는 구간마다 따로)
+        first['diagnostics'] = {'windows': window_diag}
+        first['rolling'] = {'window_days': self.window_days, 'commit_days': self.commit_days,
+                            'windows': window_log, 'partial': num_days < self.NUM_DAYS,
+                            'planned_end': self.end_date}
+        return first
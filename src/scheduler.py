@@ -2,12 +2,56 @@
 src/scheduler.py
 규정 준수 최우선 스케줄러 (Strict Safety First)
 """
+import threading
+import time
+import numpy as np
 import pandas as pd
 from ortools.sat.python import cp_model
 from datetime import datetime, timedelta
 
+from .analytics import base_requirement
+from .diagnostics import BuildProfiler, SearchLog, response_stats
+from .monitor import SolutionMonitor
+from .precheck import CapacityPrecheck, PrecheckError
+from .result import CompactResult
+from .tuning import ParamProfile, apply_params
+
+
+class InfeasibleScheduleError(Exception):
+    """
+    하드 제약끼리 충돌해 해가 없음
+    conflicts: 충돌하는 최소 제약 묶음 [{'rule', 'nurse_id', 'name', 'date', 'description'}]
+    """
+
+    def __init__(self, message, conflicts):
+        super().__init__(message)
+        self.conflicts = conflicts
+
+    def __reduce__(self):
+        # 솔버 프로세스(서비스·배치)에서 부모로 넘길 때 conflicts 유지
+        return type(self), (str(self), self.conflicts)
+
+
+# 가정 리터럴 묶음 → 설명 문구
+_RULE_TEXT = {
+    'HC2': "근무 간격 규정 (E→D, N→D/E 금지, N 다음 OFF)",
+    'HC3': "30시간 휴식 (N-OFF-D 금지)",
+    'HC4': "최대 6일 연속 근무",
+    'HC5': "휴가 신청 OFF",
+    'boundary': "직전 기간 근무와의 경계 규정",
+    'change': "긴급 변경 배정",
+    'published': "재최적화 구간 밖 게시 근무 고정",
+}
+
 class NurseScheduler:
-    def __init__(self, sheets, start_date, end_date):
+    def __init__(self, sheets, start_date, end_date, boundary=None):
+        """
+        boundary: 직전 기간에서 이어받는 경계 상태 (롤링 호라이즌·월 경계)
+                  {'history': 간호사별 직전 근무 코드 목록(마지막이 시작 전날),
+                   'consecutive': 시작 전날까지 연속 근무일수, 'nights': 누적 나이트 수,
+                   'work': 누적 근무일수, 'days': 누적 일수}
+        """
+        t0 = time.perf_counter()
         self.df_nurse = sheets.get('nurses') if 'nurses' in sheets else sheets.get('Nurse')
         self.df_requests = sheets.get('requests') if 'requests' in sheets else sheets.get('Requests', pd.DataFrame())
         
@@ -22,170 +66,783 @@ class NurseScheduler:
         self.NUM_NURSES = len(self.df_nurse)
         self.SHIFTS = ['D', 'E', 'N', 'OFF'] 
 
-    def optimize(self, max_time_seconds=300):
+        # 모델 구성 전에 한 번만 계산하는 색인 정보
+        self.date_index = {d: i for i, d in enumerate(self.date_list)}
+        levels = self.df_nurse['Level'] if 'Level' in self.df_nurse.columns else pd.Series(['Regular'] * self.NUM_NURSES)
+        self.levels = [self._level_category(v) for v in levels.fillna('Regular')]
+        self.charge_mask = np.array([lv == 'Charge' for lv in self.levels], dtype=bool)
+        self.new_mask = np.array([lv == 'New' for lv in self.levels], dtype=bool)
+        self._offs = None
+        self.boundary = boundary
+        self._input_seconds = time.perf_counter() - t0
+
+    FAIRNESS_MODES = ['quadratic', 'abs', 'minmax', 'pwl']
+    # weighted: 커버리지·나이트 초과·공정성 가중합 한 번 / lexicographic: 커버리지·나이트 초과 → 공정성 2단계
+    OBJECTIVE_MODES = ['weighted', 'lexicographic']
+
+    # 병동 규모별 근무조 최소 인원 (대시보드 부족 집계와 같은 기준)
+    base_requirement = staticmethod(base_requirement)
+
+    def _build_model(self, fairness='quadratic', guards=None):
+        """
+        HC1~HC5 하드 제약 + Soft 페널티로 CP-SAT 모델 구성
+        guards: dict를 넘기면 하드 제약 묶음마다 가정 리터럴을 만들어 OnlyEnforceIf로 연결
+                (키: ('HC2'|'HC3'|'HC4'|'boundary', n) / ('HC5', n, d)) → 해가 없을 때 충돌 원인 추출용
+        """
+        if fairness not in self.FAIRNESS_MODES:
+            raise Exception(f"지원하지 않는 공정성 모드입니다: {fairness}")
         model = cp_model.CpModel()
-        shifts = {}
-
-        # 0. 간호사 특성
-        charge_indices = []
-        new_indices = []
-        for idx, row in self.df_nurse.iterrows():
-            level = str(row.get('Level', '')).lower()
-            if 'charge' in level or '책임' in level: charge_indices.append(idx)
-            if 'new' in level or '신규' in level: new_indices.append(idx)
-
-        # 1. 변수 생성
-        for n in range(self.NUM_NURSES):
-            for d in range(self.NUM_DAYS):
-                for s_idx, _ in enumerate(self.SHIFTS):
-                    shifts[(n, d, s_idx)] = model.NewBoolVar(f'shift_{n}_{d}_{s_idx}')
+        N, D = self.NUM_NURSES, self.NUM_DAYS
+        Sum = cp_model.LinearExpr.Sum
+        # 단계별 시간·변수·제약 수 (result['diagnostics']['build'])
+        profiler = self.build_profiler = BuildProfiler(model)
+        profiler.record('input', self._input_seconds)
+
+        def assume(key):
+            # 가정 리터럴 (guards가 없으면 빈 목록 → 제약을 그대로 추가)
+            if guards is None:
+                return []
+            if key not in guards:
+                guards[key] = model.NewBoolVar('assume_' + '_'.join(map(str, key)))
+            return [guards[key]]
+
+        # 1. 변수 생성: shifts[n, d, s] (n×d×4 배열, shifts[(n, d, s)] 형태 접근도 그대로 사용 가능)
+        with profiler.phase('variables'):
+            shifts = np.empty((N, D, 4), dtype=object)
+            for n in range(N):
+                for d in range(D):
+                    for s_idx in range(4):
+                        shifts[n, d, s_idx] = model.NewBoolVar(f'shift_{n}_{d}_{s_idx}')
+            off = shifts[:, :, 3]
+            # 변수 인덱스 배열 (HC1~HC4·커버리지는 제약 래퍼 없이 proto에 일괄 추가)
+            idx = np.array([v.Index() for v in shifts.ravel()], dtype=np.int64).reshape(N, D, 4)
+            neg = -idx - 1  # 부정 리터럴 (CP-SAT proto 표기)
+            proto = model.Proto()
+
+        def guard_index(key):
+            return [lit.Index() for lit in assume(key)]
 
         # [HC1] 하루 1근무
-        for n in range(self.NUM_NURSES):
-            for d in range(self.NUM_DAYS):
-                model.Add(sum(shifts[(n, d, s)] for s in range(4)) == 1)
-
-        # [HC2] 근무 간격 (8시간 휴식 & N-OFF)
-        for n in range(self.NUM_NURSES):
-            for d in range(self.NUM_DAYS - 1):
-                model.Add(shifts[(n, d, 1)] + shifts[(n, d+1, 0)] <= 1) # E->D
-                model.Add(shifts[(n, d, 2)] + shifts[(n, d+1, 0)] <= 1) # N->D
-                model.Add(shifts[(n, d, 2)] + shifts[(n, d+1, 1)] <= 1) # N->E
-                model.AddImplication(shifts[(n, d, 2)], shifts[(n, d+1, 3)]) # N->OFF
+        with profiler.phase('HC1'):
+            self._add_bool_constraints(proto, 'exactly_one', idx.reshape(N * D, 4))
+
+        # [HC2] 근무 간격 (8시간 휴식 & N-OFF): E->D, N->D, N->E 금지, N->OFF
+        with profiler.phase('HC2'):
+            cur, nxt = idx[:, :-1], (idx[:, 1:], neg[:, 1:])
+            enforce = np.stack([cur[:, :, 1], cur[:, :, 2], cur[:, :, 2], cur[:, :, 2]], axis=2)
+            implied = np.stack([nxt[1][:, :, 0], nxt[1][:, :, 0], nxt[1][:, :, 1], nxt[0][:, :, 3]], axis=2)
+            for n in range(N):
+                self._add_bool_constraints(proto, 'bool_or', implied[n].reshape(-1, 1),
+                                           enforce[n].ravel(), guard_index(('HC2', n)))
 
         # [HC3] 30시간 휴식 (N-OFF-D 금지)
-        for n in range(self.NUM_NURSES):
-            for d in range(self.NUM_DAYS - 2):
-                model.Add(shifts[(n, d, 2)] + shifts[(n, d+2, 0)] <= 1)
+        with profiler.phase('HC3'):
+            for n in range(N):
+                self._add_bool_constraints(proto, 'bool_or', neg[n, 2:, 0].reshape(-1, 1),
+                                           idx[n, :-2, 2], guard_index(('HC3', n)))
 
-        # [HC4] 최대 6일 연속 근무
-        for n in range(self.NUM_NURSES):
-            for d in range(self.NUM_DAYS - 6):
-                model.Add(sum(shifts[(n, d+k, 3)] for k in range(7)) >= 1)
+        # [HC4] 최대 6일 연속 근무 (7일 창마다 OFF 하나 이상)
+        with profiler.phase('HC4'):
+            if D >= 7:
+                windows = np.lib.stride_tricks.sliding_window_view(idx[:, :, 3], 7, axis=1)
+                for n in range(N):
+                    self._add_bool_constraints(proto, 'bool_or', windows[n], guard=guard_index(('HC4', n)))
 
         # [HC5] 휴가 신청
-        if not self.df_requests.empty:
-            req_df = self.df_requests.copy()
-            req_df.columns = [c.lower() for c in req_df.columns]
-            nurse_ids = self.df_nurse.iloc[:, 0].astype(str).tolist()
-            id_map = {nid: i for i, nid in enumerate(nurse_ids)}
-            for _, row in req_df.iterrows():
-                nid_col = next((c for c in row.index if 'id' in c and 'req' not in c), None)
-                date_col = next((c for c in row.index if 'date' in c), None)
-                type_col = next((c for c in row.index if 'type' in c), None)
-                if nid_col and date_col and type_col:
-                    nid = str(row[nid_col])
-                    r_date = str(row[date_col]).split(' ')[0]
-                    r_type = str(row[type_col])
-                    if nid in id_map and r_date in self.date_list:
-                        n_idx = id_map[nid]
-                        d_idx = self.date_list.index(r_date)
-                        if r_type == 'OFF':
-                            model.Add(shifts[(n_idx, d_idx, 3)] == 1)
+        with profiler.phase('HC5'):
+            for n_idx, d_idx in self._request_offs():
+                model.Add(off[n_idx, d_idx] == 1).OnlyEnforceIf(assume(('HC5', n_idx, d_idx)))
+
+        # 경계 상태: 직전 기간 마지막 근무와 이어지는 HC2~HC4
+        prior = self.boundary or {}
+        if prior:
+            with profiler.phase('boundary'):
+                for n in range(N):
+                    lits = assume(('boundary', n))
+                    hist = list(prior['history'][n])
+                    last = hist[-1] if hist else None
+                    cts = []
+                    if last == 1:
+                        cts.append(model.Add(shifts[n, 0, 0] == 0))  # E->D
+                    if last == 2:
+                        cts.append(model.Add(off[n, 0] == 1))  # N->OFF (N->D, N->E 포함)
+                        if D > 1:
+                            cts.append(model.Add(shifts[n, 1, 0] == 0))  # N-OFF-D
+                    if len(hist) > 1 and hist[-2] == 2:
+                        cts.append(model.Add(shifts[n, 0, 0] == 0))  # N-OFF-D
+                    # 이미 c일 연속 근무 중이면 앞쪽 7-c일 안에 OFF가 있어야 함
+                    c = min(int(prior['consecutive'][n]), 6)
+                    if c > 0 and 7 - c <= D:
+                        cts.append(model.AddBoolOr(off[n, :7 - c].tolist()))
+                    if lits:
+                        for ct in cts:
+                            ct.OnlyEnforceIf(lits)
 
         # Soft Constraints
         penalties = []
         
-        # (1) 커버리지 부족 (Soft)
-        if self.NUM_NURSES < 10: base_req = {'D': 2, 'E': 2, 'N': 1}
-        elif self.NUM_NURSES < 15: base_req = {'D': 2, 'E': 2, 'N': 2}
-        else: base_req = {'D': 3, 'E': 3, 'N': 2}
-
-        for d in range(self.NUM_DAYS):
-            for s_idx, s_char in enumerate(['D', 'E', 'N']):
-                req_val = base_req[s_char]
-                actual = sum(shifts[(n, d, s_idx)] for n in range(self.NUM_NURSES))
-                short = model.NewIntVar(0, self.NUM_NURSES, f'short_{d}_{s_char}')
-                model.Add(short >= req_val - actual)
-                penalties.append(short * 1000)
+        # (1) 커버리지 부족 (Soft) — 부족 변수는 진행 모니터링용으로 보관
+        base_req = self.base_requirement(N)
+        self.short_vars = []
+
+        with profiler.phase('coverage'):
+            for d in range(D):
+                for s_idx, s_char in enumerate(['D', 'E', 'N']):
+                    short = model.NewIntVar(0, N, f'short_{d}_{s_char}')
+                    # short >= 기준 - 투입 인원 ⇔ 투입 인원 + short >= 기준
+                    ct = proto.constraints.add().linear
+                    ct.vars.extend(idx[:, d, s_idx].tolist() + [short.Index()])
+                    ct.coeffs.extend([1] * (N + 1))
+                    ct.domain.extend([base_req[s_char], cp_model.INT_MAX])
+                    penalties.append(short * 1000)
+                    self.short_vars.append(short)
 
         # (2) 나이트 6회 초과 방지
-        target_n = int(self.NUM_DAYS / 5)
-        for n in range(self.NUM_NURSES):
-            night_days = sum(shifts[(n, d, 2)] for d in range(self.NUM_DAYS))
-            excess = model.NewIntVar(0, self.NUM_DAYS, f'ex_{n}')
-            model.AddMaxEquality(excess, [night_days - 6, model.NewConstant(0)])
-            penalties.append(excess * 5000)
-            
-            diff_n = model.NewIntVar(-self.NUM_DAYS, self.NUM_DAYS, f'nd_{n}')
-            model.Add(diff_n == night_days - target_n)
-            sq_n = model.NewIntVar(0, self.NUM_DAYS**2, f'nd_sq_{n}')
-            model.AddMultiplicationEquality(sq_n, [diff_n, diff_n])
-            penalties.append(sq_n * 20)
+        # 경계 상태가 있으면 누적 횟수 기준 (상한은 28일당 6회 비율로 확대)
+        limits = self.limits()
+        span, night_cap, target_n = limits['span'], limits['night_cap'], limits['target_nights']
+        prior_nights = prior.get('nights', [0] * N)
+        prior_work = prior.get('work', [0] * N)
+        with profiler.phase('night_cap'):
+            zero = model.NewConstant(0)
+            night_list = [Sum(shifts[n, :, 2].tolist()) + int(prior_nights[n]) for n in range(N)]
+            for n in range(N):
+                excess = model.NewIntVar(0, span, f'ex_{n}')
+                model.AddMaxEquality(excess, [night_list[n] - night_cap, zero])
+                penalties.append(excess * 5000)
 
         # (3) 근무일수 평준화
-        target_work = int(self.NUM_DAYS * 5 / 7)
-        for n in range(self.NUM_NURSES):
-            work_days = sum(shifts[(n, d, s)] for d in range(self.NUM_DAYS) for s in range(3))
-            diff = model.NewIntVar(-self.NUM_DAYS, self.NUM_DAYS, f'wd_{n}')
-            model.Add(diff == work_days - target_work)
-            sq_diff = model.NewIntVar(0, self.NUM_DAYS**2, f'wd_sq_{n}')
-            model.AddMultiplicationEquality(sq_diff, [diff, diff])
-            penalties.append(sq_diff * 10)
-
-        model.Minimize(sum(penalties))
-        
+        target_work = limits['target_work']
+        work_list = [Sum(shifts[n, :, :3].ravel().tolist()) + int(prior_work[n]) for n in range(N)]
+        self.count_exprs = {'work': work_list, 'night': night_list}
+
+        with profiler.phase('fairness'):
+            penalties += self._fairness_penalties(model, night_list, target_n, 20, 'nd', fairness, span)
+            penalties += self._fairness_penalties(model, work_list, target_work, 10, 'wd', fairness, span)
+
+        # 목적식 항 묶음 (lexicographic 모드에서 단계별 목적식으로 사용)
+        n_cov = len(self.short_vars)
+        self.objective_terms = {
+            'coverage': penalties[:n_cov], 'night_excess': penalties[n_cov:n_cov + N],
+            'fairness': penalties[n_cov + N:]
+        }
+        return model, shifts, penalties
+
+    @staticmethod
+    def _add_bool_constraints(proto, kind, literals, enforcement=None, guard=()):
+        """
+        불리언 제약을 모델 proto에 일괄 추가 (제약마다 Python 래퍼 객체를 만들지 않음)
+        kind: 'exactly_one' | 'bool_or', literals: 제약 × 리터럴 인덱스 배열 (부정은 -i-1)
+        enforcement: 제약별 조건 리터럴 (AddImplication의 앞쪽), guard: 모든 제약에 붙일 가정 리터럴
+        """
+        rows = np.asarray(literals).tolist()
+        conds = [[e] + list(guard) for e in np.asarray(enforcement).tolist()] if enforcement is not None \
+            else [list(guard)] * len(rows)
+        cts = proto.constraints
+        for row, cond in zip(rows, conds):
+            ct = cts.add()
+            if cond:
+                ct.enforcement_literal.extend(cond)
+            getattr(ct, kind).literals.extend(row)
+
+    def limits(self):
+        """
+        누적 기준 한도 (경계 상태가 있으면 직전 기간 포함)
+        span: 누적 일수, night_cap: 나이트 상한(28일당 6회 비율), target_nights/target_work: 공정성 목표
+        """
+        prior = self.boundary or {}
+        span = self.NUM_DAYS + prior.get('days', 0)
+        return {
+            'span': span,
+            'night_cap': max(6, round(6 * span / 28)) if prior else 6,
+            'target_nights': int(span / 5),
+            'target_work': int(span * 5 / 7)
+        }
+
+    def _fairness_penalties(self, model, counts, target, weight, prefix, mode, span=None):
+        """
+        간호사별 횟수(counts)의 목표 대비 편차 페널티
+        - quadratic: 편차 제곱 (AddMultiplicationEquality, 기존 방식)
+        - abs: 편차 절댓값 (선형)
+        - minmax: 최대-최소 격차 × 인원수 (선형, 간호사별 항 없음)
+        - pwl: 정수점에서 제곱과 같은 볼록 구간선형 근사 (선형, 가능한 최대 편차까지 구간 생성)
+        span: 횟수가 가질 수 있는 최대값 (누적 횟수면 누적 일수, 기본은 기간 일수)
+        """
+        D = span or self.NUM_DAYS
+        # 횟수는 0~D이므로 편차는 max(target, D - target)를 넘지 않음
+        max_dev = max(target, D - target)
+        terms = []
+        if mode == 'minmax':
+            hi = model.NewIntVar(0, D, f'{prefix}_max')
+            lo = model.NewIntVar(0, D, f'{prefix}_min')
+            model.AddMaxEquality(hi, counts)
+            model.AddMinEquality(lo, counts)
+            terms.append((hi - lo) * (weight * len(counts)))
+            return terms
+
+        for n, cnt in enumerate(counts):
+            diff = model.NewIntVar(-D, D, f'{prefix}_{n}')
+            model.Add(diff == cnt - target)
+            if mode == 'quadratic':
+                sq = model.NewIntVar(0, D**2, f'{prefix}_sq_{n}')
+                model.AddMultiplicationEquality(sq, [diff, diff])
+                terms.append(sq * weight)
+            elif mode == 'abs':
+                dev = model.NewIntVar(0, D, f'{prefix}_abs_{n}')
+                model.AddAbsEquality(dev, diff)
+                terms.append(dev * weight)
+            else:
+                # (k, k²)-(k+1, (k+1)²)를 잇는 직선들의 최대값 = 정수 편차에서 제곱과 동일
+                dev = model.NewIntVar(0, max_dev, f'{prefix}_abs_{n}')
+                model.AddAbsEquality(dev, diff)
+                pw = model.NewIntVar(0, max_dev**2, f'{prefix}_pwl_{n}')
+                for k in range(max_dev):
+                    model.Add(pw >= (2 * k + 1) * dev - k * (k + 1))
+                terms.append(pw * weight)
+        return terms
+
+    def _solve(self, model, max_time_seconds, num_workers, log_progress, callback=None, stop_event=None,
+               params=None, search_log=None):
         solver = cp_model.CpSolver()
+        if params:
+            apply_params(solver.parameters, params)
         solver.parameters.max_time_in_seconds = float(max_time_seconds)
-        solver.parameters.log_search_progress = True
-        solver.parameters.num_search_workers = 8
-        
-        status = solver.Solve(model)
+        solver.parameters.log_search_progress = log_progress
+        if search_log is not None:
+            # 진단용 로그는 콜백으로만 받고, 화면 출력은 log_progress일 때만
+            solver.parameters.log_search_progress = True
+            solver.parameters.log_to_stdout = log_progress
+            solver.log_callback = search_log
+        # 병렬 배치 실행 시 코어를 나눠 쓰도록 워커 수를 외부에서 지정
+        solver.parameters.num_search_workers = max(1, int(num_workers))
+
+        # 취소 요청(stop_event)·개선 정체(plateau)는 해 갱신과 무관하게 감시 스레드가 확인
+        done = threading.Event()
+        if stop_event is not None or callback is not None:
+            def _watch():
+                while not done.wait(0.2):
+                    if stop_event is not None and stop_event.is_set():
+                        reason = 'cancelled'
+                    elif callback is not None and callback.plateau_exceeded():
+                        reason = 'plateau'
+                    else:
+                        continue
+                    if callback is not None and callback.stop_reason is None:
+                        callback.stop_reason = reason
+                    solver.StopSearch()
+                    return
+            threading.Thread(target=_watch, daemon=True).start()
+        try:
+            status = solver.Solve(model, callback)
+        finally:
+            done.set()
+        return solver, status
+
+    def optimize(self, max_time_seconds=300, num_workers=8, log_progress=True, hint=None,
+                 fairness='quadratic', symmetry_breaking=False, on_solution=None, stop_event=None,
+                 stop_rules=None, param_profile=None, capture_roster=False, precheck='warn',
+                 objective='weighted', phase1_share=0.4):
+        """
+        hint: 이전 결과 dict(nurses[*].schedule) 또는 근무표 DataFrame(Date/Name/Shift)
+              → 겹치는 날짜를 맞춰 CP-SAT 솔루션 힌트로 사용 (웜스타트)
+        fairness: 공정성 페널티 형태 ('quadratic' | 'abs' | 'minmax' | 'pwl')
+        symmetry_breaking: 서로 바꿔도 같은 간호사 묶음에 사전식 순서 제약 추가 (선택, 기본 끔)
+                           → 가능한 근무표를 잃지 않는지는 benchmarks/check_symmetry.py로 확인
+        on_solution: 더 좋은 해를 찾을 때마다 호출 (목적값·부족 인원·경과 시간 dict)
+        stop_event: threading.Event, 설정되면 탐색을 멈추고 그때까지의 최선 해 반환
+        stop_rules: 조기 종료 조건 {'gap': 0.01, 'plateau_seconds': 30, 'fairness_within': 2}
+                    → 종료 사유는 result['stop_reason']에 기록
+        param_profile: 튜닝 프로파일(ParamProfile 또는 JSON 경로) → 병동 규모에 맞는 솔버 설정 적용
+        capture_roster: on_solution 정보에 해당 해의 근무표('roster')를 포함 (JobStore 중단 복구용)
+        precheck: 인력 용량 사전 점검 ('warn': 결과에 result['precheck']로 기록, 'strict': 인력 부족이
+                  확실하면 PrecheckError로 중단, None: 생략)
+        objective: 'weighted'(가중합 한 번) | 'lexicographic'(1단계 커버리지 부족·나이트 초과 최소화에
+                   시간의 phase1_share 사용 → 그 값을 고정하고 남은 시간에 공정성 최소화, 1단계 해를 힌트로)
+                   → 단계별 목적값·시간은 result['lexicographic']
+
+        result['diagnostics']: 구성 단계별 시간·변수·제약 수(build), presolve/첫 해 시각(search),
+                               CP-SAT 응답 통계(response), 구성·풀이·결과 변환 시간(timings)
+                               (lexicographic: search·response는 최종 해를 낸 단계, search['phases']에 단계별)
+        """
+        if objective not in self.OBJECTIVE_MODES:
+            raise Exception(f"지원하지 않는 목적식 모드입니다: {objective}")
+        report = CapacityPrecheck(self).run() if precheck else None
+        if precheck == 'strict' and report['blocking']:
+            raise PrecheckError(report)
+
+        t_build = time.perf_counter()
+        model, shifts, penalties = self._build_model(fairness)
+        profiler = self.build_profiler
+        with profiler.phase('objective'):
+            if objective == 'lexicographic':
+                terms = self.objective_terms
+                primary = sum(terms['coverage']) + sum(terms['night_excess'])
+                model.Minimize(primary)
+            else:
+                model.Minimize(sum(penalties))
+        stats = {'fairness': fairness, 'objective': objective}
+
+        # 대칭 제거: 모델 안의 간호사 자리(slot)와 실제 간호사의 대응표 (기본은 항등)
+        slot_of = list(range(self.NUM_NURSES))
+        hinted, offset = self._hint_assignments(hint) if hint is not None else ({}, 0)
+        if symmetry_breaking:
+            with profiler.phase('symmetry'):
+                groups = self._symmetry_groups()
+                slot_of = self._symmetry_slots(groups, hinted)
+                stats['symmetry'] = {
+                    'groups': len(groups),
+                    'nurses': sum(len(g) for g in groups),
+                    'constraints': self._add_symmetry_breaking(model, shifts, groups)
+                }
+
+        # 웜스타트 힌트
+        if hint is not None:
+            with profiler.phase('hint'):
+                for (n, d), s_idx in hinted.items():
+                    for s in range(4):
+                        model.AddHint(shifts[(slot_of[n], d, s)], int(s == s_idx))
+            stats['warm_start'] = {
+                'hinted_nurses': len({n for n, _ in hinted}),
+                'hinted_cells': len(hinted),
+                'offset_days': offset
+            }
+
+        params = None
+        if param_profile is not None:
+            if not isinstance(param_profile, ParamProfile):
+                param_profile = ParamProfile.load(param_profile)
+            size, params = param_profile.params_for(self.NUM_NURSES, self.NUM_DAYS)
+            stats['param_profile'] = {'class': size, 'params': params}
+
+        monitor = SolutionMonitor(self.short_vars, on_solution, stop_rules, self.count_exprs,
+                                  roster_vars=shifts[slot_of] if capture_roster else None)
+        search_log = SearchLog()
+        build_seconds = time.perf_counter() - t_build
+        t_solve = time.perf_counter()
+        phases = None
+        if objective == 'lexicographic':
+            solver, status, phases, search_log = self._solve_lexicographic(
+                model, primary, max_time_seconds, phase1_share, num_workers, log_progress, monitor, stop_event,
+                params, search_log)
+        else:
+            solver, status = self._solve(model, max_time_seconds, num_workers, log_progress, monitor, stop_event,
+                                         params, search_log)
+        solve_seconds = time.perf_counter() - t_solve
 
         if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-            return self._format_result(solver, shifts, status, max_time_seconds)
+            t_format = time.perf_counter()
+            result = self._format_result(solver, shifts, status, max_time_seconds, slot_of)
+            if stop_event is not None and stop_event.is_set():
+                stats['cancelled'] = True
+            stats['solutions'] = len(monitor.incumbents)
+            result['solve_stats'] = stats
+            result['stop_reason'] = monitor.stop_reason or ('optimal' if status == cp_model.OPTIMAL else 'time_limit')
+            search = search_log.to_dict()
+            if monitor.incumbents:
+                search['first_incumbent'] = monitor.incumbents[0]['elapsed']
+            if phases is not None:
+                # 최종 해를 낸 단계 기준 + 단계별 presolve/첫 해 시각
+                search['phases'] = [dict(p['search'], phase=p['phase']) for p in phases]
+            if report is not None:
+                result['precheck'] = report
+            if phases is not None:
+                result['lexicographic'] = {'phase1_share': phase1_share, 'phases': phases}
+            result['diagnostics'] = {
+                'build': profiler.to_dict(), 'search': search, 'response': response_stats(solver, status),
+                'timings': {'build': round(build_seconds, 4), 'solve': round(solve_seconds, 4),
+                            'format': round(time.perf_counter() - t_format, 4)}
+            }
+            return result
+        elif stop_event is not None and stop_event.is_set():
+            raise Exception("최적화가 취소되었습니다. (취소 전까지 찾은 해 없음)")
+        elif status == cp_model.INFEASIBLE:
+            raise self.explain_infeasibility(fairness, num_workers=num_workers)
         else:
-            raise Exception("해를 찾을 수 없습니다. (인원 데이터 확인 필요)")
+            raise Exception("해를 찾을 수 없습니다. (제한 시간 안에 해를 찾지 못함, 최적화 시간을 늘려 보세요)")
 
-    def _format_result(self, solver, shifts, status, time_sec):
-        res_nurses = []
-        daily_cov = {d: {'D': 0, 'E': 0, 'N': 0} for d in range(self.NUM_DAYS)}
-        daily_new = {d: {'D': 0, 'E': 0, 'N': 0} for d in range(self.NUM_DAYS)}
-        daily_charge = {d: {'D': 0, 'E': 0, 'N': 0} for d in range(self.NUM_DAYS)}
-        
-        for n_idx, row in self.df_nurse.iterrows():
-            name = row.get('Name') or row.get('이름') or f'N{n_idx}'
-            raw_level = str(row.get('Level', 'Regular')).lower()
-            if 'charge' in raw_level or '책임' in raw_level: level = 'Charge'
-            elif 'new' in raw_level or '신규' in raw_level: level = 'New'
-            else: level = 'Regular'
-            
-            schedule = []
-            w_days = 0
-            n_count = 0
-            
-            for d in range(self.NUM_DAYS):
-                for s in range(4):
-                    if solver.Value(shifts[(n_idx, d, s)]):
-                        s_char = self.SHIFTS[s]
-                        schedule.append(s_char)
-                        if s < 3: 
-                            w_days += 1
-                            daily_cov[d][s_char] += 1
-                            if level == 'New': daily_new[d][s_char] += 1
-                            if level == 'Charge': daily_charge[d][s_char] += 1
-                        if s == 2: n_count += 1
-            
-            res_nurses.append({
-                "nurse_id": f"N{n_idx}", "name": name, "level": level,
-                "schedule": schedule, "work_days": w_days, "night_count": n_count,
-                "off_count": self.NUM_DAYS - w_days
-            })
-            
-        dates_info = []
-        for i, d_str in enumerate(self.date_list):
-            dt = datetime.strptime(d_str, "%Y-%m-%d")
-            dates_info.append({
-                "date": d_str, 
-                "day_of_week": ["월","화","수","목","금","토","일"][dt.weekday()],
-                "coverage": daily_cov[i],
-                "new_nurses": daily_new[i],
-                "charge_nurses": daily_charge[i]
-            })
+    def _solve_lexicographic(self, model, primary, max_time_seconds, phase1_share, num_workers, log_progress,
+                             monitor, stop_event, params, search_log):
+        """
+        2단계 계층 최적화
+        1단계: 커버리지 부족·나이트 초과 (가중치 그대로) 최소화, 제한 시간 × phase1_share
+        2단계: primary ≤ 1단계 값으로 고정하고 공정성 항만 최소화, 1단계 해 전체를 힌트로 남은 시간 사용
+        search_log: 1단계 로그 (2단계는 새 SearchLog, 단계별 정보의 'search'에 각각 기록)
+        반환: (solver, status, 단계별 정보, 반환한 해의 SearchLog) — 2단계에서 해를 못 찾거나 취소되면 1단계 해
+        """
+        t0 = time.perf_counter()
+        monitor.phase = 1
+        solver1, status1 = self._solve(model, max(1.0, max_time_seconds * phase1_share), num_workers,
+                                       log_progress, monitor, stop_event, params, search_log)
+        phases = [self._phase_info('coverage', solver1, status1, time.perf_counter() - t0, monitor.stop_reason,
+                                   search_log)]
+        if status1 not in (cp_model.OPTIMAL, cp_model.FEASIBLE) or (stop_event is not None and stop_event.is_set()):
+            return solver1, status1, phases, search_log
+
+        t1 = time.perf_counter()
+        level = int(round(solver1.ObjectiveValue()))
+        model.ClearHints()
+        for i in range(len(model.Proto().variables)):
+            var = model.GetIntVarFromProtoIndex(i)
+            model.AddHint(var, solver1.Value(var))
+        model.Add(primary <= level)
+        model.ClearObjective()
+        model.Minimize(sum(self.objective_terms['fairness']))
+
+        # 조기 종료 판단은 2단계 기준으로 다시 시작
+        monitor.phase, monitor.stop_reason = 2, None
+        monitor.last_improvement = time.time()
+        remaining = max(1.0, max_time_seconds - (t1 - t0))
+        search_log2 = SearchLog()
+        solver2, status2 = self._solve(model, remaining, num_workers, log_progress, monitor, stop_event, params,
+                                       search_log2)
+        phases.append(self._phase_info('fairness', solver2, status2, time.perf_counter() - t1, monitor.stop_reason,
+                                       search_log2))
+        phases[1]['fixed_primary'] = level
+        if status2 in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return solver2, status2, phases, search_log2
+        return solver1, status1, phases, search_log
+
+    @staticmethod
+    def _phase_info(name, solver, status, seconds, stop_reason=None, search_log=None):
+        info = {'phase': name, 'status': solver.StatusName(status), 'seconds': round(seconds, 3),
+                'stop_reason': stop_reason, 'search': search_log.to_dict() if search_log is not None else {}}
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            info.update(objective=solver.ObjectiveValue(), best_bound=solver.BestObjectiveBound())
+        info['response'] = response_stats(solver, status)
+        return info
+
+    def explain_infeasibility(self, fairness='quadratic', forced=None, fixed=None, max_time_seconds=10,
+                              num_workers=8):
+        """
+        해가 없는 원인: 하드 제약 묶음마다 가정 리터럴을 두고 한 번 풀어
+        CP-SAT의 sufficient assumptions(충돌 코어)를 읽은 뒤, 남은 시간 안에서 코어를 최소화
+        forced: 긴급 변경 {(n, d): shift_idx}, fixed: 게시본 고정 칸 {(n, d): shift_idx} (repair용)
+        반환: InfeasibleScheduleError (conflicts에 충돌 목록), 원인을 못 찾으면 일반 Exception
+        """
+        guards = {}
+        model, shifts, _ = self._build_model(fairness, guards)
+        for (n, d), s_idx in (forced or {}).items():
+            key = ('change', n, d, s_idx)
+            guards[key] = model.NewBoolVar(f'assume_change_{n}_{d}')
+            model.Add(shifts[n, d, s_idx] == 1).OnlyEnforceIf(guards[key])
+        for (n, d), s_idx in (fixed or {}).items():
+            key = ('published', n)
+            if key not in guards:
+                guards[key] = model.NewBoolVar(f'assume_published_{n}')
+            model.Add(shifts[n, d, s_idx] == 1).OnlyEnforceIf(guards[key])
+
+        by_index = {lit.Index(): key for key, lit in guards.items()}
+        deadline = time.perf_counter() + max_time_seconds
+
+        def solve(keys):
+            model.ClearAssumptions()
+            model.AddAssumptions([guards[k] for k in keys])
+            solver = cp_model.CpSolver()
+            solver.parameters.max_time_in_seconds = max(0.1, deadline - time.perf_counter())
+            solver.parameters.num_search_workers = max(1, int(num_workers))
+            return solver, solver.Solve(model)
+
+        solver, status = solve(list(guards))
+        if status != cp_model.INFEASIBLE:
+            return Exception("해를 찾을 수 없습니다. (하드 제약 충돌 원인을 찾지 못함)")
+        core = [by_index[i] for i in solver.SufficientAssumptionsForInfeasibility() if i in by_index]
+        # 코어 최소화: 하나씩 빼 보고 여전히 해가 없으면 제외 (시간이 남는 동안)
+        for key in list(core):
+            if time.perf_counter() >= deadline or len(core) == 1:
+                break
+            trial = [k for k in core if k != key]
+            if solve(trial)[1] == cp_model.INFEASIBLE:
+                core = trial
 
+        conflicts = [self._describe_assumption(key) for key in core]
+        lines = '\n'.join(f"- {c['description']}" for c in conflicts)
+        return InfeasibleScheduleError(f"해를 찾을 수 없습니다. 다음 제약이 서로 충돌합니다:\n{lines}", conflicts)
+
+    def _describe_assumption(self, key):
+        rule, n = key[0], key[1]
+        name_col = next((c for c in ['Name', '이름'] if c in self.df_nurse.columns), None)
+        name = self.df_nurse[name_col].iat[n] if name_col else None
+        name = name if isinstance(name, str) and name else f'N{n}'
+        date = self.date_list[key[2]] if len(key) > 2 else None
+        text = _RULE_TEXT[rule]
+        if rule == 'change':
+            text = f"{self.SHIFTS[key[3]]} {text}"
         return {
+            'rule': rule, 'nurse_id': str(self.df_nurse.iloc[n, 0]), 'name': name, 'date': date,
+            'description': f"{name}: {date + ' ' if date else ''}{text}" + (f" ({rule})" if rule.startswith('HC') else '')
+        }
+
+    def repair(self, published, changes, window=3, max_time_seconds=10, num_workers=8, log_progress=False):
+        """
+        병가·당일 변경에 대한 국소 재최적화
+        published: 게시된 결과 dict
+        changes: [{'nurse': ID/이름, 'dates': ['YYYY-MM-DD', ...], 'shift': 'OFF'(기본)}]
+        변경일 ±window 일만 다시 풀고 나머지 배정은 게시본으로 고정 (경계의 HC2~HC4는 모델이 그대로 보장)
+        해가 없으면 구간을 두 배씩 넓혀 재시도
+        """
+        published_cells, offset = self._hint_assignments(published)
+        if offset != 0:
+            raise Exception("게시된 근무표의 기간이 재최적화 기간과 겹치지 않습니다.")
+
+        id_map = self._nurse_index_map()
+        forced = {}
+        for ch in changes:
+            key = str(ch['nurse'])
+            if key not in id_map:
+                raise Exception(f"간호사를 찾을 수 없습니다: {key}")
+            s_idx = self.SHIFTS.index(ch.get('shift', 'OFF'))
+            for d_str in ch['dates']:
+                if d_str in self.date_list:
+                    forced[(id_map[key], self.date_index[d_str])] = s_idx
+        if not forced:
+            raise Exception("재최적화 기간 안에 해당하는 변경 사항이 없습니다.")
+
+        first = min(d for _, d in forced)
+        last = max(d for _, d in forced)
+        while True:
+            lo, hi = max(0, first - window), min(self.NUM_DAYS - 1, last + window)
+            model, shifts, penalties = self._build_model()
+
+            for (n, d), s_idx in forced.items():
+                model.Add(shifts[(n, d, s_idx)] == 1)
+            for (n, d), s_idx in published_cells.items():
+                if (n, d) in forced:
+                    continue
+                if lo <= d <= hi:
+                    # 구간 안: 게시본과 달라지는 칸마다 페널티 (커버리지 부족보다는 가볍게)
+                    model.AddHint(shifts[(n, d, s_idx)], 1)
+                    penalties.append((1 - shifts[(n, d, s_idx)]) * 100)
+                else:
+                    model.Add(shifts[(n, d, s_idx)] == 1)
+
+            model.Minimize(sum(penalties))
+            solver, status = self._solve(model, max_time_seconds, num_workers, log_progress)
+            if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+                break
+            if lo == 0 and hi == self.NUM_DAYS - 1:
+                if status == cp_model.INFEASIBLE:
+                    # 전체 기간을 풀어도 해가 없으면 변경 사항과 충돌하는 제약을 찾아 알려줌
+                    raise self.explain_infeasibility(forced=forced, num_workers=num_workers)
+                raise Exception("변경 사항을 반영할 수 있는 근무표가 없습니다. (전체 기간 재최적화 필요)")
+            window *= 2
+
+        result = self._format_result(solver, shifts, status, max_time_seconds)
+        diff = []
+        for (n, d), s_idx in sorted(published_cells.items()):
+            after = result['nurses'][n]['schedule'][d]
+            if lo <= d <= hi and after != self.SHIFTS[s_idx]:
+                diff.append({'nurse_id': result['nurses'][n]['nurse_id'], 'name': result['nurses'][n]['name'],
+                             'date': self.date_list[d], 'before': self.SHIFTS[s_idx], 'after': after})
+        result['repair'] = {
+            'window': [self.date_list[lo], self.date_list[hi]],
+            'window_days': hi - lo + 1,
+            'margin_days': window,  # 변경일 앞뒤로 다시 푼 일수 (해가 없어 넓혔으면 넓힌 값)
+            'changes': len(forced),
+            'diff': diff
+        }
+        result['solve_stats'] = {'wall_time': round(solver.WallTime(), 3)}
+        return result
+
+    def _request_offs(self):
+        """기간 내 OFF 신청 → [(n_idx, d_idx)] (컬럼 탐지·매핑을 한 번에 처리하고 결과 캐시)"""
+        if self._offs is not None:
+            return self._offs
+        self._offs = []
+        if self.df_requests is None or self.df_requests.empty:
+            return self._offs
+        cols = [str(c).lower() for c in self.df_requests.columns]
+        nid_col = next((i for i, c in enumerate(cols) if 'id' in c and 'req' not in c), None)
+        date_col = next((i for i, c in enumerate(cols) if 'date' in c), None)
+        type_col = next((i for i, c in enumerate(cols) if 'type' in c), None)
+        if nid_col is None or date_col is None or type_col is None:
+            return self._offs
+
+        nurse_ids = self.df_nurse.iloc[:, 0].astype(str).tolist()
+        id_map = {nid: i for i, nid in enumerate(nurse_ids)}
+        req = self.df_requests.iloc[:, [nid_col, date_col, type_col]]
+        req = req[req.iloc[:, 2].astype(str) == 'OFF']
+        n_idx = req.iloc[:, 0].astype(str).map(id_map)
+        d_idx = req.iloc[:, 1].astype(str).str.split(' ').str[0].map(self.date_index)
+        valid = n_idx.notna() & d_idx.notna()
+        self._offs = list(zip(n_idx[valid].astype(int).tolist(), d_idx[valid].astype(int).tolist()))
+        return self._offs
+
+    @staticmethod
+    def _level_category(raw_level):
+        raw_level = str(raw_level).lower()
+        if 'charge' in raw_level or '책임' in raw_level: return 'Charge'
+        elif 'new' in raw_level or '신규' in raw_level: return 'New'
+        else: return 'Regular'
+
+    def _symmetry_groups(self):
+        """
+        서로 바꿔도 모델이 동일한 간호사 묶음
+        (같은 Level 분류 + 기간 내 신청 없음 + 같은 경계 상태 → 제약·목적식에서 구별되지 않음)
+        """
+        requested = {n for n, _ in self._request_offs()}
+        prior = self.boundary
+        groups = {}
+        for n_idx, level in enumerate(self.levels):
+            if n_idx not in requested:
+                key = level
+                if prior:
+                    key = (level, tuple(prior['history'][n_idx][-2:]), int(prior['consecutive'][n_idx]),
+                           int(prior['nights'][n_idx]), int(prior['work'][n_idx]))
+                groups.setdefault(key, []).append(n_idx)
+        return [g for g in groups.values() if len(g) > 1]
+
+    def _symmetry_slots(self, groups, hinted):
+        """
+        실제 간호사 → 모델 자리(slot) 대응표
+        묶음 안에서 힌트 벡터를 사전식 내림차순으로 정렬해 자리에 배정 (힌트가 순서 제약을 만족하도록)
+        """
+        slot_of = list(range(self.NUM_NURSES))
+        for group in groups:
+            vec = {n: [hinted.get((n, d), -1) for d in range(self.NUM_DAYS)] for n in group}
+            for slot, n in zip(group, sorted(group, key=lambda m: vec[m], reverse=True)):
+                slot_of[n] = slot
+        return slot_of
+
+    def _add_symmetry_breaking(self, model, shifts, groups):
+        """
+        묶음 안에서 근무 벡터(일별 근무 코드 D=0,E=1,N=2,OFF=3)를 사전식 내림차순으로 정렬
+        - eq: 앞선 날까지 두 간호사의 근무가 같음, gt: 해당 날에 앞 간호사 코드가 더 큼
+        - 어떤 해든 묶음 내 순서를 바꾸면 조건을 만족하므로 가능한 근무표를 잃지 않음
+        """
+        count = 0
+        for group in groups:
+            for a, b in zip(group, group[1:]):
+                eq_prev = None
+                for d in range(self.NUM_DAYS):
+                    va = sum(s * shifts[(a, d, s)] for s in range(1, 4))
+                    vb = sum(s * shifts[(b, d, s)] for s in range(1, 4))
+                    gt = model.NewBoolVar(f'sym_gt_{a}_{d}')
+                    eq = model.NewBoolVar(f'sym_eq_{a}_{d}')
+                    cond = [] if eq_prev is None else [eq_prev]
+                    model.Add(va >= vb).OnlyEnforceIf(cond)
+                    model.Add(va <= vb).OnlyEnforceIf(cond + [gt.Not()])
+                    model.Add(va >= vb + 1).OnlyEnforceIf(gt)
+                    model.AddBoolOr([c.Not() for c in cond] + [gt, eq])
+                    eq_prev = eq
+                    count += 4
+        return count
+
+    def _nurse_index_map(self, positional=True):
+        """
+        간호사 식별자(ID 컬럼, 이름, 결과의 N{idx}) → 행 인덱스
+        positional=False: 행 순서에 따라 바뀌는 N{idx}는 제외 (이름·실제 ID만)
+        """
+        id_map = {}
+        ids = self.df_nurse.iloc[:, 0].astype(str).tolist()
+        name_col = next((c for c in ['Name', '이름'] if c in self.df_nurse.columns), None)
+        names = self.df_nurse[name_col].tolist() if name_col else [None] * self.NUM_NURSES
+        for n_idx, (nid, name) in enumerate(zip(ids, names)):
+            if positional:
+                id_map.setdefault(f'N{n_idx}', n_idx)
+            id_map.setdefault(nid, n_idx)
+            if isinstance(name, str) and name:
+                id_map.setdefault(name, n_idx)
+        return id_map
+
+    def _hint_assignments(self, hint):
+        """
+        힌트 근무표를 {(n_idx, d_idx): shift_idx}로 변환
+        - 날짜가 겹치면 날짜 기준으로 정렬
+        - 겹치지 않으면(지난달 근무표) 요일이 맞도록 7일 단위로 이동해 겹침이 최대인 구간 사용
+        - 간호사는 이름·실제 ID로 먼저 맞추고, 맞는 이름이 없는 경우에만 결과의 N{idx}(행 순서) 사용
+          (간호사 순서가 바뀐 시트에서 다른 간호사의 근무가 힌트로 들어가지 않도록)
+        """
+        roster = {}  # key -> {date: shift}
+        fallback = {}  # key -> 결과의 N{idx}
+        if isinstance(hint, CompactResult):
+            hint = hint.to_dict()
+        if isinstance(hint, dict):
+            dates = [d['date'] for d in hint.get('dates', [])]
+            for nurse in hint.get('nurses', []):
+                key = str(nurse.get('name') or nurse.get('nurse_id'))
+                roster[key] = dict(zip(dates, nurse['schedule']))
+                if nurse.get('nurse_id') is not None:
+                    fallback[key] = str(nurse['nurse_id'])
+        else:
+            df = hint.copy()
+            df.columns = [str(c).strip().lower() for c in df.columns]
+            date_col = next((c for c in df.columns if 'date' in c or '날짜' in c), None)
+            nurse_col = next((c for c in df.columns if 'name' in c or 'id' in c or '이름' in c), None)
+            shift_col = next((c for c in df.columns if 'shift' in c or '근무' in c), None)
+            if not (date_col and nurse_col and shift_col):
+                raise Exception("힌트 근무표에 Date/Name/Shift 컬럼이 필요합니다.")
+            dates = pd.to_datetime(df[date_col]).dt.strftime("%Y-%m-%d")
+            for key, d_str, s_char in zip(df[nurse_col].astype(str), dates, df[shift_col].astype(str)):
+                roster.setdefault(key, {})[d_str] = s_char.strip().upper()
+
+        hint_dates = {d for sch in roster.values() for d in sch}
+        if not hint_dates:
+            return {}, 0
+
+        # 요일을 유지하는 이동량(7일 단위) 중 겹치는 날짜가 가장 많은 값 선택
+        start = datetime.strptime(self.start_date, "%Y-%m-%d")
+        h_min = min(datetime.strptime(d, "%Y-%m-%d") for d in hint_dates)
+        max_weeks = max(0, (start - h_min).days // 7 + 1)
+        best_offset, best_overlap = 0, -1
+        for w in range(max_weeks + 1):
+            shifted = [(datetime.strptime(d, "%Y-%m-%d") - timedelta(days=7 * w)).strftime("%Y-%m-%d")
+                       for d in self.date_list]
+            overlap = sum(d in hint_dates for d in shifted)
+            if overlap > best_overlap:
+                best_offset, best_overlap = 7 * w, overlap
+            if w == 0 and overlap > 0:
+                break
+
+        src_dates = [(datetime.strptime(d, "%Y-%m-%d") - timedelta(days=best_offset)).strftime("%Y-%m-%d")
+                     for d in self.date_list]
+        # 이름·실제 ID 일치 → 남은 간호사만 N{idx}로, 한 간호사에게 두 근무표가 겹치지 않게
+        id_map = self._nurse_index_map(positional=False)
+        matched = {key: id_map[key] for key in roster if key in id_map}
+        taken = set(matched.values())
+        for key in roster:
+            alt = fallback.get(key, key)
+            if key in matched or not (alt.startswith('N') and alt[1:].isdigit()):
+                continue
+            n_idx = int(alt[1:])
+            if n_idx < self.NUM_NURSES and n_idx not in taken:
+                matched[key] = n_idx
+                taken.add(n_idx)
+
+        hinted = {}
+        for key, sch in roster.items():
+            n_idx = matched.get(key)
+            if n_idx is None:
+                continue
+            for d_idx, src in enumerate(src_dates):
+                s_char = sch.get(src)
+                if s_char in self.SHIFTS:
+                    hinted[(n_idx, d_idx)] = self.SHIFTS.index(s_char)
+        return hinted, best_offset
+
+    def _format_result(self, solver, shifts, status, time_sec, slot_of=None):
+        # slot_of: 실제 간호사 → 모델 자리 (대칭 제거로 자리가 바뀐 경우 원래 간호사로 되돌림)
+        slot_of = slot_of or list(range(self.NUM_NURSES))
+        compact = self._compact_result(solver, shifts, status, time_sec, slot_of)
+        return compact.to_dict()
+
+    def _compact_result(self, solver, shifts, status, time_sec, slot_of):
+        """솔버 값 → CompactResult (배정 행렬 + 열 배열)"""
+        N, D = self.NUM_NURSES, self.NUM_DAYS
+        values = np.fromiter((solver.Value(v) for v in shifts[slot_of].ravel()), dtype=np.int8, count=N * D * 4)
+        matrix = values.reshape(N, D, 4).argmax(axis=2)
+
+        name_cols = [c for c in ['Name', '이름'] if c in self.df_nurse.columns]
+        names = []
+        for n_idx in range(N):
+            name = next((v for v in (self.df_nurse[c].iat[n_idx] for c in name_cols) if v), None)
+            names.append(name or f'N{n_idx}')
+        weekdays = ["월","화","수","목","금","토","일"]
+        dows = [weekdays[datetime.strptime(d_str, "%Y-%m-%d").weekday()] for d_str in self.date_list]
+
+        return CompactResult.from_matrix(matrix, [f"N{n_idx}" for n_idx in range(N)], names, self.levels,
+                                         self.date_list, dows, meta={
             "schedule_id": f"SCH-{datetime.now().strftime('%Y%m%d-%H%M')}",
             "start_date": self.start_date, "end_date": self.end_date,
             "total_nurses": self.NUM_NURSES, "status": solver.StatusName(status),
-            "optimization_time": time_sec, "nurses": res_nurses, "dates": dates_info
-        }
+            "optimization_time": time_sec
+        })
@@ -0,0 +1,357 @@
+"""
+src/service.py
+로컬 스케줄링 서비스 (HTTP + 솔버 프로세스 풀 + 작업 대기열)
+
+여러 사용자가 동시에 최적화를 요청해도 솔버 프로세스 수와 코어 사용량이 고정되도록
+웹 화면(Streamlit)이 아닌 이 서비스 프로세스에서만 CP-SAT를 실행
+
+Streamlit 앱(app.py)은 최적화·긴급 재조정을 기본으로 이 서비스에 보냄
+(주소: NURSE_SCHEDULER_URL, 기본 http://127.0.0.1:8765 / 서비스 없이 앱에서 직접 계산: NURSE_SCHEDULER_LOCAL=1)
+
+작업은 JobStore(SQLite, 앱의 '작업 기록'과 같은 파일)에 접수 시점부터 기록
+→ 서비스가 재시작되면 끝나지 않은 작업을 다시 실행 (실행 중이던 작업은 마지막 incumbent에서 이어서)
+솔버 프로파일(--profile, 기본 solver_profile.json)이 있으면 작업마다 적용
+
+실행:
+  python -m src.service --port 8765 --pool 2 --cores 8
+
+API (JSON):
+  POST   /jobs              {sheets 또는 workbook(base64 xlsx), start_date, end_date,
+                             max_time_seconds, fairness, objective, stop_rules, precheck,
+                             symmetry_breaking, hint 또는 hint_table, num_workers,
+                             repair({published, changes, window}: 게시본 국소 재조정)}
+                            → {job_id, state, position}
+  GET    /jobs              작업 목록
+  GET    /jobs/<id>         상태 (state, position, elapsed, workers, incumbents, best, error, conflicts,
+                            has_result)
+  GET    /jobs/<id>/result  결과 dict (?format=compact 이면 CompactResult JSON)
+  POST   /jobs/<id>/cancel  취소 (실행 중이면 그때까지의 최선 해로 종료)
+  GET    /health
+"""
+import argparse
+import base64
+import io
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# 요청 본문 최대 크기 (엑셀·시트 JSON)
+MAX_BODY_BYTES = 50 * 1024 * 1024
+# JobStore에서 서비스 작업을 구분하는 label
+SERVICE_LABEL = 'service'
+
+
+def decode_sheets(payload):
+    """요청의 sheets({이름: DataFrame split JSON}) 또는 workbook(base64 xlsx) → sheets dict"""
+    import pandas as pd
+
+    if payload.get('workbook'):
+        from utils.data_loader import DataLoader
+        return DataLoader.load_excel(io.BytesIO(base64.b64decode(payload['workbook'])), selective=True)
+    sheets = {}
+    for name, text in (payload.get('sheets') or {}).items():
+        sheets[name] = pd.read_json(io.StringIO(text), orient='split', dtype=False, convert_dates=False)
+    return sheets
+
+
+def _run_job(job_id, payload, num_workers, cache_dir, store_path, profile_path, cancel, started, incumbents):
+    """솔버 프로세스: 작업 하나 실행·기록 (진행·취소는 Manager 프록시로 서비스와 공유)"""
+    from .scheduler import NurseScheduler
+    from .store import JobStore
+
+    if cancel.is_set():
+        # 프로세스 풀에 이미 넘어간 뒤 대기 중에 취소된 작업
+        raise Exception("최적화가 취소되었습니다. (시작 전 취소)")
+    started['at'] = time.time()
+    store = JobStore(store_path)
+    scheduler = NurseScheduler(decode_sheets(payload), payload['start_date'], payload['end_date'])
+    repair = payload.get('repair')
+    if repair:
+        # 긴급 변경: 게시본에서 변경일 주변만 재최적화
+        store.create(scheduler, 'repair', {'max_time_seconds': payload.get('max_time_seconds', 10),
+                                           'window': repair.get('window', 3)}, SERVICE_LABEL, job_id=job_id)
+        try:
+            result = scheduler.repair(repair['published'], repair['changes'], window=repair.get('window', 3),
+                                      max_time_seconds=payload.get('max_time_seconds', 10), num_workers=num_workers)
+        except Exception as e:
+            store.fail(job_id, e)
+            raise
+        store.finish(job_id, result)
+        return result
+    hint = payload.get('hint')
+    if hint is None and payload.get('hint_table'):
+        # 지난달 근무표(Date/Name/Shift) 힌트
+        import pandas as pd
+        hint = pd.read_json(io.StringIO(payload['hint_table']), orient='split', dtype=False, convert_dates=False)
+    params = dict(
+        max_time_seconds=payload.get('max_time_seconds', 60), num_workers=num_workers, log_progress=False,
+        fairness=payload.get('fairness', 'quadratic'), stop_rules=payload.get('stop_rules'),
+        hint=hint, on_solution=incumbents.append, stop_event=cancel,
+        precheck=payload.get('precheck', 'warn'), objective=payload.get('objective', 'weighted'),
+        symmetry_breaking=bool(payload.get('symmetry_breaking', False))
+    )
+    # 프로파일은 실행 시점에 확인 (다시 튜닝하면 다음 작업부터 반영)
+    if profile_path and os.path.exists(profile_path):
+        params['param_profile'] = profile_path
+    cache = None
+    if cache_dir:
+        from .cache import SolveCache
+        cache = SolveCache(cache_dir)
+    return store.optimize(scheduler, cache=cache, label=SERVICE_LABEL, job_id=job_id, **params)
+
+
+class SolveService:
+    """
+    작업 대기열 + 솔버 프로세스 풀
+    - pool_size개 작업만 동시에 실행, 나머지는 접수 순서대로 대기
+    - 작업마다 num_search_workers = min(요청 값, total_cores // pool_size)
+    - 메모리에는 최근 max_jobs개 작업의 진행 상황만, 상태·incumbent·결과는 JobStore(store_path)에 기록
+      → 메모리에 없는 작업(재시작 전·정리된 작업)은 JobStore에서 조회
+    - 시작할 때 이전 프로세스에서 끝나지 않은 작업을 접수 순서대로 다시 실행
+    """
+
+    def __init__(self, pool_size=2, total_cores=None, cache_dir='.schedule_cache', max_jobs=100,
+                 store_path=None, profile_path='solver_profile.json'):
+        from .store import JobStore
+
+        self.pool_size = max(1, pool_size)
+        self.total_cores = total_cores or os.cpu_count() or 1
+        self.workers_per_job = max(1, self.total_cores // self.pool_size)
+        self.cache_dir = cache_dir
+        self.max_jobs = max_jobs
+        self.store_path = store_path or os.path.join(cache_dir or '.schedule_cache', 'jobs.sqlite3')
+        self.profile_path = profile_path
+        self.store = JobStore(self.store_path)
+        self.manager = multiprocessing.Manager()
+        self.pool = ProcessPoolExecutor(max_workers=self.pool_size)
+        self.jobs = {}
+        self.order = []
+        self._lock = threading.Lock()
+        for job_id, payload in self.store.requeue(SERVICE_LABEL):
+            self.submit(payload, job_id)
+
+    def submit(self, payload, job_id=None):
+        """job_id: 재시작 후 다시 실행하는 작업 (없으면 새로 접수해 JobStore에 기록)"""
+        for key in ('start_date', 'end_date'):
+            if not payload.get(key):
+                raise ValueError(f"{key}가 필요합니다.")
+        if not (payload.get('sheets') or payload.get('workbook')):
+            raise ValueError("sheets 또는 workbook이 필요합니다.")
+
+        if job_id is None:
+            job_id = self.store.enqueue(uuid.uuid4().hex[:12], payload, SERVICE_LABEL)
+        workers = min(int(payload.get('num_workers') or self.workers_per_job), self.workers_per_job)
+        job = {
+            'id': job_id, 'submitted_at': time.time(), 'finished_at': None, 'workers': workers,
+            'max_time_seconds': payload.get('max_time_seconds', 60),
+            'period': [payload['start_date'], payload['end_date']],
+            'cancel': self.manager.Event(), 'started': self.manager.dict(), 'incumbents': self.manager.list(),
+            'result': None, 'error': None, 'conflicts': None
+        }
+        job['future'] = self.pool.submit(_run_job, job_id, payload, workers, self.cache_dir, self.store_path,
+                                         self.profile_path, job['cancel'], job['started'], job['incumbents'])
+        job['future'].add_done_callback(lambda fut, job=job: self._finish(job, fut))
+        with self._lock:
+            self.jobs[job_id] = job
+            self.order.append(job_id)
+            self._prune()
+        return self.status(job_id)
+
+    def _finish(self, job, fut):
+        job['finished_at'] = time.time()
+        if fut.cancelled():
+            self.store.cancel_queued(job['id'])
+            return
+        try:
+            from .result import CompactResult
+            # 완료 결과는 압축 형식으로 보관
+            job['result'] = CompactResult.from_dict(fut.result())
+        except Exception as e:
+            job['error'] = str(e)
+            job['conflicts'] = getattr(e, 'conflicts', None)  # 하드 제약 충돌 (InfeasibleScheduleError)
+            if job['cancel'].is_set() and 'at' not in job['started']:
+                self.store.cancel_queued(job['id'])
+            else:
+                # 솔버 프로세스 밖 오류(입력 해석 실패, 프로세스 종료 등)도 기록
+                self.store.fail(job['id'], e)
+
+    def _prune(self):
+        done = [j for j in self.order if self.jobs[j]['future'].done()]
+        while len(self.order) > self.max_jobs and done:
+            job_id = done.pop(0)
+            self.order.remove(job_id)
+            del self.jobs[job_id]
+
+    def _state(self, job):
+        fut = job['future']
+        if fut.cancelled():
+            return 'cancelled'
+        if fut.done():
+            if job['error']:
+                return 'cancelled' if job['cancel'].is_set() and 'at' not in job['started'] else 'error'
+            if job['result'] is None:
+                return 'running'  # 완료 콜백 처리 중
+            return 'cancelled' if job['cancel'].is_set() else 'done'
+        if 'at' in job['started']:
+            return 'cancelling' if job['cancel'].is_set() else 'running'
+        return 'cancelled' if job['cancel'].is_set() else 'queued'
+
+    def _stored_status(self, job_id, with_incumbents=True):
+        """JobStore 기록 → status() 형식 (재시작 전·메모리에서 정리된 서비스 작업)"""
+        row = self.store.get(job_id)
+        if row is None or row['label'] != SERVICE_LABEL:
+            return None
+        incumbents = self.store.incumbents(job_id) if with_incumbents else []
+        return {
+            'job_id': job_id, 'state': row['status'], 'period': [row['start_date'], row['end_date']],
+            'workers': None, 'max_time_seconds': row['params'].get('max_time_seconds'),
+            'submitted_at': row['created_at'], 'elapsed': round(row['updated_at'] - row['created_at'], 1),
+            'incumbents': incumbents, 'best': incumbents[-1] if incumbents else None, 'error': row['error'],
+            'conflicts': None, 'has_result': row['has_result'], 'resumed_from': row['resumed_from']
+        }
+
+    def status(self, job_id, with_incumbents=True):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return self._stored_status(job_id, with_incumbents)
+        state = self._state(job)
+        started = job['started'].get('at')
+        end = job['finished_at'] or time.time()
+        incumbents = list(job['incumbents']) if with_incumbents else []
+        info = {
+            'job_id': job_id, 'state': state, 'period': job['period'], 'workers': job['workers'],
+            'max_time_seconds': job['max_time_seconds'], 'submitted_at': job['submitted_at'],
+            'elapsed': round(end - started, 1) if started else 0.0,
+            'incumbents': incumbents, 'best': incumbents[-1] if incumbents else None, 'error': job['error'],
+            'conflicts': job['conflicts'], 'has_result': job['result'] is not None
+        }
+        if state == 'queued':
+            with self._lock:
+                queued = [j for j in self.order if self._state(self.jobs[j]) == 'queued']
+            info['position'] = queued.index(job_id) + 1 if job_id in queued else 0
+        return info
+
+    def list(self):
+        with self._lock:
+            ids = list(self.order)
+        return [self.status(j, with_incumbents=False) for j in ids]
+
+    def result(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is not None and job['result'] is not None:
+            return job['result']
+        return self.store.load(job_id)
+
+    def cancel(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        # 대기 중이면 대기열에서 제거, 실행 중이면 탐색 중단 신호
+        if not job['future'].cancel():
+            job['cancel'].set()
+        return self.status(job_id)
+
+    def shutdown(self):
+        for job in self.jobs.values():
+            job['cancel'].set()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        self.manager.shutdown()
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args):
+            pass
+
+        def _send(self, code, body):
+            data = body.encode('utf-8') if isinstance(body, str) else json.dumps(
+                body, ensure_ascii=False, default=str).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _read_json(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            if length > MAX_BODY_BYTES:
+                raise ValueError("요청 크기가 너무 큽니다.")
+            return json.loads(self.rfile.read(length) or b'{}')
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/health':
+                return self._send(200, {'ok': True, 'pool': service.pool_size,
+                                        'workers_per_job': service.workers_per_job})
+            if url.path == '/jobs':
+                return self._send(200, service.list())
+            m = re.fullmatch(r'/jobs/(\w+)(/result)?', url.path)
+            if not m:
+                return self._send(404, {'error': 'not found'})
+            job_id = m.group(1)
+            if m.group(2):
+                status = service.status(job_id, with_incumbents=False)
+                if status is None:
+                    return self._send(404, {'error': 'unknown job'})
+                result = service.result(job_id)
+                if result is None:
+                    return self._send(409, {'error': f"결과가 아직 없습니다. ({status['state']})",
+                                            'state': status['state']})
+                if parse_qs(url.query).get('format') == ['compact']:
+                    return self._send(200, result.to_json())
+                return self._send(200, result.to_dict())
+            status = service.status(job_id)
+            return self._send(200, status) if status else self._send(404, {'error': 'unknown job'})
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            if url.path == '/jobs':
+                try:
+                    return self._send(202, service.submit(self._read_json()))
+                except ValueError as e:
+                    return self._send(400, {'error': str(e)})
+            m = re.fullmatch(r'/jobs/(\w+)/cancel', url.path)
+            if m:
+                status = service.cancel(m.group(1))
+                return self._send(200, status) if status else self._send(404, {'error': 'unknown job'})
+            return self._send(404, {'error': 'not found'})
+
+    return Handler
+
+
+def serve(host='127.0.0.1', port=8765, pool_size=2, total_cores=None, cache_dir='.schedule_cache',
+          store_path=None, profile_path='solver_profile.json'):
+    service = SolveService(pool_size, total_cores, cache_dir, store_path=store_path, profile_path=profile_path)
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    print(f"스케줄링 서비스: http://{host}:{port} (동시 {service.pool_size}개, 작업당 워커 {service.workers_per_job}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 스케줄링 서비스")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--pool', type=int, default=2, help="동시에 실행할 최적화 작업 수")
+    parser.add_argument('--cores', type=int, help="서비스가 사용할 전체 코어 수 (기본: 전체)")
+    parser.add_argument('--cache-dir', default='.schedule_cache', help="결과 캐시 폴더 (빈 문자열이면 사용 안 함)")
+    parser.add_argument('--store', help="작업 기록 SQLite 경로 (기본: <캐시 폴더>/jobs.sqlite3, 앱의 작업 기록과 공유)")
+    parser.add_argument('--profile', default='solver_profile.json', help="솔버 파라미터 프로파일 JSON (있을 때만 적용)")
+    args = parser.parse_args()
+    serve(args.host, args.port, args.pool, args.cores, args.cache_dir or None, args.store, args.profile)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,324 @@
+"""
+src/store.py
+최적화 작업 기록 (SQLite)
+
+Streamlit 세션이 끊기거나 서버가 재시작되어도 작업의 입력 지문·파라미터·상태·
+incumbent 이력·최종 결과(CompactResult JSON)가 남도록 디스크에 저장
+"""
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+
+from .cache import SolveCache, _VOLATILE_PARAMS
+from .result import CompactResult
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    created_at REAL, updated_at REAL, deadline REAL,
+    status TEXT, fingerprint TEXT, start_date TEXT, end_date TEXT,
+    label TEXT, params TEXT, resumed_from TEXT,
+    layout TEXT, incumbent TEXT,
+    objective REAL, shortage INTEGER, solutions INTEGER DEFAULT 0,
+    result TEXT, error TEXT
+);
+CREATE TABLE IF NOT EXISTS incumbents (
+    job_id TEXT, seq INTEGER, elapsed REAL, objective REAL, best_bound REAL,
+    gap REAL, shortage INTEGER, info TEXT,
+    PRIMARY KEY (job_id, seq)
+);
+CREATE TABLE IF NOT EXISTS payloads (
+    job_id TEXT PRIMARY KEY, payload TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_fingerprint ON jobs (fingerprint, status);
+"""
+
+# 목록에 표시하는 열 (결과·근무표 본문 제외)
+_LIST_COLUMNS = ['id', 'created_at', 'updated_at', 'status', 'fingerprint', 'start_date', 'end_date',
+                 'label', 'params', 'resumed_from', 'objective', 'shortage', 'solutions', 'error']
+
+# 요청 본문에만 있는 항목 (작업 파라미터 기록에서 제외)
+_PAYLOAD_ONLY = {'sheets', 'workbook', 'hint_table', 'repair'}
+
+# 시간 제한 종료 후에도 'running'으로 남아 있으면 중단된 작업으로 간주하는 여유 시간 (초)
+_GRACE_SECONDS = 120
+
+
+class JobStore:
+    """
+    작업 상태: (queued →) running → done / cancelled / error
+               (프로세스 종료로 끝나지 못한 작업은 interrupted, 이어서 풀기 시작하면 resumed)
+    - enqueue(): 스케줄링 서비스가 접수한 작업과 요청 본문 저장 → 서비스가 재시작되면 requeue()로 다시 실행
+    - optimize(): 작업 기록 + incumbent마다 이력·근무표 저장 + 완료 시 결과 저장
+    - 같은 입력 지문의 interrupted 작업이 있으면 마지막 incumbent를 힌트로 이어서 풀이
+    - 완료된 작업은 max_jobs개까지 보관 (오래된 것부터 삭제)
+    """
+
+    def __init__(self, path='.schedule_cache/jobs.sqlite3', max_jobs=200):
+        self.path = path
+        self.max_jobs = max_jobs
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as con:
+            con.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # 솔버 스레드와 화면 스레드가 함께 쓰므로 호출마다 연결을 새로 열고 닫음
+        con = sqlite3.connect(self.path, timeout=30)
+        con.row_factory = sqlite3.Row
+        try:
+            con.execute('PRAGMA journal_mode=WAL')
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    # --- 기록 ---
+
+    def create(self, scheduler, fingerprint, params=None, label=None, resumed_from=None, job_id=None):
+        """
+        실행 시작 기록 (job_id를 주면 접수·중단된 같은 작업 행을 running으로 다시 사용, 이전 incumbent 이력은 삭제)
+        """
+        job_id = job_id or uuid.uuid4().hex[:12]
+        now = time.time()
+        params = {k: v for k, v in (params or {}).items() if k not in _VOLATILE_PARAMS}
+        layout = {'nurse_ids': scheduler.df_nurse.iloc[:, 0].astype(str).tolist(), 'dates': scheduler.date_list}
+        with self._connect() as con:
+            con.execute('DELETE FROM incumbents WHERE job_id = ?', (job_id,))
+            con.execute(
+                'INSERT INTO jobs (id, created_at, updated_at, deadline, status, fingerprint, start_date, end_date, '
+                'label, params, resumed_from, layout) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(id) DO UPDATE SET updated_at = excluded.updated_at, deadline = excluded.deadline, '
+                'status = excluded.status, fingerprint = excluded.fingerprint, label = excluded.label, '
+                'params = excluded.params, resumed_from = excluded.resumed_from, layout = excluded.layout, '
+                'solutions = 0, error = NULL',
+                (job_id, now, now, now + float(params.get('max_time_seconds', 300)) + _GRACE_SECONDS, 'running',
+                 fingerprint, scheduler.start_date, scheduler.end_date, label,
+                 json.dumps(params, ensure_ascii=False, default=str), resumed_from, json.dumps(layout))
+            )
+        return job_id
+
+    def enqueue(self, job_id, payload, label=None):
+        """서비스 접수: queued 행 + 요청 본문 (실행이 끝나면 본문은 삭제)"""
+        now = time.time()
+        params = {k: v for k, v in payload.items()
+                  if k not in _VOLATILE_PARAMS and k not in _PAYLOAD_ONLY}
+        with self._connect() as con:
+            con.execute(
+                'INSERT INTO jobs (id, created_at, updated_at, status, start_date, end_date, label, params) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (job_id, now, now, 'queued', payload.get('start_date'), payload.get('end_date'), label,
+                 json.dumps(params, ensure_ascii=False, default=str))
+            )
+            con.execute('INSERT OR REPLACE INTO payloads VALUES (?, ?)',
+                        (job_id, json.dumps(payload, ensure_ascii=False, default=str)))
+        return job_id
+
+    def requeue(self, label):
+        """
+        서비스 재시작 시: 이전 프로세스에서 실행 중이던 작업 → interrupted,
+        아직 끝나지 않은 작업(queued·interrupted)의 (job_id, 요청 본문)을 접수 순서대로 반환
+        """
+        with self._connect() as con:
+            con.execute("UPDATE jobs SET status = 'interrupted' WHERE label = ? AND status = 'running'", (label,))
+            rows = con.execute(
+                "SELECT jobs.id, payloads.payload FROM jobs JOIN payloads ON payloads.job_id = jobs.id "
+                "WHERE jobs.label = ? AND jobs.status IN ('queued', 'interrupted') ORDER BY jobs.created_at",
+                (label,)
+            ).fetchall()
+        return [(row['id'], json.loads(row['payload'])) for row in rows]
+
+    def cancel_queued(self, job_id):
+        """실행 전에 취소된 접수 작업"""
+        with self._connect() as con:
+            con.execute("UPDATE jobs SET status = 'cancelled', updated_at = ? WHERE id = ? AND status = 'queued'",
+                        (time.time(), job_id))
+            con.execute('DELETE FROM payloads WHERE job_id = ?', (job_id,))
+
+    def add_incumbent(self, job_id, info):
+        roster = info.get('roster')
+        extra = {k: v for k, v in info.items()
+                 if k not in ('roster', 'solution', 'elapsed', 'objective', 'best_bound', 'gap', 'shortage')}
+        with self._connect() as con:
+            con.execute(
+                'INSERT OR REPLACE INTO incumbents VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (job_id, info.get('solution'), info.get('elapsed'), info.get('objective'), info.get('best_bound'),
+                 info.get('gap'), info.get('shortage'), json.dumps(extra))
+            )
+            con.execute(
+                'UPDATE jobs SET updated_at = ?, objective = ?, shortage = ?, solutions = solutions + 1'
+                + (', incumbent = ?' if roster else '') + ' WHERE id = ?',
+                (time.time(), info.get('objective'), info.get('shortage'))
+                + ((json.dumps(roster),) if roster else ()) + (job_id,)
+            )
+
+    def finish(self, job_id, result):
+        compact = CompactResult.from_dict(result)
+        status = 'cancelled' if compact.get('solve_stats', {}).get('cancelled') else 'done'
+        with self._connect() as con:
+            con.execute(
+                'UPDATE jobs SET status = ?, updated_at = ?, result = ?, incumbent = NULL, '
+                'shortage = COALESCE(shortage, ?) WHERE id = ?',
+                (status, time.time(), compact.to_json(), int(compact.analytics.shortage().sum()), job_id)
+            )
+            con.execute('DELETE FROM payloads WHERE job_id = ?', (job_id,))
+        self.prune()
+
+    def fail(self, job_id, error):
+        # 이미 끝난 작업(완료·취소)의 상태는 바꾸지 않음
+        with self._connect() as con:
+            con.execute("UPDATE jobs SET status = ?, updated_at = ?, error = ? WHERE id = ? "
+                        "AND status IN ('queued', 'running', 'interrupted')",
+                        ('error', time.time(), str(error), job_id))
+            con.execute('DELETE FROM payloads WHERE job_id = ?', (job_id,))
+
+    def recover(self):
+        """시간 제한이 지났는데도 끝나지 않은 작업 → interrupted (반환: 바뀐 작업 수)"""
+        with self._connect() as con:
+            cur = con.execute("UPDATE jobs SET status = 'interrupted' WHERE status = 'running' AND deadline < ?",
+                              (time.time(),))
+            return cur.rowcount
+
+    def prune(self):
+        with self._connect() as con:
+            ids = [r[0] for r in con.execute(
+                "SELECT id FROM jobs WHERE status NOT IN ('queued', 'running') "
+                "ORDER BY created_at DESC LIMIT -1 OFFSET ?",
+                (self.max_jobs,))]
+            for job_id in ids:
+                self._delete(con, job_id)
+
+    def delete(self, job_id):
+        with self._connect() as con:
+            self._delete(con, job_id)
+
+    @staticmethod
+    def _delete(con, job_id):
+        con.execute('DELETE FROM payloads WHERE job_id = ?', (job_id,))
+        con.execute('DELETE FROM incumbents WHERE job_id = ?', (job_id,))
+        con.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+
+    # --- 조회 ---
+
+    def list(self, limit=50):
+        self.recover()
+        with self._connect() as con:
+            rows = con.execute(
+                f"SELECT {', '.join(_LIST_COLUMNS)}, result IS NOT NULL AS has_result, "
+                f"incumbent IS NOT NULL AS has_incumbent FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        jobs = []
+        for row in rows:
+            job = dict(row)
+            job['params'] = json.loads(job['params'] or '{}')
+            job['has_result'], job['has_incumbent'] = bool(job['has_result']), bool(job['has_incumbent'])
+            jobs.append(job)
+        return jobs
+
+    def get(self, job_id):
+        self.recover()
+        with self._connect() as con:
+            row = con.execute(
+                f"SELECT {', '.join(_LIST_COLUMNS)}, result IS NOT NULL AS has_result, "
+                f"incumbent IS NOT NULL AS has_incumbent FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['params'] = json.loads(job['params'] or '{}')
+        job['has_result'], job['has_incumbent'] = bool(job['has_result']), bool(job['has_incumbent'])
+        return job
+
+    def load(self, job_id):
+        """완료 결과 → CompactResult (없으면 None)"""
+        with self._connect() as con:
+            row = con.execute('SELECT result FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None or row['result'] is None:
+            return None
+        compact = CompactResult.from_json(row['result'])
+        compact.meta['job'] = {'id': job_id}
+        return compact
+
+    def incumbents(self, job_id):
+        with self._connect() as con:
+            rows = con.execute(
+                'SELECT seq AS solution, elapsed, objective, best_bound, gap, shortage, info FROM incumbents '
+                'WHERE job_id = ? ORDER BY seq', (job_id,)
+            ).fetchall()
+        history = []
+        for row in rows:
+            info = dict(row)
+            info.update(json.loads(info.pop('info') or '{}'))
+            history.append(info)
+        return history
+
+    def resume_point(self, fingerprint, job_id=None):
+        """
+        같은 입력 지문의 가장 최근 interrupted 작업과 마지막 incumbent 근무표 (힌트 dict 형식)
+        job_id: 다시 실행하는 작업 자신이 중단된 상태로 incumbent를 가지고 있으면 그것을 우선 사용
+        """
+        self.recover()
+        with self._connect() as con:
+            row = None
+            if job_id:
+                row = con.execute(
+                    "SELECT id, layout, incumbent FROM jobs WHERE id = ? AND fingerprint = ? "
+                    "AND status = 'interrupted' AND incumbent IS NOT NULL", (job_id, fingerprint)
+                ).fetchone()
+            if row is None:
+                row = con.execute(
+                    "SELECT id, layout, incumbent FROM jobs WHERE fingerprint = ? AND status = 'interrupted' "
+                    "AND incumbent IS NOT NULL AND id IS NOT ? ORDER BY updated_at DESC LIMIT 1",
+                    (fingerprint, job_id)
+                ).fetchone()
+        if row is None:
+            return None
+        layout, roster = json.loads(row['layout']), json.loads(row['incumbent'])
+        shift = {'D': 'D', 'E': 'E', 'N': 'N', 'O': 'OFF'}
+        hint = {
+            'dates': [{'date': d} for d in layout['dates']],
+            'nurses': [{'nurse_id': nid, 'schedule': [shift[c] for c in codes]}
+                       for nid, codes in zip(layout['nurse_ids'], roster)]
+        }
+        return row['id'], hint
+
+    # --- 실행 ---
+
+    def optimize(self, scheduler, cache=None, resume=True, label=None, job_id=None, **params):
+        """
+        작업을 기록하며 scheduler.optimize(**params) (cache가 있으면 cache.optimize) 실행
+        - resume: 힌트가 없고 같은 입력의 interrupted 작업이 있으면 그 마지막 incumbent에서 이어서 풀이
+        - job_id: 서비스가 접수한 작업 행을 그대로 사용 (재시작 후 다시 실행하면 자신의 incumbent에서 이어서)
+        - 결과에 result['job'] = {'id', 'resumed_from'} 추가
+        """
+        fingerprint = SolveCache.fingerprint(scheduler, **params)
+        resumed_from = None
+        if resume and params.get('hint') is None:
+            point = self.resume_point(fingerprint, job_id)
+            if point:
+                resumed_from, params['hint'] = point
+        job_id = self.create(scheduler, fingerprint, params, label, resumed_from, job_id)
+        if resumed_from and resumed_from != job_id:
+            with self._connect() as con:
+                con.execute("UPDATE jobs SET status = 'resumed' WHERE id = ?", (resumed_from,))
+
+        outer = params.pop('on_solution', None)
+
+        def on_solution(info):
+            self.add_incumbent(job_id, info)
+            if outer:
+                outer({k: v for k, v in info.items() if k != 'roster'})
+
+        params.update(on_solution=on_solution, capture_roster=True)
+        try:
+            result = cache.optimize(scheduler, **params) if cache is not None else scheduler.optimize(**params)
+        except Exception as e:
+            self.fail(job_id, e)
+            raise
+        self.finish(job_id, result)
+        result['job'] = {'id': job_id, 'resumed_from': resumed_from}
+        return result
@@ -0,0 +1,61 @@
+"""
+src/tuning.py
+CP-SAT 파라미터 프로파일 (병동 규모별 권장 솔버 설정)
+"""
+import json
+
+# 간호사 수 × 일수(셀 수) 기준 규모 구간: (이름, 상한). 마지막 구간은 상한 없음
+SIZE_CLASSES = [('small', 1000), ('medium', 4000), ('large', None)]
+
+# 워커 수는 배치/서비스에서 코어 배분으로 정하므로 프로파일로 덮어쓰지 않음
+_RESERVED = {'num_search_workers', 'num_workers', 'max_time_in_seconds', 'log_search_progress'}
+
+
+def size_class(num_nurses, num_days):
+    cells = num_nurses * num_days
+    for name, limit in SIZE_CLASSES:
+        if limit is None or cells <= limit:
+            return name
+
+
+def apply_params(parameters, params):
+    """dict 형태의 설정을 SatParameters에 반영 (열거형은 이름 문자열로도 지정 가능)"""
+    for key, value in params.items():
+        if key in _RESERVED:
+            continue
+        if not hasattr(parameters, key):
+            raise Exception(f"알 수 없는 솔버 파라미터입니다: {key}")
+        if isinstance(value, str):
+            # 열거형 값 (예: 'PORTFOLIO_SEARCH')은 파라미터 객체의 상수로 변환
+            value = getattr(parameters, value)
+        setattr(parameters, key, value)
+
+
+class ParamProfile:
+    """
+    튜닝 결과 프로파일
+    {"classes": {"small": {"params": {...}, "score": ...}, ...}, "meta": {...}}
+    """
+
+    def __init__(self, classes=None, meta=None):
+        self.classes = classes or {}
+        self.meta = meta or {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get('classes'), data.get('meta'))
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'classes': self.classes, 'meta': self.meta}, f, ensure_ascii=False, indent=2)
+
+    def params_for(self, num_nurses, num_days):
+        """해당 규모 구간의 설정 (없으면 가장 가까운 작은 구간, 그것도 없으면 빈 설정)"""
+        name = size_class(num_nurses, num_days)
+        names = [n for n, _ in SIZE_CLASSES]
+        for cand in reversed(names[:names.index(name) + 1]):
+            if cand in self.classes:
+                return cand, dict(self.classes[cand].get('params', {}))
+        return name, {}
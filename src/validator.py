@@ -4,87 +4,121 @@ src/validator.py
 """
 from typing import Dict, List
 
+import numpy as np
+
+from .result import CompactResult, UNKNOWN
+
+# 근무 코드 (NurseScheduler.SHIFTS 순서)
+_D, _E, _N, _OFF = 0, 1, 2, 3
+
+
 class ScheduleValidator:
-    def __init__(self, result: Dict):
+    """
+    간호사 × 일 int8 행렬 위에서 벡터 연산으로 검증
+    - 위반은 먼저 (간호사, 일) 인덱스 배열로 기록 (self.index)
+    - 문자열 메시지는 필요할 때만 생성 (violation_messages / validate_all(messages=True))
+    - 공정성·투입 인원은 결과의 ScheduleAnalytics 집계를 그대로 사용
+    """
+
+    def __init__(self, result):
+        # 결과 dict 또는 CompactResult
         self.result = result
-        self.nurses = result['nurses']
-        self.dates = result['dates']
+        compact = CompactResult.from_dict(result)
+        self.analytics = compact.analytics
+        self.matrix = compact.matrix
+        self.names = compact.names
+        self.dates = compact.dates
         self.NUM_DAYS = len(self.dates)
-        
+
         self.violations = {
             'HC1': [], 'HC2': [], 'HC3': [], 'HC4': [], 'HC6': [], 'STF': []
         }
+        self.index = {}
         self.fairness = {}
         self.coverage_analysis = {}
-    
-    def validate_all(self) -> Dict:
+
+    def validate_all(self, messages: bool = True) -> Dict:
+        """messages=False면 violations에 메시지 대신 인덱스 배열(self.index)을 담아 반환"""
         self._check_constraints()
         self._analyze_fairness()
         self._check_coverage_and_staffing()
-        
+
+        if messages:
+            for code in self.violations:
+                self.violations[code] = self.violation_messages(code)
+            violations = self.violations
+        else:
+            violations = self.index
+
         return {
-            'violations': self.violations,
-            'total_violations': sum(len(v) for v in self.violations.values()),
+            'violations': violations,
+            'total_violations': sum(len(v['day']) for v in self.index.values()),
             'fairness': self.fairness,
             'coverage': self.coverage_analysis
         }
-    
+
     def _check_constraints(self):
-        for nurse in self.nurses:
-            sch = nurse['schedule']
-            name = nurse['name']
-            
-            for d in range(self.NUM_DAYS - 1):
-                if sch[d] == 'E' and sch[d+1] == 'D':
-                    self.violations['HC2'].append(f"{name} {self.dates[d]['date']} E→D")
-                if sch[d] == 'N' and sch[d+1] in ['E', 'D']:
-                    self.violations['HC2'].append(f"{name} {self.dates[d]['date']} N→{sch[d+1]}")
-                if sch[d] == 'N' and sch[d+1] != 'OFF':
-                    self.violations['HC4'].append(f"{name} {self.dates[d]['date']} N후 근무")
-
-            for d in range(self.NUM_DAYS - 2):
-                if sch[d] == 'N' and sch[d+1] == 'OFF' and sch[d+2] == 'D':
-                    self.violations['HC3'].append(f"{name} {self.dates[d]['date']} N-OFF-D")
-            
-            for d in range(self.NUM_DAYS - 6):
-                if 'OFF' not in sch[d:d+7]:
-                    self.violations['HC6'].append(f"{name} {self.dates[d]['date']}부터 7일 연속")
+        m = self.matrix
+        cur, nxt = m[:, :-1], m[:, 1:]
+
+        # HC2: E→D, N→E/D (간호사 → 일 순서)
+        hc2 = ((cur == _E) & (nxt == _D)) | ((cur == _N) & ((nxt == _E) | (nxt == _D)))
+        n_idx, d_idx = np.nonzero(hc2)
+        self.index['HC2'] = {'nurse': n_idx, 'day': d_idx, 'next': nxt[n_idx, d_idx], 'shift': cur[n_idx, d_idx]}
+
+        # HC4: N 다음 날 OFF가 아님
+        n_idx, d_idx = np.nonzero((cur == _N) & (nxt != _OFF))
+        self.index['HC4'] = {'nurse': n_idx, 'day': d_idx}
+
+        # HC3: N-OFF-D
+        n_idx, d_idx = np.nonzero((m[:, :-2] == _N) & (m[:, 1:-1] == _OFF) & (m[:, 2:] == _D))
+        self.index['HC3'] = {'nurse': n_idx, 'day': d_idx}
+
+        # HC6: 7일 창 안에 OFF가 없음 (OFF 누적합의 7일 차분이 0)
+        off_cum = np.zeros((m.shape[0], m.shape[1] + 1), dtype=np.int32)
+        np.cumsum(m == _OFF, axis=1, out=off_cum[:, 1:])
+        n_idx, d_idx = np.nonzero(off_cum[:, 7:] - off_cum[:, :-7] == 0)
+        self.index['HC6'] = {'nurse': n_idx, 'day': d_idx}
+
+        # HC1: 하루 1근무가 아닌 칸 (알 수 없는 근무 코드, 근무표가 기간보다 짧음)
+        n_idx, d_idx = np.nonzero(m == UNKNOWN)
+        self.index['HC1'] = {'nurse': n_idx, 'day': d_idx}
+
+    def violation_messages(self, code: str) -> List[str]:
+        """인덱스 배열 → 기존 형식의 위반 메시지"""
+        idx = self.index.get(code)
+        if idx is None:
+            return []
+        if code == 'STF':
+            return [f"{self.dates[d]} {'DEN'[s]} {'Charge 부재' if k == 0 else '신규 과다'}"
+                    for d, s, k in zip(idx['day'].tolist(), idx['shift'].tolist(), idx['kind'].tolist())]
+
+        names = self.names
+        pairs = zip(idx['nurse'].tolist(), idx['day'].tolist())
+        if code == 'HC2':
+            return [f"{names[n]} {self.dates[d]} " + ('E→D' if s == _E else f"N→{'DE'[x]}")
+                    for (n, d), s, x in zip(pairs, idx['shift'].tolist(), idx['next'].tolist())]
+        if code == 'HC1':
+            return [f"{names[n]} {self.dates[d]} 근무 코드 없음" for n, d in pairs]
+        if code == 'HC3':
+            return [f"{names[n]} {self.dates[d]} N-OFF-D" for n, d in pairs]
+        if code == 'HC4':
+            return [f"{names[n]} {self.dates[d]} N후 근무" for n, d in pairs]
+        if code == 'HC6':
+            return [f"{names[n]} {self.dates[d]}부터 7일 연속" for n, d in pairs]
+        return []
 
     def _analyze_fairness(self):
-        if not self.nurses:
-            self.fairness = {'work_days': {'deviation': 0}, 'night_shifts': {'deviation': 0}}
-            return
-
-        work_days = [n['work_days'] for n in self.nurses]
-        night_counts = [n['night_count'] for n in self.nurses]
-        
-        self.fairness = {
-            'work_days': {
-                'min': min(work_days), 'max': max(work_days), 'avg': sum(work_days)/len(work_days),
-                'deviation': max(work_days) - min(work_days)
-            },
-            'night_shifts': {
-                'min': min(night_counts), 'max': max(night_counts), 'avg': sum(night_counts)/len(night_counts),
-                'deviation': max(night_counts) - min(night_counts)
-            }
-        }
+        self.fairness = self.analytics.fairness()
 
     def _check_coverage_and_staffing(self):
+        empty = np.empty(0, dtype=np.int64)
+        self.index['STF'] = {'day': empty, 'shift': empty, 'kind': empty}
         if not self.dates: return
-        
-        d_cnt = [d['coverage']['D'] for d in self.dates]
-        e_cnt = [d['coverage']['E'] for d in self.dates]
-        n_cnt = [d['coverage']['N'] for d in self.dates]
-        
-        denom = len(self.dates) if self.dates else 1
-        self.coverage_analysis = {
-            'D': sum(d_cnt)/denom, 'E': sum(e_cnt)/denom, 'N': sum(n_cnt)/denom
-        }
-        
-        for date in self.dates:
-            d_str = date['date']
-            for s in ['D', 'E', 'N']:
-                if date['charge_nurses'][s] == 0:
-                    self.violations['STF'].append(f"{d_str} {s} Charge 부재")
-                if date['new_nurses'][s] > 3:
-                    self.violations['STF'].append(f"{d_str} {s} 신규 과다")
+
+        self.coverage_analysis = self.analytics.average_coverage()
+
+        # 날짜 → 근무조 → (Charge 부재, 신규 과다) 순서
+        flags = np.stack([self.analytics.charge_nurses == 0, self.analytics.new_nurses > 3], axis=2)
+        d_idx, s_idx, kind = np.nonzero(flags)
+        self.index['STF'] = {'day': d_idx, 'shift': s_idx, 'kind': kind}
@@ -2,25 +2,74 @@
 src/visualizer.py
 스케줄 시각화 모듈 (Stacked Bar & Enhanced Fairness)
 """
+import numpy as np
 import plotly.graph_objects as go
 
+from .analytics import ScheduleAnalytics
+
 class ScheduleVisualizer:
     
+    # 셀 수가 이보다 많으면 셀마다 근무 글자를 넣지 않음 (브라우저 전송량·렌더링 부담)
+    TEXT_CELL_LIMIT = 2000
+
     @staticmethod
-    def create_calendar_view(result):
-        nurses = result['nurses']
-        dates = result['dates']
-        nurse_names = [n['name'] for n in nurses]
-        date_labels = [f"{d['date']}<br>({d['day_of_week']})" for d in dates]
-        
-        shift_map = {'D': 1, 'E': 2, 'N': 3, 'OFF': 0}
-        z = [[shift_map[s] for s in n['schedule']] for n in nurses]
-        # 텍스트가 너무 많으면 지저분하므로, 이니셜만 표시하거나 그대로 표시
-        text = [[s for s in n['schedule']] for n in nurses]
-        
+    def _roster(result):
+        """결과(dict 또는 CompactResult) → (근무 코드 행렬, 이름, Level, 날짜, 요일)"""
+        if hasattr(result, 'matrix'):
+            return (result.matrix, list(result.names), list(result.levels), list(result.dates),
+                    list(result.day_of_week))
+        codes = {'D': 0, 'E': 1, 'N': 2, 'OFF': 3}
+        nurses, dates = result['nurses'], result['dates']
+        matrix = np.array([[codes[s] for s in n['schedule']] for n in nurses], dtype=np.int8)
+        return (matrix.reshape(len(nurses), len(dates)), [n['name'] for n in nurses],
+                [n.get('level') for n in nurses], [d['date'] for d in dates], [d['day_of_week'] for d in dates])
+
+    @staticmethod
+    def _analytics(result):
+        """CompactResult는 보관된 집계, dict 결과는 새로 집계"""
+        return result.analytics if hasattr(result, 'analytics') else ScheduleAnalytics.from_result(result)
+
+    @staticmethod
+    def _names(result):
+        return list(result.names) if hasattr(result, 'names') else [n['name'] for n in result['nurses']]
+
+    @staticmethod
+    def create_calendar_view(result, levels=None, date_range=None, page=0, page_size=None,
+                             text_limit=None):
+        """
+        levels: 표시할 Level 목록 (None이면 전체)
+        date_range: (시작일, 종료일) 문자열, 포함 범위 (None이면 전체 기간)
+        page/page_size: 간호사 행 페이지 (page_size가 None이면 한 페이지)
+        text_limit: 셀 글자를 표시할 최대 셀 수 (기본 TEXT_CELL_LIMIT)
+        """
+        matrix, names, nurse_levels, dates, dows = ScheduleVisualizer._roster(result)
+        rows = np.arange(len(names))
+        if levels:
+            rows = rows[np.isin(np.array(nurse_levels, dtype=object), list(levels))]
+        if page_size:
+            rows = rows[page * page_size:(page + 1) * page_size]
+        lo, hi = 0, len(dates)
+        if date_range:
+            lo = next((i for i, d in enumerate(dates) if d >= date_range[0]), len(dates))
+            hi = next((i for i, d in enumerate(dates) if d > date_range[1]), len(dates))
+
+        # 근무 코드(D=0,E=1,N=2,OFF=3) → 색상 값(OFF=0,D=1,E=2,N=3)
+        sub = matrix[rows, lo:hi]
+        z = np.array([1, 2, 3, 0], dtype=np.int8)[sub]
+        nurse_names = [names[i] for i in rows]
+        date_labels = [f"{d}<br>({w})" for d, w in zip(dates[lo:hi], dows[lo:hi])]
+
+        limit = ScheduleVisualizer.TEXT_CELL_LIMIT if text_limit is None else text_limit
+        show_text = sub.size <= limit
+        # 텍스트가 너무 많으면 지저분하므로, 셀 수가 적을 때만 근무를 글자로 표시
+        if show_text:
+            text_args = dict(text=np.array(['D', 'E', 'N', 'OFF'])[sub].tolist(), texttemplate='%{text}')
+        else:
+            text_args = dict(hovertemplate='%{y}<br>%{x}<extra></extra>')
+
         fig = go.Figure(data=go.Heatmap(
-            z=z, x=date_labels, y=nurse_names,
-            text=text, texttemplate='%{text}',
+            z=z.tolist(), x=date_labels, y=nurse_names,
+            **text_args,
             # 색상: OFF(회색), D(노랑), E(주황), N(파랑)
             colorscale=[
                 [0.0, '#eeeeee'], [0.25, '#eeeeee'], # OFF
@@ -28,12 +77,13 @@ class ScheduleVisualizer:
                 [0.5, '#FF8C00'], [0.75, '#FF8C00'], # E
                 [0.75, '#4169E1'], [1.0, '#4169E1']  # N
             ],
-            showscale=False, xgap=1, ygap=1
+            zmin=0, zmax=3,
+            showscale=False, xgap=1 if show_text else 0, ygap=1 if show_text else 0
         ))
         fig.update_layout(
             title="📅 월간 근무표 (Heatmap)", 
-            height=max(400, len(nurses)*40),
-            xaxis_nticks=len(dates)
+            height=max(400, len(nurse_names) * (40 if show_text else 16)),
+            xaxis_nticks=len(date_labels) if show_text else min(len(date_labels), 31)
         )
         return fig
 
@@ -43,19 +93,11 @@ class ScheduleVisualizer:
         [개선] 단순 총량 비교 -> 근무 유형별(D/E/N) 누적 막대 그래프
         누가 힘든 근무(N)를 많이 했는지 한눈에 파악 가능
         """
-        nurses = result['nurses']
-        names = [n['name'] for n in nurses]
-        
-        # 근무별 카운트 집계
-        d_counts = []
-        e_counts = []
-        n_counts = []
+        names = ScheduleVisualizer._names(result)
         
-        for n in nurses:
-            sch = n['schedule']
-            d_counts.append(sch.count('D'))
-            e_counts.append(sch.count('E'))
-            n_counts.append(sch.count('N'))
+        # 근무별 카운트 (결과의 집계를 그대로 사용)
+        counts = ScheduleVisualizer._analytics(result).shift_counts
+        d_counts, e_counts, n_counts = (counts[:, s].tolist() for s in range(3))
             
         fig = go.Figure()
         
@@ -104,15 +146,15 @@ class ScheduleVisualizer:
 
     @staticmethod
     def create_coverage_chart(result):
-        dates = [d['date'] for d in result['dates']]
-        d_c = [d['coverage']['D'] for d in result['dates']]
-        e_c = [d['coverage']['E'] for d in result['dates']]
-        n_c = [d['coverage']['N'] for d in result['dates']]
+        analytics = ScheduleVisualizer._analytics(result)
+        dates = analytics.dates
+        d_c, e_c, n_c = (analytics.coverage[:, s].tolist() for s in range(3))
         
         fig = go.Figure()
-        fig.add_trace(go.Scatter(x=dates, y=d_c, name='Day', line=dict(color='#FFD700', width=3)))
-        fig.add_trace(go.Scatter(x=dates, y=e_c, name='Evening', line=dict(color='#FF8C00', width=3)))
-        fig.add_trace(go.Scatter(x=dates, y=n_c, name='Night', line=dict(color='#4169E1', width=3)))
+        # WebGL 트레이스: 연간 기간에서도 렌더링 부담이 작음
+        fig.add_trace(go.Scattergl(x=dates, y=d_c, name='Day', line=dict(color='#FFD700', width=3)))
+        fig.add_trace(go.Scattergl(x=dates, y=e_c, name='Evening', line=dict(color='#FF8C00', width=3)))
+        fig.add_trace(go.Scattergl(x=dates, y=n_c, name='Night', line=dict(color='#4169E1', width=3)))
         
         fig.update_layout(
             title="📉 일별 투입 인원 현황", 
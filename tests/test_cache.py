@@ -0,0 +1,25 @@
+"""
+tests/test_cache.py
+결과 캐시 키 (솔버 프로파일 파일은 경로가 아니라 내용으로 구분)
+"""
+from src.cache import SolveCache
+from src.scheduler import NurseScheduler
+from src.tuning import ParamProfile
+from utils.ward_generator import WardGenerator
+
+
+def test_fingerprint_follows_profile_contents(tmp_path):
+    sheets = WardGenerator.generate(4, 7)
+    dates = sheets['Daily_Coverage']['Coverage_Date']
+    scheduler = NurseScheduler(sheets, dates.iat[0], dates.iat[-1])
+    path = str(tmp_path / 'solver_profile.json')
+
+    ParamProfile({'small': {'linearization_level': 1}}).save(path)
+    key = SolveCache.fingerprint(scheduler, param_profile=path)
+    assert SolveCache.fingerprint(scheduler, param_profile=path) == key
+    # 같은 내용의 ParamProfile 객체와 같은 키
+    assert SolveCache.fingerprint(scheduler, param_profile=ParamProfile.load(path)) == key
+
+    # 같은 경로에 다시 튜닝한 프로파일 → 다른 키
+    ParamProfile({'small': {'linearization_level': 2}}).save(path)
+    assert SolveCache.fingerprint(scheduler, param_profile=path) != key
@@ -0,0 +1,53 @@
+"""
+tests/test_client.py
+서비스 클라이언트 요청 본문 (웜스타트 힌트 형식별 전달)
+"""
+import io
+
+import pandas as pd
+
+from src.client import ServiceClient
+from src.result import CompactResult
+from src.scheduler import NurseScheduler
+from utils.ward_generator import WardGenerator
+
+
+def submitted_body(hint):
+    client = ServiceClient()
+    sent = {}
+    client._request = lambda method, path, body=None: sent.update(body) or {'job_id': 'x', 'state': 'queued'}
+    sheets = WardGenerator.generate(4, 7)
+    dates = sheets['Daily_Coverage']['Coverage_Date']
+    client.submit(sheets, dates.iat[0], dates.iat[-1], max_time_seconds=5, hint=hint)
+    return sheets, sent
+
+
+def test_dataframe_hint_is_sent_as_hint_table():
+    sheets, _ = submitted_body(None)
+    dates = sorted(sheets['Daily_Coverage']['Coverage_Date'].unique())
+    table = pd.DataFrame({'Date': dates * 2, 'Name': ['N0'] * 7 + ['N1'] * 7,
+                          'Shift': ['D', 'E', 'N', 'OFF', 'D', 'D', 'OFF'] * 2})
+    sheets, body = submitted_body(table)
+    assert 'hint' not in body
+    assert 'hint_table' in body
+
+    # 서비스(_run_job)와 같은 방식으로 복원 → 힌트가 실제로 적용되는지
+    decoded = pd.read_json(io.StringIO(body['hint_table']), orient='split', dtype=False, convert_dates=False)
+    scheduler = NurseScheduler(sheets, dates[0], dates[-1])
+    hinted, offset = scheduler._hint_assignments(decoded)
+    assert offset == 0
+    assert len(hinted) == 14
+    assert hinted[(1, 2)] == 2
+
+
+def test_compact_result_hint_is_sent_as_result_dict():
+    sheets = WardGenerator.generate(4, 7)
+    dates = sheets['Daily_Coverage']['Coverage_Date'].unique().tolist()
+    result = {'nurses': [{'nurse_id': f'N{n}', 'name': f'N{n}', 'level': 'Regular', 'schedule': ['D'] * 7}
+                         for n in range(4)],
+              'dates': [{'date': d, 'day_of_week': '월', 'coverage': {'D': 4, 'E': 0, 'N': 0},
+                         'new_nurses': {'D': 0, 'E': 0, 'N': 0}, 'charge_nurses': {'D': 0, 'E': 0, 'N': 0}}
+                        for d in dates]}
+    _, body = submitted_body(CompactResult.from_dict(result))
+    assert 'hint_table' not in body
+    assert [n['schedule'] for n in body['hint']['nurses']] == [['D'] * 7] * 4
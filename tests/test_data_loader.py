@@ -0,0 +1,46 @@
+"""
+tests/test_data_loader.py
+엑셀 시트 캐시 (Parquet) 개수 한도·LRU 정리
+"""
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from utils.data_loader import DataLoader
+
+pytest.importorskip('pyarrow')
+
+
+def write_workbook(path, num_nurses):
+    nurses = pd.DataFrame({'Nurse_ID': [f'N{i:03d}' for i in range(num_nurses)],
+                           'Name': [f'간호사{i}' for i in range(num_nurses)], 'Level': 'Regular'})
+    with pd.ExcelWriter(path) as writer:
+        nurses.to_excel(writer, sheet_name='Nurse', index=False)
+    return str(path)
+
+
+def cached_entries(cache_dir):
+    return {name for name in os.listdir(cache_dir) if os.path.isfile(os.path.join(cache_dir, name, 'sheets.txt'))}
+
+
+def test_sheet_cache_evicts_least_recently_used(tmp_path):
+    cache_dir = str(tmp_path / 'sheets')
+    books = [write_workbook(tmp_path / f'ward{i}.xlsx', 3 + i) for i in range(3)]
+    keys = []
+    for path in books:
+        before = cached_entries(cache_dir) if os.path.isdir(cache_dir) else set()
+        DataLoader.load_excel(path, selective=True, cache_dir=cache_dir)
+        keys.append((cached_entries(cache_dir) - before).pop())
+        time.sleep(0.01)
+
+    # 첫 파일을 다시 읽으면(적중) 가장 최근 사용 → 두 번째 파일이 먼저 삭제됨
+    sheets = DataLoader.load_excel(books[0], selective=True, cache_dir=cache_dir)
+    assert len(sheets['Nurse']) == 3
+    DataLoader.evict_cache(cache_dir, max_entries=2)
+    assert cached_entries(cache_dir) == {keys[0], keys[2]}
+
+    # 용량 한도
+    DataLoader.evict_cache(cache_dir, max_bytes=0)
+    assert cached_entries(cache_dir) == set()
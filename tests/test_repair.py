@@ -0,0 +1,26 @@
+"""
+tests/test_repair.py
+긴급 재조정 결과의 재최적화 구간 보고
+"""
+from datetime import date
+
+from src.scheduler import NurseScheduler
+from utils.ward_generator import WardGenerator
+
+
+def test_repair_reports_window_length():
+    sheets = WardGenerator.generate(8, 14, seed=0)
+    dates = sheets['Daily_Coverage']['Coverage_Date']
+    scheduler = NurseScheduler(sheets, dates.iat[0], dates.iat[-1])
+    published = scheduler.optimize(max_time_seconds=3, num_workers=2, log_progress=False)
+
+    nurse = published['nurses'][0]
+    day = next(d for d, s in enumerate(nurse['schedule']) if s != 'OFF' and 3 <= d <= 10)
+    changes = [{'nurse': nurse['nurse_id'], 'dates': [scheduler.date_list[day]]}]
+    repaired = NurseScheduler(sheets, dates.iat[0], dates.iat[-1]).repair(
+        published, changes, window=2, max_time_seconds=3, num_workers=2)
+
+    info = repaired['repair']
+    start, end = (date.fromisoformat(d) for d in info['window'])
+    assert info['window_days'] == (end - start).days + 1
+    assert repaired['nurses'][0]['schedule'][day] == 'OFF'
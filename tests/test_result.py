@@ -0,0 +1,36 @@
+"""
+tests/test_result.py
+결과 dict → CompactResult 변환 (알 수 없는 근무 코드·길이가 맞지 않는 근무표)
+"""
+from src.result import CompactResult, UNKNOWN
+from src.validator import ScheduleValidator
+
+
+def make_result(schedules, num_days=3):
+    dates = [f'2026-01-0{d + 1}' for d in range(num_days)]
+    return {
+        'status': 'OPTIMAL',
+        'nurses': [{'nurse_id': f'N{n}', 'name': f'간호사{n}', 'level': 'Regular', 'schedule': s}
+                   for n, s in enumerate(schedules)],
+        'dates': [{'date': d, 'day_of_week': '월',
+                   'coverage': {'D': 0, 'E': 0, 'N': 0}, 'new_nurses': {'D': 0, 'E': 0, 'N': 0},
+                   'charge_nurses': {'D': 0, 'E': 0, 'N': 0}} for d in dates]
+    }
+
+
+def test_unknown_codes_and_short_rows_become_unknown_cells():
+    result = make_result([['D', 'X', 'OFF'], ['E', 'OFF'], ['N', 'OFF', 'D', 'D']])
+    compact = CompactResult.from_dict(result)
+    assert compact.matrix.tolist() == [[0, UNKNOWN, 3], [1, 3, UNKNOWN], [2, 3, 0]]
+    # 빈 칸은 근무·휴무 어디에도 세지 않음
+    assert compact.analytics.work_days.tolist() == [1, 1, 2]
+    assert compact.analytics.off_count.tolist() == [1, 1, 1]
+
+    # JSON 왕복에서도 빈 칸 유지
+    assert CompactResult.from_json(compact.to_json()).matrix.tolist() == compact.matrix.tolist()
+
+
+def test_validator_reports_unknown_cells():
+    report = ScheduleValidator(make_result([['D', 'X', 'OFF'], ['E', 'OFF']])).validate_all()
+    assert report['violations']['HC1'] == ['간호사0 2026-01-02 근무 코드 없음', '간호사1 2026-01-03 근무 코드 없음']
+    assert report['total_violations'] >= 2
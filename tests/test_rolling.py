@@ -0,0 +1,47 @@
+"""
+tests/test_rolling.py
+롤링 호라이즌: 취소 시 확정 구간까지의 부분 결과, 구간별 사전 점검 병합
+"""
+import threading
+
+import pytest
+
+from src.rolling import RollingHorizonScheduler
+from utils.ward_generator import WardGenerator
+
+
+def make_planner():
+    sheets = WardGenerator.generate(8, 28, seed=0)
+    dates = sheets['Daily_Coverage']['Coverage_Date']
+    return RollingHorizonScheduler(sheets, dates.iat[0], dates.iat[-1], window_days=14, commit_days=7)
+
+
+def test_cancel_returns_committed_windows():
+    planner = make_planner()
+    stop = threading.Event()
+
+    def on_window(info):
+        if info['index'] == 1:
+            stop.set()
+
+    result = planner.optimize(max_time_seconds=5, num_workers=2, on_window=on_window, stop_event=stop)
+    # 두 번째 구간까지 확정 (7일 + 7일), 세 번째 구간은 시작하지 않음
+    assert result['status'] == 'FEASIBLE'
+    assert result['stop_reason'] == 'cancelled'
+    assert result['solve_stats']['cancelled']
+    assert result['rolling']['partial']
+    assert len(result['rolling']['windows']) == 2
+    assert len(result['dates']) == 14
+    assert result['end_date'] == planner.date_list[13]
+    assert all(len(n['schedule']) == 14 for n in result['nurses'])
+    assert all(n['off_count'] == 14 - n['work_days'] for n in result['nurses'])
+
+    # 풀었던 두 구간의 사전 점검이 모두 남음
+    assert [w['start'] for w in result['precheck']['windows']] == [planner.date_list[0], planner.date_list[7]]
+
+
+def test_cancel_before_first_window_raises():
+    stop = threading.Event()
+    stop.set()
+    with pytest.raises(Exception, match="확정된 구간 없음"):
+        make_planner().optimize(max_time_seconds=5, num_workers=2, stop_event=stop)
@@ -0,0 +1,92 @@
+"""
+tests/test_service.py
+스케줄링 서비스 재시작 시 작업 복구 (JobStore에 남은 작업을 같은 job_id로 이어서 실행)
+"""
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.client import ServiceClient
+from src.store import JobStore
+from utils.ward_generator import WardGenerator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_service(port, store_path):
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'src.service', '--port', str(port), '--pool', '1', '--cores', '2',
+         '--cache-dir', '', '--store', store_path, '--profile', ''],
+        cwd=ROOT, start_new_session=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    client = ServiceClient(f'http://127.0.0.1:{port}', timeout=5)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if client.health():
+            return proc, client
+        time.sleep(0.2)
+    stop_service(proc)
+    pytest.fail("서비스가 시작되지 않았습니다.")
+
+
+def stop_service(proc, sig=signal.SIGKILL):
+    # 솔버 프로세스 풀까지 함께 종료 (프로세스 그룹)
+    try:
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass
+    proc.wait(timeout=30)
+
+
+def wait_for(predicate, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        value = predicate()
+        if value:
+            return value
+        time.sleep(0.3)
+    return None
+
+
+def test_job_survives_service_restart(tmp_path):
+    store_path = str(tmp_path / 'jobs.sqlite3')
+    sheets = WardGenerator.generate(12, 14, seed=1)
+    dates = sheets['Daily_Coverage']['Coverage_Date']
+
+    port = free_port()
+    proc, client = start_service(port, store_path)
+    try:
+        job_id = client.submit(sheets, dates.iat[0], dates.iat[-1], max_time_seconds=120,
+                               stop_rules={'plateau_seconds': 3})['job_id']
+        # 첫 incumbent가 기록된 뒤 서비스를 강제 종료
+        assert wait_for(lambda: JobStore(store_path).get(job_id)['solutions'] > 0, 60)
+    finally:
+        stop_service(proc)
+    assert JobStore(store_path).get(job_id)['status'] == 'running'
+
+    port = free_port()
+    proc, client = start_service(port, store_path)
+    try:
+        status = wait_for(lambda: (lambda s: s if s['state'] not in ('queued', 'running') else None)(
+            client.status(job_id)), 120)
+        assert status is not None and status["state"] == "done", status["error"]
+        result = client.result(job_id)
+        assert len(result['nurses']) == 12
+    finally:
+        stop_service(proc, signal.SIGTERM)
+
+    job = JobStore(store_path).get(job_id)
+    assert job['status'] == 'done'
+    assert job['label'] == 'service'
+    assert job['resumed_from'] == job_id
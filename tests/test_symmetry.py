@@ -0,0 +1,109 @@
+"""
+tests/test_symmetry.py
+대칭 제거: 소형 병동에서 가능한 근무표를 잃지 않는지, 자리 대응표가 원래 간호사로 되돌아가는지
+"""
+import itertools
+
+import pytest
+from ortools.sat.python import cp_model
+
+from src.scheduler import NurseScheduler
+from utils.ward_generator import WardGenerator
+
+
+class RosterCollector(cp_model.CpSolverSolutionCallback):
+    def __init__(self, shifts):
+        super().__init__()
+        self.shifts = shifts
+        self.rosters = set()
+
+    def on_solution_callback(self):
+        N, D, _ = self.shifts.shape
+        self.rosters.add(tuple(tuple(next(s for s in range(4) if self.Value(self.shifts[n, d, s]))
+                                     for d in range(D)) for n in range(N)))
+
+
+class FixedSolver:
+    """모델 자리별 근무표를 변수 값으로 돌려주는 솔버 대역 (_format_result용)"""
+
+    def __init__(self, shifts, slots):
+        self.values = {shifts[n, d, s].Index(): int(slots[n][d] == s)
+                       for n in range(len(slots)) for d in range(len(slots[n])) for s in range(4)}
+
+    def Value(self, var):
+        return self.values[var.Index()]
+
+    @staticmethod
+    def StatusName(status):
+        return 'OPTIMAL'
+
+
+def make_scheduler(num_nurses, num_days):
+    sheets = WardGenerator.generate(num_nurses, num_days, level_mix={'Regular': 1.0}, request_density=0)
+    dates = sheets['Daily_Coverage']['Coverage_Date']
+    return NurseScheduler(sheets, dates.iat[0], dates.iat[-1])
+
+
+def enumerate_rosters(sch, groups):
+    model, shifts, _ = sch._build_model()
+    req = sch.base_requirement(sch.NUM_NURSES)
+    for i, short in enumerate(sch.short_vars):
+        # 부족 변수를 부족 인원으로 고정해 같은 근무표가 반복 열거되지 않도록
+        d, s_idx = divmod(i, 3)
+        model.AddMaxEquality(short, [req['DEN'[s_idx]] - sum(shifts[:, d, s_idx].tolist()), 0])
+    sch._add_symmetry_breaking(model, shifts, groups)
+    solver = cp_model.CpSolver()
+    solver.parameters.enumerate_all_solutions = True
+    solver.parameters.num_search_workers = 1
+    collector = RosterCollector(shifts)
+    assert solver.Solve(model, collector) == cp_model.OPTIMAL
+    return collector.rosters, shifts
+
+
+def permutations(roster, groups):
+    variants = {tuple(roster)}
+    for group in groups:
+        variants = {tuple(r[perm[group.index(n)]] if n in group else r[n] for n in range(len(r)))
+                    for r in variants for perm in itertools.permutations(group)}
+    return variants
+
+
+@pytest.fixture(scope='module', params=[(2, 2), (2, 3)], ids=['2x2', '2x3'])
+def ward(request):
+    sch = make_scheduler(*request.param)
+    groups = sch._symmetry_groups()
+    full, _ = enumerate_rosters(sch, [])
+    broken, shifts = enumerate_rosters(sch, groups)
+    return sch, groups, full, broken, shifts
+
+
+def test_interchangeable_nurses_form_one_group(ward):
+    sch, groups, *_ = ward
+    assert groups == [list(range(sch.NUM_NURSES))]
+
+
+def test_no_roster_lost(ward):
+    _, groups, full, broken, _ = ward
+    assert broken < full
+    assert set().union(*(permutations(r, groups) for r in broken)) == full
+
+
+def test_hint_slots_map_back_to_real_nurses(ward):
+    sch, groups, full, broken, shifts = ward
+    dates = [{'date': d} for d in sch.date_list]
+    for roster in full:
+        # 결과 dict 형식 힌트 → _hint_assignments → 자리 배정
+        hint = {'dates': dates, 'nurses': [
+            {'nurse_id': f'N{n}', 'name': None, 'schedule': [sch.SHIFTS[s] for s in row]}
+            for n, row in enumerate(roster)]}
+        hinted, offset = sch._hint_assignments(hint)
+        assert offset == 0
+        slot_of = sch._symmetry_slots(groups, hinted)
+        slots = [None] * sch.NUM_NURSES
+        for n, slot in enumerate(slot_of):
+            slots[slot] = roster[n]
+        assert tuple(slots) in broken
+
+        result = sch._format_result(FixedSolver(shifts, slots), shifts, cp_model.OPTIMAL, 0, slot_of)
+        restored = tuple(tuple(sch.SHIFTS.index(c) for c in nurse['schedule']) for nurse in result['nurses'])
+        assert restored == roster
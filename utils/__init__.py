@@ -1,8 +1,20 @@
 """
-유틸리티 모듈
+유틸리티 모듈 (사용할 때 불러옴)
 """
+import importlib
 
-from .data_loader import DataLoader
+_EXPORTS = {
+    'DataLoader': 'data_loader',
+    'WardGenerator': 'ward_generator',
+    'RosterExporter': 'exporter',
+}
 
-__all__ = ['DataLoader']
+__all__ = list(_EXPORTS)
 
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,28 +1,195 @@
-import pandas as pd
+import hashlib
 import io
+import os
+import re
+import shutil
+
+import pandas as pd
+
+# 스케줄러가 읽는 시트와 컬럼: (시트 이름 패턴, 컬럼 이름에 포함된 키워드)
+# 병동 접미사가 붙은 시트(Nurse_71병동 등)도 포함, 첫 컬럼(ID)은 항상 유지
+SCHEDULER_SHEETS = {
+    'nurse': (r'^nurses?([ _\-].+)?$', ['id', 'name', '이름', 'level', '직급']),
+    'requests': (r'^requests?([ _\-].+)?$', ['id', 'date', '날짜', 'type', 'status']),
+    'coverage': (r'(daily|coverage)', ['date', '날짜', 'shift', 'min']),
+}
+# 수치로 읽을 컬럼 키워드 (나머지 선택 컬럼은 문자열)
+_NUMERIC_KEYWORDS = ['min', 'priority', 'score']
+# 시트 캐시(cache_dir) 한도: 넘으면 오래 사용하지 않은 파일부터 삭제
+SHEET_CACHE_MAX_ENTRIES = 50
+SHEET_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
 
 class DataLoader:
     @staticmethod
-    def load_excel(uploaded_file):
-        """엑셀 파일을 로드하여 시트별로 분리"""
+    def _engine():
+        """python-calamine이 있고 pandas가 지원하면(2.2+) calamine 엔진, 아니면 openpyxl(read-only)"""
+        try:
+            import python_calamine  # noqa: F401
+        except ImportError:
+            return 'openpyxl'
+        major, minor = (int(v) for v in pd.__version__.split('.')[:2])
+        return 'calamine' if (major, minor) >= (2, 2) else 'openpyxl'
+
+    @staticmethod
+    def _content(uploaded_file):
+        """경로·업로드 파일 객체 → 바이트"""
+        if isinstance(uploaded_file, (str, os.PathLike)):
+            with open(uploaded_file, 'rb') as f:
+                return f.read()
+        if hasattr(uploaded_file, 'getvalue'):
+            return uploaded_file.getvalue()
+        data = uploaded_file.read()
+        uploaded_file.seek(0)
+        return data
+
+    @staticmethod
+    def _select_columns(columns, keywords):
+        """첫 컬럼 + 키워드가 들어 있는 컬럼의 위치"""
+        return [i for i, c in enumerate(columns)
+                if i == 0 or any(k in str(c).strip().lower() for k in keywords)]
+
+    @staticmethod
+    def load_excel(uploaded_file, selective=False, cache_dir=None):
+        """
+        엑셀 파일을 로드하여 시트별로 분리
+        selective: 스케줄러가 쓰는 시트·컬럼(SCHEDULER_SHEETS)만 명시 dtype으로 읽기
+        cache_dir: 파일 내용 해시별로 읽은 시트를 Parquet으로 저장해 같은 파일은 다시 파싱하지 않음
+                   (SHEET_CACHE_MAX_ENTRIES개·SHEET_CACHE_MAX_BYTES 초과 시 오래 사용하지 않은 파일부터 삭제)
+        """
         if uploaded_file is None:
             return None
         
         try:
+            content = DataLoader._content(uploaded_file)
+            cache_path = None
+            if cache_dir:
+                key = hashlib.sha256(content).hexdigest()[:32] + ('-sel' if selective else '')
+                cache_path = os.path.join(cache_dir, key)
+                cached = DataLoader._read_cache(cache_path)
+                if cached is not None:
+                    return cached
+
             # 엑셀 파일 읽기
-            xl = pd.ExcelFile(uploaded_file)
-            sheets = {sheet_name: xl.parse(sheet_name) for sheet_name in xl.sheet_names}
+            if selective:
+                sheets = DataLoader._load_selected(content)
+            else:
+                xl = pd.ExcelFile(io.BytesIO(content))
+                sheets = {sheet_name: xl.parse(sheet_name) for sheet_name in xl.sheet_names}
             
             # 컬럼명 공백 제거 및 소문자 변환 (유연성 확보)
             for name, df in sheets.items():
                 if not df.empty:
                     # 문자열 컬럼만 공백 제거
                     df.columns = df.columns.astype(str).str.strip()
-            
+
+            if cache_path:
+                DataLoader._write_cache(cache_path, sheets)
+                DataLoader.evict_cache(cache_dir)
             return sheets
         except Exception as e:
             raise Exception(f"데이터 로딩 중 오류가 발생했습니다: {str(e)}")
 
+    @staticmethod
+    def _sheet_spec(sheet_name):
+        return next((kw for pattern, kw in SCHEDULER_SHEETS.values()
+                     if re.search(pattern, sheet_name.strip(), re.IGNORECASE)), None)
+
+    @staticmethod
+    def _load_selected(content):
+        """SCHEDULER_SHEETS에 해당하는 시트의 필요한 컬럼만 읽기 (텍스트 컬럼은 str)"""
+        sheets = {}
+        if DataLoader._engine() == 'calamine':
+            xl = pd.ExcelFile(io.BytesIO(content), engine='calamine')
+            for sheet_name in xl.sheet_names:
+                spec = DataLoader._sheet_spec(sheet_name)
+                if spec is None:
+                    continue
+                header = list(xl.parse(sheet_name, nrows=0).columns)
+                cols = DataLoader._select_columns(header, spec)
+                dtypes = {header[i]: str for i in cols
+                          if not any(k in str(header[i]).lower() for k in _NUMERIC_KEYWORDS)}
+                sheets[sheet_name] = xl.parse(sheet_name, usecols=cols, dtype=dtypes)
+            return sheets
+
+        # openpyxl read-only 모드로 값만 순회 (pandas 변환 단계를 거치지 않아 더 빠름)
+        from openpyxl import load_workbook
+        wb = load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+        try:
+            for ws in wb.worksheets:
+                spec = DataLoader._sheet_spec(ws.title)
+                if spec is None:
+                    continue
+                rows = ws.iter_rows(values_only=True)
+                header = next(rows, None)
+                if header is None:
+                    sheets[ws.title] = pd.DataFrame()
+                    continue
+                cols = [i for i in DataLoader._select_columns(header, spec) if header[i] is not None]
+                data = [[row[i] if i < len(row) else None for i in cols] for row in rows]
+                df = pd.DataFrame([r for r in data if any(v is not None for v in r)],
+                                  columns=[str(header[i]) for i in cols])
+                for col in df.columns:
+                    if any(k in col.lower() for k in _NUMERIC_KEYWORDS):
+                        df[col] = df[col].infer_objects()
+                    else:
+                        df[col] = df[col].map(lambda v: v if v is None else str(v))
+                sheets[ws.title] = df
+        finally:
+            wb.close()
+        return sheets
+
+    @staticmethod
+    def _read_cache(path):
+        manifest = os.path.join(path, 'sheets.txt')
+        if not os.path.exists(manifest):
+            return None
+        try:
+            with open(manifest, encoding='utf-8') as f:
+                names = f.read().split('\n')
+            sheets = {name: pd.read_parquet(os.path.join(path, f'{i}.parquet'))
+                      for i, name in enumerate(names) if name}
+        except Exception:
+            return None  # 손상·pyarrow 없음 → 다시 파싱
+        # 사용 시각 갱신 (LRU, 목록 파일의 수정 시각)
+        os.utime(manifest)
+        return sheets
+
+    @staticmethod
+    def _write_cache(path, sheets):
+        """시트별 Parquet + 시트 이름 목록 (pyarrow가 없거나 저장할 수 없는 형식이면 건너뜀)"""
+        try:
+            os.makedirs(path, exist_ok=True)
+            for i, df in enumerate(sheets.values()):
+                df.to_parquet(os.path.join(path, f'{i}.parquet'), index=False)
+            with open(os.path.join(path, 'sheets.txt'), 'w', encoding='utf-8') as f:
+                f.write('\n'.join(sheets))
+        except Exception:
+            # 목록 파일이 없는 폴더는 읽지도 정리하지도 않으므로 남기지 않음
+            shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def evict_cache(cache_dir, max_entries=SHEET_CACHE_MAX_ENTRIES, max_bytes=SHEET_CACHE_MAX_BYTES):
+        """
+        시트 캐시 정리: 개수·용량 한도를 넘으면 오래 사용하지 않은 파일(폴더)부터 삭제
+        (cache_dir 안에서 시트 목록 파일이 있는 폴더만 대상)
+        """
+        entries = []
+        for name in os.listdir(cache_dir):
+            path = os.path.join(cache_dir, name)
+            manifest = os.path.join(path, 'sheets.txt')
+            if not os.path.isfile(manifest):
+                continue
+            size = sum(e.stat().st_size for e in os.scandir(path) if e.is_file())
+            entries.append((os.path.getmtime(manifest), size, path))
+
+        entries.sort()  # 오래 사용하지 않은 순
+        total = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > max_entries or total > max_bytes):
+            _, size, path = entries.pop(0)
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
     @staticmethod
     def get_nurse_summary(sheets):
         """간호사 정보 요약"""
@@ -74,7 +241,8 @@ class DataLoader:
                 break
         
         if date_col:
-            dates = pd.to_datetime(df[date_col]).dt.date
+            # 날짜는 근무조마다 반복되므로 고유값만 변환
+            dates = pd.to_datetime(pd.Series(df[date_col].dropna().unique())).dt.date
             return str(dates.min()), str(dates.max())
             
         return "2024-01-01", "2024-01-31"
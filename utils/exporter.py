@@ -0,0 +1,148 @@
+"""
+utils/exporter.py
+근무표 내보내기 (CSV 청크 스트리밍 / Parquet / 가로형 XLSX)
+Streamlit 밖(배치·CLI)에서도 그대로 사용 가능
+"""
+import io
+
+import numpy as np
+import pandas as pd
+
+SHIFTS = np.array(['D', 'E', 'N', 'OFF'])
+# 엑셀 셀 색상 (ScheduleVisualizer 달력과 동일)
+SHIFT_COLORS = {'D': 'FFD700', 'E': 'FF8C00', 'N': '4169E1', 'OFF': 'EEEEEE'}
+
+
+class RosterExporter:
+    """
+    결과(dict 또는 CompactResult) 또는 {병동명: 결과}를 파일로 저장
+    - 긴 형식(Date, Name, Shift [, Ward]): 간호사 chunk_nurses명 단위로 행을 만들어 바로 기록
+    - 가로 형식(간호사 × 날짜): 근무별 색상을 입힌 엑셀 (openpyxl write-only 모드)
+    """
+
+    @staticmethod
+    def _wards(results):
+        """단일 결과면 [(None, 결과)], 병동별 dict면 [(병동명, 결과), ...]"""
+        if hasattr(results, 'matrix') or 'nurses' in results:
+            return [(None, results)]
+        return list(results.items())
+
+    @staticmethod
+    def _columns(result):
+        """결과 → (근무 코드 행렬, 간호사 이름, 날짜)"""
+        if hasattr(result, 'matrix'):
+            return result.matrix, list(result.names), list(result.dates)
+        codes = {s: i for i, s in enumerate(SHIFTS)}
+        nurses, dates = result['nurses'], result['dates']
+        matrix = np.array([[codes[s] for s in n['schedule']] for n in nurses], dtype=np.int8)
+        return matrix.reshape(len(nurses), len(dates)), [n['name'] for n in nurses], [d['date'] for d in dates]
+
+    @staticmethod
+    def iter_chunks(results, chunk_nurses=200):
+        """긴 형식 DataFrame 조각을 간호사 → 날짜 순으로 생성"""
+        for ward, result in RosterExporter._wards(results):
+            matrix, names, dates = RosterExporter._columns(result)
+            dates = np.array(dates, dtype=object)
+            names = np.array(names, dtype=object)
+            for lo in range(0, len(names), chunk_nurses):
+                block = matrix[lo:lo + chunk_nurses]
+                chunk = pd.DataFrame({
+                    'Date': np.tile(dates, len(block)),
+                    'Name': np.repeat(names[lo:lo + chunk_nurses], matrix.shape[1]),
+                    'Shift': SHIFTS[block.ravel()]
+                })
+                if ward is not None:
+                    chunk.insert(0, 'Ward', ward)
+                yield chunk
+
+    @staticmethod
+    def to_csv(results, path_or_buffer=None, chunk_nurses=200, encoding='utf-8-sig'):
+        """
+        CSV로 조각 단위 기록 (path_or_buffer가 없으면 bytes 반환 → st.download_button용)
+        """
+        buffer = io.BytesIO() if path_or_buffer is None else None
+        target = buffer if buffer is not None else path_or_buffer
+        f = open(target, 'wb') if isinstance(target, str) else target
+        try:
+            # BOM은 첫 조각에만 (엑셀에서 한글 깨짐 방지)
+            for i, chunk in enumerate(RosterExporter.iter_chunks(results, chunk_nurses)):
+                text = chunk.to_csv(index=False, header=(i == 0))
+                f.write(text.encode(encoding if i == 0 else encoding.replace('-sig', '')))
+        finally:
+            if isinstance(target, str):
+                f.close()
+        return buffer.getvalue() if buffer is not None else path_or_buffer
+
+    @staticmethod
+    def to_parquet(results, path_or_buffer=None, chunk_nurses=200):
+        """
+        Parquet (Date: date32, Name/Shift/Ward: dictionary 인코딩 문자열)
+        조각마다 row group 하나로 기록 (pyarrow 필요)
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise Exception("Parquet 내보내기에는 pyarrow 패키지가 필요합니다.")
+
+        buffer = io.BytesIO() if path_or_buffer is None else None
+        writer = None
+        try:
+            for chunk in RosterExporter.iter_chunks(results, chunk_nurses):
+                chunk['Date'] = pd.to_datetime(chunk['Date']).dt.date
+                for col in ('Ward', 'Name', 'Shift'):
+                    if col in chunk:
+                        chunk[col] = chunk[col].astype(str)
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                table = table.cast(pa.schema([
+                    pa.field(f.name, pa.date32() if f.name == 'Date' else pa.dictionary(pa.int32(), pa.string()))
+                    for f in table.schema
+                ]))
+                if writer is None:
+                    writer = pq.ParquetWriter(buffer if buffer is not None else path_or_buffer, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return buffer.getvalue() if buffer is not None else path_or_buffer
+
+    @staticmethod
+    def to_xlsx(results, path_or_buffer=None):
+        """
+        가로형 근무표 엑셀 (병동별 시트, 행=간호사, 열=날짜, 근무별 배경색)
+        write-only 모드로 행을 바로 기록해 셀 객체를 메모리에 쌓지 않음
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Font, PatternFill
+
+        fills = {s: PatternFill('solid', start_color=c, end_color=c) for s, c in SHIFT_COLORS.items()}
+        center = Alignment(horizontal='center')
+        bold = Font(bold=True)
+
+        wb = Workbook(write_only=True)
+        for ward, result in RosterExporter._wards(results):
+            matrix, names, dates = RosterExporter._columns(result)
+            ws = wb.create_sheet(title=str(ward or 'Schedule')[:31])
+            ws.freeze_panes = 'B2'
+            ws.column_dimensions['A'].width = 14
+
+            header = [WriteOnlyCell(ws, value='Name')] + [WriteOnlyCell(ws, value=d) for d in dates]
+            for cell in header:
+                cell.font = bold
+                cell.alignment = center
+            ws.append(header)
+
+            labels = SHIFTS.tolist()
+            for name, row in zip(names, matrix.tolist()):
+                cells = [WriteOnlyCell(ws, value=name)]
+                for s in row:
+                    cell = WriteOnlyCell(ws, value=labels[s])
+                    cell.fill = fills[labels[s]]
+                    cell.alignment = center
+                    cells.append(cell)
+                ws.append(cells)
+
+        buffer = io.BytesIO() if path_or_buffer is None else None
+        wb.save(buffer if buffer is not None else path_or_buffer)
+        return buffer.getvalue() if buffer is not None else path_or_buffer
@@ -0,0 +1,85 @@
+"""
+utils/ward_generator.py
+벤치마크·튜닝용 가상 병동 데이터 생성 (업로드 엑셀과 같은 시트 구성)
+"""
+import numpy as np
+import pandas as pd
+
+
+class WardGenerator:
+    """
+    벤치마크·테스트용 가상 병동 데이터 생성
+    - 실제 업로드 엑셀과 같은 Nurse / Requests / Daily_Coverage 시트 구성
+    - seed가 같으면 항상 같은 데이터 (결정적)
+    """
+
+    DEFAULT_LEVEL_MIX = {'Charge': 0.2, 'Regular': 0.6, 'New': 0.2}
+
+    @staticmethod
+    def generate(num_nurses=24, num_days=28, start_date='2026-01-01', level_mix=None,
+                 request_density=0.05, seed=0):
+        """
+        level_mix: Level별 비율 (예: {'Charge': 0.2, 'Regular': 0.6, 'New': 0.2})
+        request_density: 간호사·일 하나당 OFF 신청이 있을 확률
+        """
+        rng = np.random.default_rng(seed)
+        level_mix = level_mix or WardGenerator.DEFAULT_LEVEL_MIX
+        levels = list(level_mix)
+        probs = np.array([level_mix[lv] for lv in levels], dtype=float)
+        probs /= probs.sum()
+
+        # 간호사: 비율대로 Level을 배정하고 Level 순으로 정렬 (책임 → 일반 → 신규)
+        counts = np.floor(probs * num_nurses).astype(int)
+        counts[np.argsort(-probs)[:num_nurses - counts.sum()]] += 1
+        nurse_levels = np.repeat(levels, counts)
+        prefix = {'Charge': '김책임', 'Regular': '이일반', 'New': '박신규'}
+        names = []
+        seen = {}
+        for lv in nurse_levels:
+            seen[lv] = seen.get(lv, 0) + 1
+            names.append(f"{prefix.get(lv, lv)}{seen[lv]:02d}")
+        nurse_ids = [f'N{i + 1:03d}' for i in range(num_nurses)]
+
+        df_nurse = pd.DataFrame({
+            'Nurse_ID': nurse_ids,
+            'Nurse_Name': names,
+            'Level': nurse_levels,
+            'Fix_Shift': pd.Series([None] * num_nurses, dtype=object),
+            'Prev_Month_Night': rng.integers(0, 7, num_nurses),
+            'Accumulated_Off': rng.integers(0, 4, num_nurses),
+        })
+
+        dates = pd.date_range(start_date, periods=num_days).strftime('%Y-%m-%d')
+
+        # OFF 신청: 간호사×일 격자에서 request_density 확률로 추출
+        mask = rng.random((num_nurses, num_days)) < request_density
+        n_idx, d_idx = np.nonzero(mask)
+        k = len(n_idx)
+        df_req = pd.DataFrame({
+            'Req_ID': [f'REQ{i + 1:05d}' for i in range(k)],
+            'Nurse_ID': np.array(nurse_ids, dtype=object)[n_idx],
+            'Request_Date': np.array(dates, dtype=object)[d_idx],
+            'Request_Type': 'OFF',
+            'Priority_Score': rng.integers(1, 11, k),
+            'Reason': '개인 사유',
+            'Status': '대기',
+        })
+
+        # 일별 최소 인원: 병동 규모에 비례
+        min_total = max(2, round(num_nurses / 5))
+        df_cov = pd.DataFrame({
+            'Coverage_Date': np.repeat(np.array(dates, dtype=object), 3),
+            'Shift_Type': np.tile(['D', 'E', 'N'], num_days),
+            'Min_Total': min_total,
+            'Min_Charge': 1,
+        })
+
+        return {'Nurse': df_nurse, 'Requests': df_req, 'Daily_Coverage': df_cov}
+
+    @staticmethod
+    def save(sheets, path):
+        """생성한 병동을 업로드 형식 엑셀로 저장 (튜닝·배치 인스턴스용)"""
+        with pd.ExcelWriter(path) as writer:
+            for name, df in sheets.items():
+                df.to_excel(writer, sheet_name=name, index=False)
+        return path